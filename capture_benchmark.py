@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+화면 캡처 벤치마크
+매 캡처마다 mss 인스턴스를 새로 만드는 기존 방식과
+스레드별 mss 인스턴스 풀을 재사용하는 방식의 초당 캡처 수 비교
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+def grab_with_new_instance(monitor: dict, frames: int) -> float:
+    """기존 방식: 캡처마다 mss 인스턴스 생성 후 초당 캡처 수 반환"""
+    import mss
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        with mss.mss() as sct:
+            sct.grab(monitor)
+    elapsed = time.perf_counter() - start
+    return frames / elapsed
+
+def grab_with_pool(monitor: dict, frames: int) -> float:
+    """풀 방식: ScreenCapture의 스레드별 mss 인스턴스 재사용 후 초당 캡처 수 반환"""
+    from core.screen_capture import ScreenCapture
+
+    capture = ScreenCapture()
+    try:
+        # 첫 캡처는 인스턴스 준비 비용이므로 측정에서 제외
+        capture.capture_region(monitor["left"], monitor["top"], monitor["width"], monitor["height"])
+
+        start = time.perf_counter()
+        for _ in range(frames):
+            capture._get_grabber().grab(monitor)
+        elapsed = time.perf_counter() - start
+        return frames / elapsed
+    finally:
+        capture.close()
+
+def main():
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description="화면 캡처 벤치마크")
+    parser.add_argument("--frames", type=int, default=200, help="측정할 캡처 횟수")
+    parser.add_argument("--width", type=int, default=1920, help="캡처 영역 너비")
+    parser.add_argument("--height", type=int, default=1080, help="캡처 영역 높이")
+    args = parser.parse_args()
+
+    monitor = {"top": 0, "left": 0, "width": args.width, "height": args.height}
+
+    print(f"=== 화면 캡처 벤치마크 ({args.width}x{args.height}, {args.frames}회) ===")
+
+    legacy_rate = grab_with_new_instance(monitor, args.frames)
+    print(f"캡처마다 mss 생성: {legacy_rate:8.1f} grabs/sec")
+
+    pooled_rate = grab_with_pool(monitor, args.frames)
+    print(f"스레드별 mss 재사용: {pooled_rate:8.1f} grabs/sec")
+
+    print(f"개선 비율: {pooled_rate / legacy_rate:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""
+비동기 번역 엔진 모듈
+전용 asyncio 이벤트 루프 스레드에서 동시 요청 수를 제한하며 Gemini 비동기 API 호출
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional, Union
+import numpy as np
+from core.frame import Frame
+from core.translation_engine import TranslationEngine, StreamInterruptedError
+from core.structured_response import GENERATION_CONFIG
+from utils.logger import logger
+
+class AsyncTranslationEngine:
+    """
+    번역 요청을 하나의 이벤트 루프에서 동시에 처리하는 엔진
+    
+    요청마다 스레드를 만들지 않고 전용 루프 스레드의 코루틴으로 실행한다. 동시에 API를
+    호출하는 요청 수는 세마포어로 제한하고, 나머지는 루프 안에서 차례를 기다린다.
+    submit()은 concurrent.futures.Future를 돌려주므로 호출한 쪽은 완료 콜백으로 결과를 받는다.
+    """
+    
+    def __init__(self, engine: TranslationEngine, max_in_flight: int = 2):
+        """
+        Args:
+            engine: 요청 생성, 캐시, 모델 설정을 담당하는 번역 엔진
+            max_in_flight: 동시에 진행할 최대 API 요청 수
+        """
+        self.engine = engine
+        self.max_in_flight = max(1, max_in_flight)
+        self.stats = {"submitted": 0, "completed": 0, "failed": 0, "cancelled": 0}
+        
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        # OCR은 수백 ms 걸리므로 이벤트 루프를 막지 않도록 전용 스레드 하나에서 실행
+        self._ocr_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="TranslationOCR")
+        # 이미지 자르기/축소/인코딩과 캐시 입출력도 루프 밖에서 실행 (스레드 하나라 인코더 상태가 섞이지 않음)
+        self._prepare_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="TranslationPrepare")
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name="TranslationLoop", daemon=True)
+        self._thread.start()
+    
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+    
+    def set_engine(self, engine: TranslationEngine):
+        """번역 엔진 교체 (설정 변경 시, 이미 시작한 요청은 이전 엔진으로 끝까지 진행)"""
+        self.engine = engine
+    
+    def set_max_in_flight(self, max_in_flight: int):
+        """동시 요청 한도 변경 (이후 제출한 요청부터 적용)"""
+        max_in_flight = max(1, max_in_flight)
+        if max_in_flight != self.max_in_flight:
+            self.max_in_flight = max_in_flight
+            self._semaphore = asyncio.Semaphore(max_in_flight)
+    
+    @property
+    def pending_count(self) -> int:
+        """완료되지 않은 요청 수 (대기 중 + 진행 중)"""
+        with self._lock:
+            return len(self._pending)
+    
+    def submit(self, image: Union[Frame, np.ndarray], prompt: str = None,
+               on_partial: Optional[Callable[[str], None]] = None) -> Future:
+        """
+        번역 요청 제출
+        
+        엔진에 OCR이 설정되어 있고 사용자 정의 프롬프트가 없으면 먼저 글자를 인식해
+        텍스트로 번역하고, 인식 신뢰도가 낮으면 이미지를 보낸다.
+        
+        Args:
+            image: 번역할 이미지 (요청이 끝날 때까지 내용이 바뀌지 않아야 함)
+            prompt: 사용자 정의 프롬프트 (선택사항)
+            on_partial: 지정하면 스트리밍으로 요청하고 응답 조각마다 이벤트 루프 스레드에서 호출
+        
+        Returns:
+            번역 결과를 담을 Future (API 오류는 예외로 전달)
+            - 결과: {"text": 번역문, "blocks": 구조화 응답이나 OCR 줄로 만든 블록 목록 또는 None} 또는 None
+        """
+        return self._submit(self._translate(self.engine, self._semaphore, image, prompt, on_partial))
+    
+    def submit_text(self, text: str, prompt: str = None,
+                    on_partial: Optional[Callable[[str], None]] = None) -> Future:
+        """텍스트 번역 요청 제출 (인자와 반환값은 submit()과 같음)"""
+        return self._submit(self._translate_text(self.engine, self._semaphore, text, prompt, on_partial))
+    
+    def _submit(self, coroutine) -> Future:
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+        with self._lock:
+            self._pending.add(future)
+            self.stats["submitted"] += 1
+        future.add_done_callback(self._on_done)
+        return future
+    
+    async def _translate(self, engine: TranslationEngine, semaphore: asyncio.Semaphore,
+                         image: Union[Frame, np.ndarray], prompt: Optional[str],
+                         on_partial: Optional[Callable[[str], None]]) -> Optional[dict]:
+        # OCR은 API 동시 요청 한도와 관계없이 세마포어를 잡기 전에 실행
+        ocr = None
+        if engine.ocr_engine is not None and prompt is None:
+            ocr = await self._loop.run_in_executor(self._ocr_executor, engine.recognize_text, image)
+        if ocr is not None:
+            return await self._translate_text(engine, semaphore, ocr["text"], None, on_partial, ocr)
+        
+        structured = engine.structured_output and prompt is None
+        region = {}
+        
+        def prepare():
+            request = engine.prepare_request(image, prompt)
+            # 블록 위치 변환용 업로드 영역은 같은 작업 안에서 인코딩 직후에 기록 (이후에는 다른 요청 값일 수 있음)
+            region["value"] = engine.upload_region()
+            return request
+        
+        text = await self._request(engine, semaphore, prepare, on_partial, structured)
+        return engine.make_result(text, structured, region.get("value"))
+    
+    async def _translate_text(self, engine: TranslationEngine, semaphore: asyncio.Semaphore, text: str,
+                              prompt: Optional[str], on_partial: Optional[Callable[[str], None]],
+                              ocr: Optional[dict] = None) -> Optional[dict]:
+        if engine.translation_memory is not None and prompt is None:
+            translated_text = await self._translate_lines(engine, semaphore, text, on_partial)
+        else:
+            translated_text = await self._request(engine, semaphore,
+                                                  lambda: engine.prepare_text_request(text, prompt), on_partial)
+        return engine.make_result(translated_text, ocr=ocr)
+    
+    async def _request(self, engine: TranslationEngine, semaphore: asyncio.Semaphore, prepare: Callable,
+                       on_partial: Optional[Callable[[str], None]], structured: bool = False) -> Optional[str]:
+        async with semaphore:
+            contents, tokens, cache_key, cached_text = await self._prepare(engine, prepare)
+            if cached_text is not None:
+                return cached_text
+            return await self._finish(engine, await self._call(engine, contents, tokens, on_partial, structured),
+                                      cache_key, structured)
+    
+    async def _prepare(self, engine: TranslationEngine, prepare: Callable):
+        """요청 생성과 캐시 조회를 준비 스레드에서 실행, (contents, 예상 토큰 수, cache_key, 캐시된 결과) 반환"""
+        def run():
+            contents, cache_key = prepare()
+            # 토큰 수는 인코더 통계를 쓰므로 같은 작업 안에서 인코딩 직후에 계산 (이후에는 다른 요청 값일 수 있음)
+            return contents, engine.estimate_tokens(contents), cache_key, engine.cached_result(cache_key)
+        return await self._loop.run_in_executor(self._prepare_executor, run)
+    
+    async def _finish(self, engine: TranslationEngine, text: Optional[str], cache_key: Optional[str],
+                      structured: bool = False) -> Optional[str]:
+        """응답 정리와 캐시 저장을 준비 스레드에서 실행"""
+        return await self._loop.run_in_executor(self._prepare_executor, engine.finish_response,
+                                                text, cache_key, structured)
+    
+    async def _translate_lines(self, engine: TranslationEngine, semaphore: asyncio.Semaphore, text: str,
+                               on_partial: Optional[Callable[[str], None]]) -> Optional[str]:
+        """TranslationEngine._translate_lines()의 비동기 버전 (메모리에 없는 줄만 요청)"""
+        async with semaphore:
+            contents, tokens, cache_key, cached_text = await self._prepare(engine,
+                                                                           lambda: engine.prepare_text_request(text))
+            if cached_text is not None:
+                return cached_text
+            
+            plan = engine.translation_memory.plan(text, engine.target_language, engine.model_name)
+            if plan["missing"]:
+                logger.debug(f"번역 메모리 - 새 줄 {len(plan['missing'])}개만 요청 (기존 {len(plan['translations'])}개)")
+                lines_contents = engine.prepare_lines_request(plan)
+                response_text = await self._call(engine, lines_contents, engine.estimate_tokens(lines_contents), None)
+                if not engine.translation_memory.merge(plan, response_text):
+                    logger.warning("줄 번역 응답 형식 불일치 - 전체 텍스트로 다시 번역")
+                    return await self._finish(engine, await self._call(engine, contents, tokens, on_partial), cache_key)
+            return await self._finish(engine, engine.translation_memory.assemble(plan), cache_key)
+    
+    async def _call(self, engine: TranslationEngine, contents: list, tokens: int,
+                    on_partial: Optional[Callable[[str], None]], structured: bool = False) -> str:
+        """
+        API 호출 (스케줄러가 있으면 한도 대기 및 일시적 오류 재시도, 대기 중에도 세마포어는 유지)
+        
+        tokens는 요청을 만든 작업에서 계산한 예상 입력 토큰 수 (스케줄러 분당 토큰 한도에 사용).
+        
+        구조화 요청은 JSON 조각을 보여줄 수 없으므로 스트리밍하지 않는다.
+        """
+        if structured:
+            async def call():
+                response = await engine.model.generate_content_async(contents, generation_config=GENERATION_CONFIG)
+                return response.text
+        elif on_partial is None:
+            async def call():
+                response = await engine.model.generate_content_async(contents)
+                return response.text
+        else:
+            async def call():
+                return await self._stream_text(engine, contents, on_partial)
+        
+        if engine.scheduler is not None:
+            return await engine.scheduler.run(engine.model_name, tokens, call)
+        return await call()
+    
+    async def _stream_text(self, engine: TranslationEngine, contents: list,
+                           on_partial: Callable[[str], None]) -> str:
+        """스트리밍으로 요청하고 조각마다 on_partial 호출, 전체 텍스트 반환"""
+        chunks = []
+        try:
+            response = await engine.model.generate_content_async(contents, stream=True)
+            async for chunk in response:
+                text = engine.chunk_text(chunk)
+                if text:
+                    chunks.append(text)
+                    on_partial(text)
+        except Exception as e:
+            if chunks:
+                raise StreamInterruptedError(f"스트리밍 응답 중단: {e}") from e
+            raise
+        return "".join(chunks)
+    
+    def _on_done(self, future: Future):
+        with self._lock:
+            self._pending.discard(future)
+            if future.cancelled():
+                self.stats["cancelled"] += 1
+            elif future.exception() is not None:
+                self.stats["failed"] += 1
+            else:
+                self.stats["completed"] += 1
+    
+    def cancel_all(self) -> int:
+        """완료되지 않은 모든 요청 취소, 취소한 요청 수 반환"""
+        with self._lock:
+            pending = list(self._pending)
+        return sum(1 for future in pending if future.cancel())
+    
+    def shutdown(self, timeout: float = 3.0):
+        """남은 요청을 취소하고 이벤트 루프 스레드 종료"""
+        cancelled = self.cancel_all()
+        if cancelled:
+            logger.info(f"진행 중인 번역 요청 {cancelled}개 취소")
+        if self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+        self._ocr_executor.shutdown(wait=False, cancel_futures=True)
+        self._prepare_executor.shutdown(wait=False, cancel_futures=True)
+        if self._thread.is_alive():
+            logger.warning("번역 이벤트 루프 스레드가 제때 종료되지 않음")
+    
+    def get_stats(self) -> dict:
+        """요청 처리 통계 반환"""
+        with self._lock:
+            stats = dict(self.stats)
+            stats["pending"] = len(self._pending)
+        stats["max_in_flight"] = self.max_in_flight
+        return stats
@@ -0,0 +1,175 @@
+"""
+백그라운드 캡처 서비스 모듈
+별도 스레드에서 화면을 캡처하여 미리 할당한 링 버퍼에 기록
+"""
+
+import threading
+import numpy as np
+from typing import Optional, Tuple
+from core.frame import Frame
+from core.frame_source import FrameSource
+from utils.logger import logger
+
+class CaptureService(threading.Thread):
+    """
+    백그라운드 캡처 스레드
+    
+    프레임은 미리 할당한 BGRA 버퍼 링에 기록되며 소비자는 가장 최근에 완성된
+    프레임만 읽는다. 소비자가 마지막으로 받아 간 슬롯과 최신 슬롯은 덮어쓰지 않으므로
+    단일 소비자(GUI 스레드)는 다음 get_latest_frame() 호출 전까지 받은 프레임을
+    안전하게 사용할 수 있다. 그보다 오래 보관해야 하면 frame.copy()를 사용한다.
+    """
+    
+    MIN_RING_SIZE = 3  # 최신 슬롯 + 소비자 슬롯 + 쓰기 슬롯
+    
+    def __init__(self, source: FrameSource, interval: float = 0.25, ring_size: int = 3):
+        """
+        Args:
+            source: 프레임을 읽어 올 소스 (실시간 화면, 녹화 세션 등)
+            interval: 캡처 간격 (초)
+            ring_size: 링 버퍼 슬롯 수 (최소 3)
+        """
+        super().__init__(name="CaptureService", daemon=True)
+        self.source = source
+        self.interval = interval
+        self.ring_size = max(self.MIN_RING_SIZE, ring_size)
+        
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._paused = False
+        
+        self._region = None
+        self._generation = 0
+        self._buffers = None
+        self._timestamps = [0.0] * self.ring_size
+        self._latest_index = -1
+        self._reader_index = -1
+        self._write_index = 0
+        self._sequence = 0
+        self._reader_sequence = 0
+    
+    def set_region(self, region: Optional[Tuple[int, int, int, int]]):
+        """
+        캡처 영역 설정 (x, y, width, height)
+        
+        이전 영역에서 캡처한 프레임은 버린다. 링 버퍼는 첫 프레임의 크기에 맞춰
+        할당되며 프레임 크기가 바뀔 때만 다시 할당된다.
+        """
+        with self._lock:
+            if region == self._region:
+                return
+            
+            self._region = region
+            self.source.set_region(region)
+            
+            # 영역이 바뀌면 이전 위치의 프레임은 더 이상 유효하지 않음
+            # (소비자 슬롯은 받아 간 프레임을 아직 쓰고 있을 수 있으므로 다음 get_latest_frame() 호출까지 보호)
+            self._generation += 1
+            self._latest_index = -1
+    
+    def set_interval(self, interval: float):
+        """캡처 간격 설정 (초)"""
+        self.interval = max(0.01, interval)
+    
+    def set_paused(self, paused: bool):
+        """캡처 일시 중지/재개"""
+        self._paused = paused
+        logger.debug(f"캡처 서비스 {'일시 중지' if paused else '재개'}")
+    
+    @property
+    def latest_sequence(self) -> int:
+        """가장 최근에 완성된 프레임의 일련번호 (0이면 아직 없음)"""
+        return self._sequence
+    
+    def has_new_frame(self) -> bool:
+        """소비자가 마지막으로 읽은 이후 새 프레임이 있는지 확인"""
+        return self._latest_index >= 0 and self._sequence != self._reader_sequence
+    
+    def get_latest_frame(self) -> Optional[Frame]:
+        """
+        가장 최근에 완성된 프레임 반환
+        
+        Returns:
+            링 버퍼 슬롯 위의 프레임 (다음 호출 전까지 유효) 또는 None
+        """
+        with self._lock:
+            if self._latest_index < 0 or self._buffers is None:
+                return None
+            
+            index = self._latest_index
+            self._reader_index = index
+            self._reader_sequence = self._sequence
+            return Frame(self._buffers[index], self._timestamps[index])
+    
+    def _next_write_index(self) -> int:
+        """최신 슬롯과 소비자 슬롯을 피해 다음 쓰기 슬롯 선택 (_lock 보유 상태에서 호출)"""
+        index = self._write_index
+        for _ in range(self.ring_size):
+            index = (index + 1) % self.ring_size
+            if index != self._latest_index and index != self._reader_index:
+                return index
+        return index
+    
+    def _ensure_buffers(self, shape: tuple):
+        """프레임 크기에 맞는 링 버퍼 준비 (_lock 보유 상태에서 호출)"""
+        if self._buffers is not None and self._buffers.shape[1:] == shape:
+            return
+        self._buffers = np.empty((self.ring_size,) + shape, dtype=np.uint8)
+        self._latest_index = -1
+        self._reader_index = -1
+        logger.debug(f"캡처 링 버퍼 할당: {self.ring_size} x {shape[1]}x{shape[0]}")
+    
+    def capture_once(self) -> bool:
+        """
+        소스에서 프레임을 한 번 읽어 링 버퍼에 기록
+        
+        Returns:
+            프레임을 기록했으면 True
+        """
+        with self._lock:
+            generation = self._generation
+        
+        frame = self.source.read()
+        if frame is None:
+            return False
+        
+        with self._lock:
+            # 읽는 동안 영역이 바뀌었으면 결과를 버림
+            if generation != self._generation:
+                return False
+            self._ensure_buffers(frame.bgra.shape)
+            index = self._next_write_index()
+            self._write_index = index
+            buffers = self._buffers
+        
+        # 쓰기 슬롯은 소비자에게 공개되지 않았으므로 잠금 없이 복사
+        np.copyto(buffers[index], frame.bgra)
+        
+        with self._lock:
+            if generation != self._generation or buffers is not self._buffers:
+                return False
+            self._timestamps[index] = frame.timestamp
+            self._latest_index = index
+            self._sequence += 1
+        return True
+    
+    def run(self):
+        """캡처 루프"""
+        logger.info(f"캡처 서비스 시작 - 간격: {self.interval * 1000:.0f}ms, 링 크기: {self.ring_size}")
+        while not self._stop_event.is_set():
+            if not self._paused:
+                try:
+                    self.capture_once()
+                except Exception as e:
+                    logger.error(f"캡처 서비스 오류: {e}")
+                if self.source.is_exhausted():
+                    logger.info("프레임 소스 재생 완료")
+                    break
+            self._stop_event.wait(self.interval)
+        logger.info("캡처 서비스 종료")
+    
+    def stop(self, timeout: float = 2.0):
+        """캡처 루프 종료 및 스레드 대기"""
+        self._stop_event.set()
+        if self.is_alive():
+            self.join(timeout)
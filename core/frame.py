@@ -0,0 +1,106 @@
+"""
+캡처 프레임 모듈
+mss 버퍼를 복사 없이 감싸고 필요한 표현(RGB, 그레이스케일, PIL)을 지연 생성
+"""
+
+import time
+import cv2
+import numpy as np
+from PIL import Image
+from typing import Optional, Union
+
+class Frame:
+    """BGRA 원본과 지연 변환된 표현을 함께 보관하는 프레임 클래스"""
+    
+    def __init__(self, bgra: np.ndarray, timestamp: Optional[float] = None):
+        """
+        Args:
+            bgra: (height, width, 4) 형태의 BGRA 이미지 (mss 버퍼 뷰 가능)
+            timestamp: 캡처 시각 (기본값: 현재 시각)
+        """
+        self.bgra = bgra
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self._rgb = None
+        self._gray = None
+    
+    @classmethod
+    def from_screenshot(cls, screenshot, timestamp: Optional[float] = None) -> "Frame":
+        """mss 스크린샷 버퍼 위에 복사 없이 프레임 생성"""
+        width, height = screenshot.size
+        bgra = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(height, width, 4)
+        return cls(bgra, timestamp)
+    
+    @classmethod
+    def from_rgb(cls, rgb: np.ndarray, timestamp: Optional[float] = None) -> "Frame":
+        """RGB 배열로부터 프레임 생성 (RGB 표현은 그대로 재사용)"""
+        if rgb.dtype != np.uint8:
+            rgb = rgb.astype(np.uint8)
+        frame = cls(cv2.cvtColor(rgb, cv2.COLOR_RGB2BGRA), timestamp)
+        frame._rgb = rgb
+        return frame
+    
+    @property
+    def width(self) -> int:
+        return self.bgra.shape[1]
+    
+    @property
+    def height(self) -> int:
+        return self.bgra.shape[0]
+    
+    @property
+    def shape(self) -> tuple:
+        """RGB 기준 형태 (height, width, 3)"""
+        return (self.height, self.width, 3)
+    
+    @property
+    def rgb(self) -> np.ndarray:
+        """RGB 배열 (처음 요청될 때 한 번만 변환)"""
+        if self._rgb is None:
+            self._rgb = cv2.cvtColor(self.bgra, cv2.COLOR_BGRA2RGB)
+        return self._rgb
+    
+    @property
+    def gray(self) -> np.ndarray:
+        """그레이스케일 배열 (처음 요청될 때 한 번만 변환)"""
+        if self._gray is None:
+            self._gray = cv2.cvtColor(self.bgra, cv2.COLOR_BGRA2GRAY)
+        return self._gray
+    
+    def to_pil(self) -> Image.Image:
+        """PIL Image로 변환 (RGB 배열이 없으면 BGRA 버퍼에서 바로 디코딩)"""
+        if self._rgb is not None:
+            return Image.fromarray(self._rgb)
+        return Image.frombuffer("RGB", (self.width, self.height),
+                                np.ascontiguousarray(self.bgra), "raw", "BGRX", 0, 1)
+    
+    def crop(self, x: int, y: int, width: int, height: int) -> "Frame":
+        """영역을 잘라낸 프레임 반환 (배열 뷰이므로 복사 없음)"""
+        cropped = Frame(self.bgra[y:y + height, x:x + width], self.timestamp)
+        if self._rgb is not None:
+            cropped._rgb = self._rgb[y:y + height, x:x + width]
+        if self._gray is not None:
+            cropped._gray = self._gray[y:y + height, x:x + width]
+        return cropped
+    
+    def copy(self) -> "Frame":
+        """버퍼를 소유하는 독립적인 프레임 반환"""
+        copied = Frame(self.bgra.copy(), self.timestamp)
+        if self._rgb is not None:
+            copied._rgb = self._rgb.copy()
+        if self._gray is not None:
+            copied._gray = self._gray.copy()
+        return copied
+
+def to_rgb_array(image: Union[Frame, np.ndarray]) -> np.ndarray:
+    """프레임 또는 RGB 배열을 RGB 배열로 반환"""
+    if isinstance(image, Frame):
+        return image.rgb
+    return image
+
+def to_gray_array(image: Union[Frame, np.ndarray]) -> np.ndarray:
+    """프레임 또는 RGB/그레이스케일 배열을 그레이스케일 배열로 반환"""
+    if isinstance(image, Frame):
+        return image.gray
+    if image.ndim == 2:
+        return image
+    return cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
@@ -0,0 +1,303 @@
+"""
+프레임 소스 모듈
+실시간 화면 캡처, 녹화된 세션, 이미지/동영상 파일을 같은 인터페이스로 제공
+"""
+
+import time
+import cv2
+import numpy as np
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+from core.frame import Frame
+from core.screen_capture import ScreenCapture
+from utils.logger import logger
+
+class FrameSource:
+    """프레임 소스 기본 클래스"""
+    
+    # 실시간 화면 소스 여부 (영역 변경, 출력창 숨김 처리가 의미 있는지)
+    is_live = False
+    
+    def read(self) -> Optional[Frame]:
+        """
+        다음 프레임 반환
+        
+        Returns:
+            프레임 또는 None (캡처 실패 또는 소스 끝)
+        """
+        raise NotImplementedError
+    
+    def set_region(self, region: Optional[Tuple[int, int, int, int]]):
+        """캡처 영역 설정 (실시간 소스만 사용)"""
+        pass
+    
+    def is_exhausted(self) -> bool:
+        """더 읽을 프레임이 없는지 확인"""
+        return False
+    
+    def close(self):
+        """리소스 정리"""
+        pass
+    
+    def __iter__(self) -> Iterator[Frame]:
+        """소스가 끝날 때까지 프레임 순회"""
+        while not self.is_exhausted():
+            frame = self.read()
+            if frame is None:
+                if self.is_exhausted():
+                    break
+                continue
+            yield frame
+
+class LiveFrameSource(FrameSource):
+    """mss 기반 실시간 화면 소스"""
+    
+    is_live = True
+    
+    def __init__(self, screen_capture: ScreenCapture, region: Optional[Tuple[int, int, int, int]] = None):
+        """
+        Args:
+            screen_capture: 화면 캡처 모듈 (소유권은 호출자에게 있음)
+            region: 캡처 영역 (x, y, width, height)
+        """
+        self.screen_capture = screen_capture
+        self.region = region
+    
+    def set_region(self, region: Optional[Tuple[int, int, int, int]]):
+        self.region = region
+    
+    def read(self) -> Optional[Frame]:
+        region = self.region
+        if region is None:
+            return None
+        return self.screen_capture.capture_window_frame(region)
+
+class RecordedFrameSource(FrameSource):
+    """
+    녹화된 세션 소스
+    
+    <base>.frames.npy (N, H, W, 4) BGRA 프레임을 메모리 맵으로 열고
+    <base>.timestamps.npy 의 캡처 시각과 함께 재생한다.
+    """
+    
+    def __init__(self, base_path: str, realtime: bool = False, loop: bool = False):
+        """
+        Args:
+            base_path: 세션 경로 (확장자 제외)
+            realtime: True면 녹화 당시 간격대로, False면 최대 속도로 재생
+            loop: 끝까지 재생하면 처음부터 반복
+        """
+        self.base_path = Path(base_path)
+        self.realtime = realtime
+        self.loop = loop
+        
+        self.timestamps = np.load(f"{self.base_path}.timestamps.npy")
+        frames = np.load(f"{self.base_path}.frames.npy", mmap_mode="r")
+        self.frames = frames[:len(self.timestamps)]
+        self.position = 0
+        self._replay_start = None
+        
+        logger.info(f"녹화 세션 로드: {self.base_path} ({len(self.frames)} 프레임)")
+    
+    def __len__(self) -> int:
+        return len(self.frames)
+    
+    def is_exhausted(self) -> bool:
+        return not self.loop and self.position >= len(self.frames)
+    
+    def rewind(self):
+        """처음부터 다시 재생"""
+        self.position = 0
+        self._replay_start = None
+    
+    def read(self) -> Optional[Frame]:
+        if len(self.frames) == 0:
+            return None
+        if self.position >= len(self.frames):
+            if not self.loop:
+                return None
+            self.rewind()
+        
+        index = self.position
+        timestamp = float(self.timestamps[index])
+        
+        if self.realtime:
+            if self._replay_start is None or index == 0:
+                self._replay_start = time.perf_counter() - (timestamp - self.timestamps[0])
+            delay = self._replay_start + (timestamp - self.timestamps[0]) - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        
+        self.position += 1
+        # 메모리 맵 위의 읽기 전용 뷰 (디스크에서 필요한 페이지만 읽힘)
+        return Frame(self.frames[index], timestamp)
+
+class ImageFrameSource(FrameSource):
+    """이미지 디렉터리 또는 동영상 파일 소스"""
+    
+    IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".webp")
+    
+    def __init__(self, path: str, fps: float = 4.0, loop: bool = False):
+        """
+        Args:
+            path: 이미지 디렉터리 또는 동영상 파일 경로
+            fps: 이미지 디렉터리의 가상 프레임 속도 (타임스탬프 계산용)
+            loop: 끝까지 재생하면 처음부터 반복
+        """
+        self.path = Path(path)
+        self.fps = fps
+        self.loop = loop
+        self.position = 0
+        self._exhausted = False
+        self._video = None
+        self._images: List[Path] = []
+        
+        if self.path.is_dir():
+            self._images = sorted(p for p in self.path.iterdir()
+                                  if p.suffix.lower() in self.IMAGE_EXTENSIONS)
+            logger.info(f"이미지 디렉터리 로드: {self.path} ({len(self._images)}장)")
+        else:
+            self._video = cv2.VideoCapture(str(self.path))
+            if not self._video.isOpened():
+                raise ValueError(f"동영상을 열 수 없습니다: {self.path}")
+            logger.info(f"동영상 로드: {self.path}")
+    
+    def is_exhausted(self) -> bool:
+        return self._exhausted
+    
+    def read(self) -> Optional[Frame]:
+        if self._video is not None:
+            return self._read_video()
+        return self._read_image()
+    
+    def _read_image(self) -> Optional[Frame]:
+        if not self._images:
+            self._exhausted = True
+            return None
+        if self.position >= len(self._images):
+            if not self.loop:
+                self._exhausted = True
+                return None
+            self.position = 0
+        
+        image_path = self._images[self.position]
+        timestamp = self.position / self.fps
+        self.position += 1
+        
+        image = cv2.imread(str(image_path), cv2.IMREAD_UNCHANGED)
+        if image is None:
+            logger.warning(f"이미지를 읽을 수 없음: {image_path}")
+            return None
+        return Frame(_to_bgra(image), timestamp)
+    
+    def _read_video(self) -> Optional[Frame]:
+        ok, image = self._video.read()
+        if not ok and self.loop:
+            self._video.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ok, image = self._video.read()
+        if not ok:
+            self._exhausted = True
+            return None
+        
+        timestamp = self._video.get(cv2.CAP_PROP_POS_MSEC) / 1000
+        self.position += 1
+        return Frame(_to_bgra(image), timestamp)
+    
+    def close(self):
+        if self._video is not None:
+            self._video.release()
+            self._video = None
+
+class FrameRecorder:
+    """
+    프레임 세션 녹화기
+    
+    프레임을 <base>.frames.npy 에 순서대로 이어 쓰고 종료 시 헤더의 프레임 수와
+    <base>.timestamps.npy 를 기록한다. 결과는 RecordedFrameSource로 재생할 수 있다.
+    """
+    
+    HEADER_SIZE = 128  # 프레임 수가 바뀌어도 데이터 위치가 고정되도록 헤더 크기 고정
+    
+    def __init__(self, base_path: str):
+        """
+        Args:
+            base_path: 세션 경로 (확장자 제외)
+        """
+        self.base_path = Path(base_path)
+        self.base_path.parent.mkdir(parents=True, exist_ok=True)
+        self.frame_shape = None
+        self.timestamps: List[float] = []
+        self._file = open(f"{self.base_path}.frames.npy", "wb")
+        self._file.write(self._make_header((0, 0, 0, 4)))
+    
+    def _make_header(self, shape: tuple) -> bytes:
+        """고정 길이 .npy v1.0 헤더 생성"""
+        header = "{'descr': '|u1', 'fortran_order': False, 'shape': %s, }" % repr(tuple(shape))
+        padding = self.HEADER_SIZE - len(np.lib.format.MAGIC_PREFIX) - 2 - 2 - len(header) - 1
+        if padding < 0:
+            raise ValueError(f"프레임 형태가 너무 깁니다: {shape}")
+        header = header + " " * padding + "\n"
+        return (np.lib.format.MAGIC_PREFIX + bytes([1, 0])
+                + len(header).to_bytes(2, "little") + header.encode("latin1"))
+    
+    def write(self, frame: Frame) -> bool:
+        """
+        프레임 기록
+        
+        Returns:
+            기록했으면 True (첫 프레임과 크기가 다르면 False)
+        """
+        if self._file is None:
+            raise RuntimeError("이미 종료된 녹화기입니다")
+        
+        if self.frame_shape is None:
+            self.frame_shape = frame.bgra.shape
+        elif frame.bgra.shape != self.frame_shape:
+            logger.warning(f"프레임 크기 불일치 - 녹화 건너뜀: {frame.bgra.shape} != {self.frame_shape}")
+            return False
+        
+        self._file.write(np.ascontiguousarray(frame.bgra).tobytes())
+        self.timestamps.append(frame.timestamp)
+        return True
+    
+    def close(self):
+        """헤더와 타임스탬프를 기록하고 파일 닫기"""
+        if self._file is None:
+            return
+        
+        height, width = self.frame_shape[:2] if self.frame_shape else (0, 0)
+        self._file.seek(0)
+        self._file.write(self._make_header((len(self.timestamps), height, width, 4)))
+        self._file.close()
+        self._file = None
+        
+        np.save(f"{self.base_path}.timestamps.npy", np.asarray(self.timestamps, dtype=np.float64))
+        logger.info(f"세션 녹화 완료: {self.base_path} ({len(self.timestamps)} 프레임)")
+
+def _to_bgra(image: np.ndarray) -> np.ndarray:
+    """OpenCV로 읽은 이미지를 BGRA로 변환"""
+    if image.ndim == 2:
+        return cv2.cvtColor(image, cv2.COLOR_GRAY2BGRA)
+    if image.shape[2] == 3:
+        return cv2.cvtColor(image, cv2.COLOR_BGR2BGRA)
+    return image
+
+def create_frame_source(config: dict, screen_capture: ScreenCapture) -> FrameSource:
+    """
+    설정에 맞는 프레임 소스 생성
+    
+    Args:
+        config: 전체 설정 (capture.source, capture.source_path 사용)
+        screen_capture: 실시간 소스에서 사용할 화면 캡처 모듈
+    """
+    capture_config = config.get("capture", {})
+    source_type = capture_config.get("source", "live")
+    source_path = capture_config.get("source_path", "")
+    
+    if source_type == "replay" and source_path:
+        return RecordedFrameSource(source_path, realtime=True, loop=True)
+    if source_type == "images" and source_path:
+        return ImageFrameSource(source_path, loop=True)
+    if source_type != "live":
+        logger.warning(f"알 수 없는 프레임 소스 또는 경로 없음: {source_type} - 실시간 캡처 사용")
+    return LiveFrameSource(screen_capture)
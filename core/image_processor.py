@@ -4,20 +4,235 @@ OpenCV를 사용한 이미지 비교 및 변화 감지
 """
 
 import cv2
+import hashlib
 import numpy as np
-from typing import Optional, Tuple
-from skimage.metrics import structural_similarity as ssim
+from typing import Optional, Tuple, Union
+from core.frame import Frame, to_gray_array
+from core.ssim import structural_similarity
+
+def compute_tile_stats(gray: np.ndarray, tile_size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    그레이스케일 이미지의 타일별 평균과 표준편차 계산
+    
+    Args:
+        gray: 그레이스케일 이미지
+        tile_size: 타일 한 변의 크기 (픽셀)
+    
+    Returns:
+        (평균, 표준편차) - 각각 (타일 행 수, 타일 열 수) 형태의 float32 배열
+    """
+    tiles = tile_view(gray, tile_size)
+    rows, cols = tiles.shape[0], tiles.shape[2]
+    values = tiles.reshape(rows * tile_size, cols * tile_size).astype(np.float32)
+    
+    # 정수 배율 영역 평균 축소로 E[x], E[x^2]를 구한 뒤 분산 계산
+    means = cv2.resize(values, (cols, rows), interpolation=cv2.INTER_AREA)
+    squares = cv2.resize(cv2.multiply(values, values), (cols, rows), interpolation=cv2.INTER_AREA)
+    stds = np.sqrt(np.maximum(squares - means * means, 0.0))
+    return means.reshape(rows, cols), stds.reshape(rows, cols)
+
+def tile_view(gray: np.ndarray, tile_size: int) -> np.ndarray:
+    """
+    그레이스케일 이미지를 (타일 행, 타일 크기, 타일 열, 타일 크기) 형태로 재구성
+    
+    가장자리가 타일 크기로 나누어떨어지지 않으면 가장자리 픽셀을 복제해 채운다.
+    """
+    height, width = gray.shape[:2]
+    pad_bottom = -height % tile_size
+    pad_right = -width % tile_size
+    if pad_bottom or pad_right:
+        gray = cv2.copyMakeBorder(gray, 0, pad_bottom, 0, pad_right, cv2.BORDER_REPLICATE)
+    rows = gray.shape[0] // tile_size
+    cols = gray.shape[1] // tile_size
+    return gray.reshape(rows, tile_size, cols, tile_size)
+
+def summarize_change_tiles(tiles: np.ndarray, tile_size: int, height: int, width: int) -> dict:
+    """
+    변경 타일 배열로 변화 맵 생성
+    
+    Args:
+        tiles: 변경된 타일 여부 (타일 행 수, 타일 열 수) bool 배열
+        tile_size: 타일 한 변의 크기 (픽셀)
+        height, width: 원본 이미지 크기
+    
+    Returns:
+        변화 맵 (ImageProcessor.compute_change_map 참고)
+    """
+    changed_tiles = int(np.count_nonzero(tiles))
+    bbox = None
+    changed_area = 0
+    if changed_tiles:
+        rows = np.flatnonzero(tiles.any(axis=1))
+        cols = np.flatnonzero(tiles.any(axis=0))
+        x0 = int(cols[0]) * tile_size
+        y0 = int(rows[0]) * tile_size
+        x1 = min(width, (int(cols[-1]) + 1) * tile_size)
+        y1 = min(height, (int(rows[-1]) + 1) * tile_size)
+        bbox = (x0, y0, x1 - x0, y1 - y0)
+        
+        # 가장자리 타일은 이미지 밖으로 나간 부분을 제외하고 면적 계산
+        tile_heights = np.minimum(tile_size, height - np.arange(tiles.shape[0]) * tile_size)
+        tile_widths = np.minimum(tile_size, width - np.arange(tiles.shape[1]) * tile_size)
+        changed_area = int((np.outer(tile_heights, tile_widths) * tiles).sum())
+    
+    return {
+        "tiles": tiles,
+        "changed_tiles": changed_tiles,
+        "changed_fraction": changed_area / float(height * width),
+        "bbox": bbox,
+        "tile_size": tile_size,
+        "shape": (height, width)
+    }
+
+def merge_change_maps(map1: Optional[dict], map2: Optional[dict]) -> Optional[dict]:
+    """
+    연속된 두 변화 맵을 합침 (두 구간 중 한 번이라도 바뀐 타일을 변경으로 표시)
+    
+    어느 한쪽이 None이거나 이미지 크기가 다르면 전체가 바뀐 것으로 보고 None 반환
+    """
+    if map1 is None or map2 is None or map1["shape"] != map2["shape"] \
+            or map1["tile_size"] != map2["tile_size"]:
+        return None
+    height, width = map1["shape"]
+    return summarize_change_tiles(map1["tiles"] | map2["tiles"], map1["tile_size"], height, width)
+
+def estimate_vertical_shift(previous: np.ndarray, current: np.ndarray, max_diff: float = 0.5,
+                            max_diff_ratio: float = 0.25, min_overlap: float = 0.3,
+                            profile_width: int = 32, max_candidates: int = 4) -> Optional[int]:
+    """
+    두 그레이스케일 이미지 사이의 세로 스크롤 양 추정
+    
+    열 방향으로 축소한 행 프로필을 가능한 모든 이동량에서 비교해 차이가 극소인 이동량 후보를
+    구한 뒤, 원본 해상도에서 겹치는 영역의 평균 절대 차이로 검증해 가장 잘 맞는 후보를 고른다.
+    줄 간격이 일정한 텍스트는 줄 간격의 배수만큼 어긋난 위치에서도 프로필 차이가 작으므로
+    후보를 여러 개 검증하며, 이동하지 않은 상태의 차이보다 충분히 작아야 스크롤로 인정한다.
+    
+    Args:
+        previous: 이전 그레이스케일 이미지
+        current: 현재 그레이스케일 이미지 (같은 크기)
+        max_diff: 겹치는 영역의 허용 평균 절대 차이
+        max_diff_ratio: 이동하지 않은 상태의 평균 절대 차이 대비 허용 비율
+        min_overlap: 스크롤 후 남아 있어야 하는 최소 겹침 비율 (이미지 높이 기준)
+        profile_width: 행 프로필의 열 수
+        max_candidates: 원본 해상도에서 검증할 최대 후보 수
+    
+    Returns:
+        스크롤 양 (픽셀, 양수면 내용이 위로 이동해 아래에 새 행이 나타남) 또는
+        None (순수한 세로 스크롤이 아닌 경우)
+    """
+    if previous.shape != current.shape or previous.ndim != 2:
+        return None
+    height, width = current.shape
+    if height < 16:
+        return None
+    
+    max_shift = int(height * (1.0 - min_overlap))
+    if max_shift < 1:
+        return None
+    size = (min(profile_width, width), height)
+    previous_profile = cv2.resize(previous, size, interpolation=cv2.INTER_AREA).astype(np.float32)
+    current_profile = cv2.resize(current, size, interpolation=cv2.INTER_AREA).astype(np.float32)
+    
+    # 모든 이동량의 겹치는 행 평균 제곱 차이를 한 번에 계산 (교차 상관은 FFT, 행 에너지는 누적 합)
+    # 인덱스 max_shift + s가 이동량 s (가운데 0은 비교하지 않음)
+    previous_profile = previous_profile.astype(np.float64)
+    current_profile = current_profile.astype(np.float64)
+    length = 2 * height
+    cross = np.fft.irfft(np.fft.rfft(previous_profile, length, axis=0) *
+                         np.conj(np.fft.rfft(current_profile, length, axis=0)), length, axis=0).sum(axis=1)
+    previous_energy = np.concatenate(([0.0], np.cumsum((previous_profile ** 2).sum(axis=1))))
+    current_energy = np.concatenate(([0.0], np.cumsum((current_profile ** 2).sum(axis=1))))
+    steps = np.arange(1, max_shift + 1)
+    overlap = (height - steps) * size[0]
+    down = (previous_energy[height] - previous_energy[steps] + current_energy[height - steps] - 2 * cross[steps])
+    up = (previous_energy[height - steps] + current_energy[height] - current_energy[steps] - 2 * cross[length - steps])
+    scores = np.full(2 * max_shift + 1, np.inf)
+    scores[max_shift + steps] = down / overlap
+    scores[max_shift - steps] = up / overlap
+    
+    # 프로필 차이의 극소점 중 작은 순으로 후보 선택
+    padded = np.concatenate(([np.inf], scores, [np.inf]))
+    minima = np.flatnonzero((scores <= padded[:-2]) & (scores <= padded[2:]) & np.isfinite(scores))
+    candidates = minima[np.argsort(scores[minima], kind="stable")][:max_candidates] - max_shift
+    
+    limit = min(max_diff, float(cv2.absdiff(previous, current).mean()) * max_diff_ratio)
+    best_shift = None
+    best_diff = limit
+    for shift in candidates:
+        shift = int(shift)
+        if shift > 0:
+            diff = float(cv2.absdiff(previous[shift:], current[:height - shift]).mean())
+        else:
+            diff = float(cv2.absdiff(previous[:height + shift], current[-shift:]).mean())
+        if diff <= best_diff:
+            best_shift, best_diff = shift, diff
+    return best_shift
+
+class ReferenceFrame:
+    """
+    변화 감지 기준 프레임의 분석용 표현
+    
+    기준 프레임이 바뀔 때 한 번만 만들어지며 RGB 원본 대신
+    그레이스케일 사본과 그로부터 파생된 값만 보관한다.
+    """
+    
+    def __init__(self, gray: np.ndarray, thumbnail: np.ndarray, thumbnail_hash: bytes,
+                 pyramid_levels: int = 0):
+        """
+        Args:
+            gray: 기준 프레임의 그레이스케일 이미지
+            thumbnail: 변화 감지용 축소 이미지
+            thumbnail_hash: 축소 이미지 해시
+            pyramid_levels: 생성할 축소 피라미드 단계 수 (원본 제외, SSIM 비교 단계까지만)
+        """
+        self.gray = gray.copy()
+        self.thumbnail = thumbnail
+        self.thumbnail_hash = thumbnail_hash
+        
+        # 피라미드 (0단계는 원본 그레이스케일)
+        self.pyramid = [self.gray]
+        for _ in range(pyramid_levels):
+            level = self.pyramid[-1]
+            if min(level.shape[:2]) < 16:
+                break
+            self.pyramid.append(cv2.pyrDown(level))
+    
+    @property
+    def shape(self) -> tuple:
+        return self.gray.shape
 
 class ImageProcessor:
     """이미지 처리 및 변화 감지 클래스"""
     
-    def __init__(self, threshold: float = 0.95):
+    # 변화 감지 단계 이름 (어느 단계에서 판정했는지 집계)
+    STAGES = ("first", "shape", "hash", "mad_unchanged", "mad_changed", "ssim_unchanged", "ssim_changed")
+    
+    def __init__(self, threshold: float = 0.95, thumbnail_size: Tuple[int, int] = (64, 64),
+                 mad_low: float = 0.3, mad_high: float = 12.0, tile_size: int = 32,
+                 tile_threshold: float = 3.0, ssim_level: int = 0, scroll_max_diff: float = 0.5):
         """
         Args:
             threshold: 변화 감지 임계값 (0.0 ~ 1.0, 높을수록 민감)
+            thumbnail_size: 해시/평균 절대 차이 계산용 축소 이미지 크기 (width, height)
+            mad_low: 축소 이미지 평균 절대 차이가 이 값 이하면 변화 없음으로 판정
+            mad_high: 축소 이미지 평균 절대 차이가 이 값 이상이면 변화로 판정
+            tile_size: 변화 맵의 타일 크기 (픽셀)
+            tile_threshold: 타일 평균 절대 차이가 이 값을 넘으면 변경된 타일로 판정
+            ssim_level: SSIM 계산에 사용할 피라미드 단계 (0은 원본, 1은 1/2 축소, ...)
+            scroll_max_diff: 스크롤 판정 시 겹치는 영역의 허용 평균 절대 차이
         """
         self.threshold = threshold
-        self.previous_image = None
+        self.thumbnail_size = thumbnail_size
+        self.mad_low = mad_low
+        self.mad_high = mad_high
+        self.tile_size = tile_size
+        self.tile_threshold = tile_threshold
+        self.ssim_level = ssim_level
+        self.scroll_max_diff = scroll_max_diff
+        self.reference: Optional[ReferenceFrame] = None
+        self._previous_reference: Optional[ReferenceFrame] = None
+        self.last_change_map: Optional[dict] = None
+        self.stage_counts = dict.fromkeys(self.STAGES, 0)
     
     def calculate_similarity(self, img1: np.ndarray, img2: np.ndarray) -> float:
         """
@@ -39,42 +254,227 @@ class ImageProcessor:
             gray2 = cv2.cvtColor(img2, cv2.COLOR_RGB2GRAY)
             
             # SSIM 계산
-            similarity = ssim(gray1, gray2)
-            return similarity
+            return self.calculate_gray_similarity(gray1, gray2)
             
         except Exception as e:
             return 0.0
     
-    def has_changed(self, current_image: np.ndarray) -> bool:
+    def calculate_gray_similarity(self, gray1: np.ndarray, gray2: np.ndarray) -> float:
+        """
+        같은 크기의 두 그레이스케일 이미지 간 SSIM 계산
+        
+        Returns:
+            유사성 점수 (0.0 ~ 1.0, 1.0이 완전 동일)
+        """
+        try:
+            return structural_similarity(gray1, gray2)
+        except Exception as e:
+            return 0.0
+    
+    def make_thumbnail(self, image: Union[Frame, np.ndarray]) -> np.ndarray:
+        """
+        변화 감지용 그레이스케일 축소 이미지 생성
+        
+        정수 배율로 축소해야 OpenCV의 빠른 영역 평균 경로를 사용하므로
+        배율로 나누어떨어지지 않는 오른쪽/아래쪽 몇 픽셀은 제외한다.
+        """
+        gray = to_gray_array(image)
+        height, width = gray.shape[:2]
+        factor_x = max(1, width // self.thumbnail_size[0])
+        factor_y = max(1, height // self.thumbnail_size[1])
+        gray = gray[:height - height % factor_y, :width - width % factor_x]
+        return cv2.resize(gray, (gray.shape[1] // factor_x, gray.shape[0] // factor_y),
+                          interpolation=cv2.INTER_AREA)
+    
+    def _thumbnail_hash(self, thumbnail: np.ndarray) -> bytes:
+        """축소 이미지의 정확한 해시"""
+        return hashlib.blake2b(thumbnail.tobytes(), digest_size=16).digest()
+    
+    @property
+    def previous_image(self) -> Optional[np.ndarray]:
+        """비교 기준 이미지 (그레이스케일)"""
+        return self.reference.gray if self.reference is not None else None
+    
+    def _set_reference(self, image: Union[Frame, np.ndarray], thumbnail: np.ndarray, thumbnail_hash: bytes):
+        """비교 기준 프레임의 분석용 표현 생성"""
+        self._previous_reference = self.reference
+        self.reference = ReferenceFrame(to_gray_array(image), thumbnail, thumbnail_hash,
+                                        pyramid_levels=self.ssim_level)
+    
+    def has_changed(self, current_image: Union[Frame, np.ndarray]) -> bool:
         """
         이전 이미지와 비교하여 변화가 있는지 확인
         
+        비용이 낮은 단계부터 순서대로 판정한다.
+        1. 축소 이미지 해시가 같으면 변화 없음
+        2. 축소 이미지 평균 절대 차이가 mad_low 이하면 변화 없음, mad_high 이상이면 변화
+        3. 그 사이 애매한 경우에만 원본 해상도 SSIM 계산
+        
         Args:
-            current_image: 현재 이미지 (numpy array)
+            current_image: 현재 이미지 (프레임 또는 numpy array)
         
         Returns:
             변화가 있으면 True, 없으면 False
         """
         from utils.logger import logger
         
-        if self.previous_image is None:
-            self.previous_image = current_image.copy()
+        self.last_change_map = None
+        thumbnail = self.make_thumbnail(current_image)
+        thumbnail_hash = self._thumbnail_hash(thumbnail)
+        
+        reference = self.reference
+        if reference is None:
+            self._set_reference(current_image, thumbnail, thumbnail_hash)
+            self.stage_counts["first"] += 1
             logger.info("첫 번째 이미지 - 변화 감지됨 (API 호출)")
             return True  # 첫 번째 이미지는 항상 변화가 있다고 간주
         
-        similarity = self.calculate_similarity(self.previous_image, current_image)
+        # 영역 크기가 바뀌면 내용도 바뀐 것으로 간주
+        if reference.shape[:2] != current_image.shape[:2]:
+            self._set_reference(current_image, thumbnail, thumbnail_hash)
+            self.stage_counts["shape"] += 1
+            logger.info(f"이미지 크기 변경 감지됨 - {current_image.shape[1]}x{current_image.shape[0]} - API 호출")
+            return True
+        
+        # 1단계: 축소 이미지 해시
+        if thumbnail_hash == reference.thumbnail_hash:
+            self.stage_counts["hash"] += 1
+            logger.debug("이미지 변화 없음 - 축소 이미지 해시 일치 - API 호출 건너뜀")
+            return False
+        
+        # 2단계: 축소 이미지 평균 절대 차이
+        mad = float(cv2.absdiff(thumbnail, reference.thumbnail).mean())
+        if mad <= self.mad_low:
+            self.stage_counts["mad_unchanged"] += 1
+            logger.debug(f"이미지 변화 없음 - 평균 절대 차이: {mad:.2f} (하한: {self.mad_low}) - API 호출 건너뜀")
+            return False
+        if mad >= self.mad_high:
+            self.last_change_map = self.compute_change_map(current_image)
+            self._set_reference(current_image, thumbnail, thumbnail_hash)
+            self.stage_counts["mad_changed"] += 1
+            logger.info(f"이미지 변화 감지됨 - 평균 절대 차이: {mad:.2f} (상한: {self.mad_high}) - API 호출")
+            return True
+        
+        # 3단계: SSIM (기준 프레임은 이미 그레이스케일 피라미드로 보관)
+        similarity = self._reference_similarity(reference, to_gray_array(current_image))
         
         # 임계값보다 낮으면 변화가 있다고 판단
         has_change = similarity < self.threshold
         
         if has_change:
-            self.previous_image = current_image.copy()
+            self.last_change_map = self.compute_change_map(current_image)
+            self._set_reference(current_image, thumbnail, thumbnail_hash)
+            self.stage_counts["ssim_changed"] += 1
             logger.info(f"이미지 변화 감지됨 - 유사도: {similarity:.3f} (임계값: {self.threshold}) - API 호출")
         else:
+            self.stage_counts["ssim_unchanged"] += 1
             logger.debug(f"이미지 변화 없음 - 유사도: {similarity:.3f} (임계값: {self.threshold}) - API 호출 건너뜀")
         
         return has_change
     
+    def revert_reference(self):
+        """
+        마지막 변화 감지로 바뀐 기준 프레임을 이전 프레임으로 되돌림
+        
+        호출한 쪽에서 변화를 무시하기로 한 경우(잡음 등)에 사용하며, 되돌린 뒤에는
+        무시한 변화가 다음 비교에도 그대로 포함된다.
+        """
+        if self._previous_reference is not None:
+            self.reference = self._previous_reference
+            self._previous_reference = None
+    
+    def _reference_similarity(self, reference: ReferenceFrame, gray: np.ndarray) -> float:
+        """기준 프레임 피라미드의 ssim_level 단계와 현재 이미지 간 SSIM 계산"""
+        level = min(self.ssim_level, len(reference.pyramid) - 1)
+        for _ in range(level):
+            gray = cv2.pyrDown(gray)
+        return self.calculate_gray_similarity(reference.pyramid[level], gray)
+    
+    def compute_change_map(self, current_image: Union[Frame, np.ndarray]) -> Optional[dict]:
+        """
+        기준 프레임 대비 타일 단위 변화 맵 계산
+        
+        Args:
+            current_image: 현재 이미지 (프레임 또는 numpy array)
+        
+        Returns:
+            변화 맵 또는 None (기준 프레임이 없거나 크기가 다른 경우)
+            - tiles: 변경된 타일 여부 (타일 행 수, 타일 열 수) bool 배열
+            - changed_tiles: 변경된 타일 수
+            - changed_fraction: 변경된 타일이 차지하는 면적 비율 (0.0 ~ 1.0)
+            - bbox: 변경된 타일들의 경계 상자 (x, y, width, height) 또는 None
+            - tile_size: 타일 크기 (픽셀)
+            - shape: 이미지 크기 (height, width)
+        """
+        reference = self.reference
+        gray = to_gray_array(current_image)
+        if reference is None or reference.shape[:2] != gray.shape[:2]:
+            return None
+        
+        diff = cv2.absdiff(reference.gray, gray)
+        tile_diffs, _ = compute_tile_stats(diff, self.tile_size)
+        tiles = tile_diffs > self.tile_threshold
+        
+        height, width = gray.shape[:2]
+        return summarize_change_tiles(tiles, self.tile_size, height, width)
+    
+    def estimate_scroll(self, current_image: Union[Frame, np.ndarray],
+                        previous: Optional[np.ndarray] = None) -> Optional[int]:
+        """
+        세로 스크롤 양 추정 (estimate_vertical_shift 참고)
+        
+        Args:
+            current_image: 현재 이미지 (프레임 또는 numpy array)
+            previous: 비교할 이전 그레이스케일 이미지 (기본값은 기준 프레임)
+        
+        Returns:
+            스크롤 양 (픽셀, 양수면 아래쪽에 새 행) 또는 None
+        """
+        if previous is None:
+            if self.reference is None:
+                return None
+            previous = self.reference.gray
+        return estimate_vertical_shift(previous, to_gray_array(current_image), self.scroll_max_diff)
+    
+    def get_stage_stats(self) -> dict:
+        """변화 감지 단계별 판정 횟수 반환"""
+        return dict(self.stage_counts)
+    
+    def process_source(self, source, max_frames: Optional[int] = None) -> dict:
+        """
+        프레임 소스를 끝까지 재생하며 변화 감지 수행 (녹화 세션 재생, 성능 측정용)
+        
+        Args:
+            source: 프레임 소스 (core.frame_source.FrameSource)
+            max_frames: 처리할 최대 프레임 수 (None이면 소스 끝까지)
+        
+        Returns:
+            처리 프레임 수, 변화 감지 수, 처리 시간 등 통계
+        """
+        import time
+        
+        frames = 0
+        changes = 0
+        elapsed = 0.0
+        for frame in source:
+            start = time.perf_counter()
+            if self.has_changed(frame):
+                changes += 1
+            elapsed += time.perf_counter() - start
+            
+            frames += 1
+            if max_frames is not None and frames >= max_frames:
+                break
+        
+        return {
+            "frames": frames,
+            "changes": changes,
+            "skipped": frames - changes,
+            "total_time": elapsed,
+            "ms_per_frame": (elapsed / frames * 1000) if frames else 0.0,
+            "stages": self.get_stage_stats()
+        }
+    
     def calculate_pixel_difference(self, img1: np.ndarray, img2: np.ndarray) -> float:
         """
         픽셀 단위 차이 계산
@@ -140,7 +540,9 @@ class ImageProcessor:
     
     def reset(self):
         """이전 이미지 초기화"""
-        self.previous_image = None
+        self.reference = None
+        self._previous_reference = None
+        self.last_change_map = None
     
     def get_image_info(self, image: np.ndarray) -> dict:
         """이미지 정보 반환"""
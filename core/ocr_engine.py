@@ -0,0 +1,141 @@
+"""
+로컬 OCR 모듈
+Tesseract(pytesseract)로 캡처 이미지의 글자를 인식해 텍스트 전용 번역 요청에 사용
+"""
+
+import time
+import cv2
+import numpy as np
+from typing import Union
+from core.frame import Frame, to_gray_array
+from utils.logger import logger
+
+try:
+    import pytesseract
+except ImportError:  # 선택 의존성 - 없으면 항상 이미지로 번역
+    pytesseract = None
+
+class OcrEngine:
+    """
+    Tesseract 기반 글자 인식
+    
+    화면 글자는 Tesseract가 학습한 인쇄물보다 작고 어두운 배경도 많으므로, 확대하고
+    밝은 배경의 어두운 글자가 되도록 반전한 뒤 인식한다. 결과는 줄 단위로 묶고
+    글자 수로 가중 평균한 신뢰도를 함께 돌려준다.
+    """
+    
+    _available = None
+    
+    def __init__(self, languages: str = "eng", min_confidence: float = 75.0, scale: float = 2.0, psm: int = 6):
+        """
+        Args:
+            languages: Tesseract 언어 코드 ("eng", "jpn", "eng+jpn" 등)
+            min_confidence: 텍스트 번역에 사용할 최소 평균 신뢰도 (0 ~ 100)
+            scale: 인식 전 확대 배율
+            psm: Tesseract 페이지 분할 모드 (6 = 하나의 텍스트 블록)
+        """
+        self.languages = languages
+        self.min_confidence = min_confidence
+        self.scale = scale
+        self.psm = psm
+        self.stats = {"recognized": 0, "low_confidence": 0, "ocr_ms": 0.0}
+    
+    @classmethod
+    def from_config(cls, ocr_config: dict) -> "OcrEngine":
+        """설정(translation.ocr)으로 OCR 엔진 생성"""
+        return cls(
+            languages=ocr_config.get("languages", "eng"),
+            min_confidence=ocr_config.get("min_confidence", 75.0),
+            scale=ocr_config.get("scale", 2.0),
+            psm=ocr_config.get("psm", 6)
+        )
+    
+    @classmethod
+    def is_available(cls) -> bool:
+        """pytesseract와 Tesseract 실행 파일이 모두 있는지 확인 (결과는 캐시)"""
+        if cls._available is None:
+            if pytesseract is None:
+                cls._available = False
+            else:
+                try:
+                    pytesseract.get_tesseract_version()
+                    cls._available = True
+                except Exception as e:
+                    logger.warning(f"Tesseract 실행 파일을 찾을 수 없음: {e}")
+                    cls._available = False
+        return cls._available
+    
+    def _preprocess(self, image: Union[Frame, np.ndarray]) -> np.ndarray:
+        gray = to_gray_array(image)
+        if self.scale != 1.0:
+            gray = cv2.resize(gray, None, fx=self.scale, fy=self.scale, interpolation=cv2.INTER_CUBIC)
+        # 어두운 배경(밝은 글자)이면 반전
+        if gray.mean() < 128:
+            gray = cv2.bitwise_not(gray)
+        return gray
+    
+    def recognize(self, image: Union[Frame, np.ndarray]) -> dict:
+        """
+        글자 인식
+        
+        Args:
+            image: 프레임 또는 RGB/그레이스케일 numpy array
+        
+        Returns:
+            인식 결과
+            - text: 줄바꿈으로 구분한 전체 텍스트
+            - lines: 줄 목록 [{"text", "confidence", "bbox": (x, y, width, height)}] (원본 좌표)
+            - size: 원본 이미지 크기 (width, height)
+            - confidence: 글자 수 가중 평균 신뢰도 (0 ~ 100)
+            - reliable: 신뢰도가 min_confidence 이상이고 텍스트가 있으면 True
+        """
+        start_time = time.perf_counter()
+        gray = self._preprocess(image)
+        size = (int(round(gray.shape[1] / self.scale)), int(round(gray.shape[0] / self.scale)))
+        data = pytesseract.image_to_data(gray, lang=self.languages,
+                                         config=f"--psm {self.psm}", output_type=pytesseract.Output.DICT)
+        
+        # 단어를 (블록, 문단, 줄) 번호로 묶어 줄 단위 결과 생성
+        lines = {}
+        for i, word in enumerate(data["text"]):
+            confidence = float(data["conf"][i])
+            word = word.strip()
+            if not word or confidence < 0:
+                continue
+            key = (data["block_num"][i], data["par_num"][i], data["line_num"][i])
+            box = (data["left"][i], data["top"][i], data["left"][i] + data["width"][i], data["top"][i] + data["height"][i])
+            line = lines.setdefault(key, {"words": [], "confidences": [], "box": box})
+            line["words"].append(word)
+            line["confidences"].append((confidence, len(word)))
+            x0, y0, x1, y1 = line["box"]
+            line["box"] = (min(x0, box[0]), min(y0, box[1]), max(x1, box[2]), max(y1, box[3]))
+        
+        result_lines = []
+        total_confidence = 0.0
+        total_chars = 0
+        for key in sorted(lines):
+            line = lines[key]
+            chars = sum(length for _, length in line["confidences"])
+            confidence = sum(conf * length for conf, length in line["confidences"]) / chars
+            x0, y0, x1, y1 = (int(round(v / self.scale)) for v in line["box"])
+            result_lines.append({"text": " ".join(line["words"]), "confidence": confidence,
+                                 "bbox": (x0, y0, x1 - x0, y1 - y0)})
+            total_confidence += confidence * chars
+            total_chars += chars
+        
+        confidence = total_confidence / total_chars if total_chars else 0.0
+        text = "\n".join(line["text"] for line in result_lines)
+        reliable = bool(text) and confidence >= self.min_confidence
+        
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        self.stats["ocr_ms"] += elapsed_ms
+        self.stats["recognized" if reliable else "low_confidence"] += 1
+        logger.debug(f"OCR: {len(result_lines)}줄, 신뢰도 {confidence:.1f}, {elapsed_ms:.0f}ms")
+        return {"text": text, "lines": result_lines, "size": size, "confidence": confidence, "reliable": reliable}
+    
+    def get_stats(self) -> dict:
+        """인식 결과별 횟수와 평균 소요 시간 반환"""
+        stats = dict(self.stats)
+        runs = stats["recognized"] + stats["low_confidence"]
+        stats["avg_ocr_ms"] = stats["ocr_ms"] / runs if runs else 0.0
+        return stats
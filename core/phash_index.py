@@ -0,0 +1,121 @@
+"""
+지각 해시 색인 모듈
+최근에 번역한 화면의 dHash와 번역 결과를 보관하여 같은 화면으로 돌아왔을 때 재사용
+"""
+
+import cv2
+import numpy as np
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple, Union
+from core.frame import Frame, to_gray_array
+
+def dhash(image: Union[Frame, np.ndarray], hash_size: int = 16) -> int:
+    """
+    차분 해시(dHash) 계산
+    
+    (hash_size + 1) x hash_size 로 축소한 그레이스케일 이미지에서
+    가로로 이웃한 픽셀의 밝기 비교 결과를 hash_size^2 비트 정수로 만든다.
+    
+    Args:
+        image: 프레임 또는 RGB/그레이스케일 배열
+        hash_size: 해시 한 변의 크기 (비트 수 = hash_size^2)
+    """
+    gray = to_gray_array(image)
+    small = cv2.resize(gray, (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA)
+    bits = (small[:, 1:] > small[:, :-1]).flatten()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+def hamming_distance(hash1: int, hash2: int) -> int:
+    """두 해시 간 해밍 거리"""
+    return (hash1 ^ hash2).bit_count()
+
+class PerceptualHashIndex:
+    """
+    최근 화면의 지각 해시 -> 번역 결과 LRU 색인
+    
+    해밍 거리로 후보를 찾은 뒤 작은 축소 이미지의 평균 절대 차이로 한 번 더 확인하여
+    레이아웃만 비슷하고 글자가 다른 화면을 같은 화면으로 오인하지 않도록 한다.
+    """
+    
+    def __init__(self, capacity: int = 32, max_distance: int = 6, hash_size: int = 16,
+                 thumbnail_size: int = 64, max_thumbnail_diff: float = 1.0):
+        """
+        Args:
+            capacity: 보관할 최대 화면 수 (초과 시 가장 오래 사용하지 않은 항목 제거)
+            max_distance: 같은 화면 후보로 볼 최대 해밍 거리
+            hash_size: dHash 한 변의 크기
+            thumbnail_size: 확인용 축소 이미지 한 변의 크기
+            max_thumbnail_diff: 같은 화면으로 확정할 축소 이미지 최대 평균 절대 차이
+        """
+        self.capacity = capacity
+        self.max_distance = max_distance
+        self.hash_size = hash_size
+        self.thumbnail_size = thumbnail_size
+        self.max_thumbnail_diff = max_thumbnail_diff
+        self._entries = OrderedDict()  # (해시, 컨텍스트) -> (축소 이미지, 번역 결과)
+        self.hits = 0
+        self.misses = 0
+    
+    def compute_signature(self, image: Union[Frame, np.ndarray]) -> Tuple[int, np.ndarray]:
+        """색인에 사용할 (dHash, 확인용 축소 이미지) 계산"""
+        gray = to_gray_array(image)
+        thumbnail = cv2.resize(gray, (self.thumbnail_size, self.thumbnail_size),
+                               interpolation=cv2.INTER_AREA)
+        return dhash(gray, self.hash_size), thumbnail
+    
+    def lookup(self, signature: Tuple[int, np.ndarray], context: Hashable = None) -> Optional[str]:
+        """
+        가장 가까운 화면의 번역 결과 조회
+        
+        Args:
+            signature: compute_signature()로 계산한 현재 화면 서명
+            context: 번역 조건 (목표 언어, 모델 등) - 같은 조건의 결과만 재사용
+        
+        Returns:
+            같은 화면으로 확인된 항목의 번역 결과 또는 None
+        """
+        screen_hash, thumbnail = signature
+        candidates = []
+        for key in self._entries:
+            entry_hash, entry_context = key
+            if entry_context != context:
+                continue
+            distance = hamming_distance(screen_hash, entry_hash)
+            if distance <= self.max_distance:
+                candidates.append((distance, key))
+        
+        for distance, key in sorted(candidates, key=lambda item: item[0]):
+            entry_thumbnail, translation = self._entries[key]
+            if float(cv2.absdiff(thumbnail, entry_thumbnail).mean()) <= self.max_thumbnail_diff:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return translation
+        
+        self.misses += 1
+        return None
+    
+    def add(self, signature: Tuple[int, np.ndarray], translation: str, context: Hashable = None):
+        """화면 서명과 번역 결과 등록"""
+        screen_hash, thumbnail = signature
+        key = (screen_hash, context)
+        self._entries[key] = (thumbnail, translation)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+    
+    def clear(self):
+        """색인 초기화"""
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get_stats(self) -> dict:
+        """조회 통계 반환"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0
+        }
@@ -0,0 +1,263 @@
+"""
+API 요청 스케줄러 모듈
+모델별 분당 요청/토큰 한도를 토큰 버킷으로 지키고 일시적 오류는 지수 백오프로 재시도
+"""
+
+import asyncio
+import random
+import re
+import threading
+import time
+from typing import Awaitable, Callable, Optional
+from utils.logger import logger
+
+# 재시도할 HTTP 상태 (요청 시간 초과, 할당량 초과, 서버 오류)
+TRANSIENT_STATUS = {408, 429, 500, 502, 503, 504}
+
+# 설정이 없을 때의 모델별 한도 (무료 등급 기준)
+DEFAULT_QUOTAS = {
+    "gemini-2.5-flash": {"rpm": 10, "tpm": 250000},
+    "gemini-2.5-flash-lite": {"rpm": 15, "tpm": 250000},
+}
+
+def is_transient_error(error: Exception) -> bool:
+    """재시도하면 성공할 수 있는 오류인지 확인"""
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+        return True
+    # google.api_core 예외는 code, aiohttp 예외는 status에 HTTP 상태가 있음
+    for attribute in ("code", "status"):
+        status = getattr(error, attribute, None)
+        if isinstance(status, int) and status in TRANSIENT_STATUS:
+            return True
+    return False
+
+def retry_hint(error: Exception) -> Optional[float]:
+    """서버가 알려준 재시도 대기 시간 (초) 또는 None"""
+    # RetryInfo 상세 정보 (Duration 또는 timedelta)
+    for detail in getattr(error, "details", None) or []:
+        retry_delay = getattr(detail, "retry_delay", None)
+        if retry_delay is None:
+            continue
+        if hasattr(retry_delay, "total_seconds"):
+            return retry_delay.total_seconds()
+        return retry_delay.seconds + retry_delay.nanos / 1e9
+    
+    # 오류 메시지의 "Please retry in 12.3s" 형식
+    match = re.search(r"retry in ([\d.]+)\s*s", str(error), re.IGNORECASE)
+    if match:
+        return float(match.group(1))
+    return None
+
+class TokenBucket:
+    """분당 한도를 초당 보충 속도로 바꾼 토큰 버킷 (한도 0이면 무제한)"""
+    
+    def __init__(self, per_minute: float):
+        self.per_minute = per_minute
+        self.rate = per_minute / 60.0
+        self.level = float(per_minute)
+        self.updated = time.monotonic()
+    
+    def reserve(self, amount: float, now: float) -> float:
+        """
+        용량 예약
+        
+        잔량이 모자라도 예약은 하고(잔량이 음수가 됨), 잔량이 다시 0이 될 때까지
+        기다려야 하는 시간을 돌려준다. 먼저 예약한 요청이 먼저 보충분을 받는다.
+        
+        Returns:
+            대기 시간 (초)
+        """
+        if self.per_minute <= 0:
+            return 0.0
+        self.level = min(float(self.per_minute), self.level + (now - self.updated) * self.rate)
+        self.updated = now
+        self.level -= amount
+        return -self.level / self.rate if self.level < 0 else 0.0
+    
+    def refund(self, amount: float):
+        """쓰지 않은 예약 용량 반환"""
+        if self.per_minute <= 0:
+            return
+        self.level = min(float(self.per_minute), self.level + amount)
+
+class RequestScheduler:
+    """
+    모델별 요청 한도 관리 및 재시도
+    
+    요청 전에 분당 요청 수(RPM)와 분당 토큰 수(TPM) 버킷에서 용량을 예약하고, 모자라면
+    보충될 때까지 기다린다. 할당량 초과(429)나 서버 오류는 서버가 알려준 대기 시간 또는
+    지터를 넣은 지수 백오프만큼 같은 모델의 모든 요청을 멈춘 뒤 최대 max_retries번 재시도한다.
+    """
+    
+    def __init__(self, quotas: Optional[dict] = None, max_retries: int = 3,
+                 base_delay: float = 1.0, max_delay: float = 30.0):
+        """
+        Args:
+            quotas: 모델별 한도 {모델 이름: {"rpm": 분당 요청 수, "tpm": 분당 토큰 수}} (없는 모델은 무제한)
+            max_retries: 일시적 오류 최대 재시도 횟수
+            base_delay: 첫 재시도 백오프 상한 (초, 재시도마다 두 배)
+            max_delay: 백오프 최대 상한 (초)
+        """
+        self.quotas = quotas or {}
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self._blocked_until = {}
+        self._waiting = 0  # 예약 후 한도 대기 중인 요청 수
+        self.stats = {"requests": 0, "throttled": 0, "throttle_wait": 0.0, "retries": 0, "gave_up": 0,
+                      "released": 0}
+    
+    @classmethod
+    def from_config(cls, quota_config: dict) -> "RequestScheduler":
+        """설정(translation.quota)으로 스케줄러 생성"""
+        return cls(
+            quotas=quota_config.get("models", DEFAULT_QUOTAS),
+            max_retries=quota_config.get("max_retries", 3),
+            base_delay=quota_config.get("base_delay", 1.0),
+            max_delay=quota_config.get("max_delay", 30.0)
+        )
+    
+    def set_quotas(self, quotas: dict):
+        """모델별 한도 변경 (버킷은 새 한도로 다시 채움)"""
+        with self._lock:
+            self.quotas = quotas or {}
+            self._buckets = {}
+    
+    def _model_buckets(self, model: str):
+        buckets = self._buckets.get(model)
+        if buckets is None:
+            quota = self.quotas.get(model, {})
+            buckets = (TokenBucket(quota.get("rpm", 0)), TokenBucket(quota.get("tpm", 0)))
+            self._buckets[model] = buckets
+        return buckets
+    
+    def reserve(self, model: str, tokens: int) -> float:
+        """
+        요청 1건과 토큰 tokens개 예약
+        
+        Returns:
+            요청 전에 기다려야 하는 시간 (초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            request_bucket, token_bucket = self._model_buckets(model)
+            wait = max(request_bucket.reserve(1, now), token_bucket.reserve(tokens, now),
+                       self._blocked_until.get(model, 0.0) - now, 0.0)
+            self.stats["requests"] += 1
+            if wait > 0:
+                self.stats["throttled"] += 1
+                self.stats["throttle_wait"] += wait
+        if wait > 0.5:
+            logger.info(f"요청 한도 조절 중 - {wait:.1f}초 후 요청 ({model})")
+        return wait
+    
+    def release(self, model: str, tokens: int):
+        """
+        보내지 않은 요청의 예약 반환
+        
+        대기 중에 취소된 요청(더 최근 화면의 요청으로 대체 등)이 한도를 차지해
+        이후 요청까지 늦추지 않도록 reserve()로 예약한 용량을 버킷에 돌려준다.
+        """
+        with self._lock:
+            buckets = self._buckets.get(model)
+            if buckets is not None:
+                request_bucket, token_bucket = buckets
+                request_bucket.refund(1)
+                token_bucket.refund(tokens)
+            self.stats["released"] += 1
+    
+    def _set_waiting(self, delta: int):
+        with self._lock:
+            self._waiting += delta
+    
+    def backoff(self, model: str, error: Exception, attempt: int) -> Optional[float]:
+        """
+        재시도 대기 시간 결정
+        
+        재시도할 수 없는 오류이거나 재시도 횟수를 다 썼으면 None. 대기하는 동안에는
+        같은 모델의 다른 요청도 보내지 않도록 모델 전체를 멈춘다.
+        """
+        if not is_transient_error(error):
+            return None
+        if attempt >= self.max_retries:
+            with self._lock:
+                self.stats["gave_up"] += 1
+            return None
+        
+        hint = retry_hint(error)
+        if hint is not None:
+            # 서버 지시를 따르되 여러 요청이 동시에 다시 몰리지 않도록 약간 분산
+            delay = hint + random.uniform(0, 0.5)
+        else:
+            delay = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+        
+        with self._lock:
+            self._blocked_until[model] = max(self._blocked_until.get(model, 0.0), time.monotonic() + delay)
+            self.stats["retries"] += 1
+        logger.warning(f"일시적 API 오류 - {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries}): {error}")
+        return delay
+    
+    async def run(self, model: str, tokens: int, call: Callable[[], Awaitable]):
+        """
+        한도를 지키며 비동기 호출 실행 (일시적 오류는 재시도)
+        
+        Args:
+            model: 모델 이름
+            tokens: 요청 예상 토큰 수
+            call: 호출할 때마다 새 요청을 만드는 코루틴 함수
+        """
+        attempt = 0
+        while True:
+            wait = self.reserve(model, tokens)
+            if wait > 0:
+                self._set_waiting(1)
+                try:
+                    await asyncio.sleep(wait)
+                except asyncio.CancelledError:
+                    # 요청을 보내기 전에 취소되었으면 예약한 한도를 돌려줌
+                    self.release(model, tokens)
+                    raise
+                finally:
+                    self._set_waiting(-1)
+            try:
+                return await call()
+            except Exception as e:
+                # 대기는 모델 전체 정지 시각으로 기록되므로 다음 예약에서 기다림
+                if self.backoff(model, e, attempt) is None:
+                    raise
+                attempt += 1
+    
+    def run_sync(self, model: str, tokens: int, call: Callable):
+        """run()의 동기 버전"""
+        attempt = 0
+        while True:
+            wait = self.reserve(model, tokens)
+            if wait > 0:
+                self._set_waiting(1)
+                try:
+                    time.sleep(wait)
+                finally:
+                    self._set_waiting(-1)
+            try:
+                return call()
+            except Exception as e:
+                if self.backoff(model, e, attempt) is None:
+                    raise
+                attempt += 1
+    
+    @property
+    def is_throttling(self) -> bool:
+        """한도 대기 중인 요청이 있거나 오류 백오프로 멈춘 모델이 있으면 True"""
+        now = time.monotonic()
+        with self._lock:
+            return self._waiting > 0 or any(until > now for until in self._blocked_until.values())
+    
+    def get_stats(self) -> dict:
+        """요청/대기/재시도 통계 반환"""
+        with self._lock:
+            stats = dict(self.stats)
+        stats["is_throttling"] = self.is_throttling
+        return stats
@@ -0,0 +1,135 @@
+"""
+최신 요청 슬롯 모듈
+영역마다 진행 중인 요청 하나와 대기 요청 하나만 유지하고 지난 화면의 결과는 버림
+"""
+
+from typing import Optional
+
+class LatestRequestSlot:
+    """
+    영역별 최신 우선(latest-wins) 번역 요청 관리
+    
+    영역마다 진행 중인 요청은 하나뿐이며, 그동안 들어온 새 화면은 대기 슬롯 하나에 보관한다.
+    대기 중에 더 새로운 화면이 들어오면 이전 대기 요청을 교체하므로 요청 수는 늘지 않고,
+    진행 중인 요청이 끝나면 가장 최근 화면이 바로 이어서 번역된다. 결과는 같은 영역의 더
+    최근 요청 결과가 이미 표시되었으면 버린다.
+    """
+    
+    def __init__(self):
+        self._regions = {}
+        self._next_id = 0
+        self.stats = {"sent": 0, "replaced": 0, "superseded": 0, "stale": 0}
+    
+    def _state(self, region) -> dict:
+        return self._regions.setdefault(region, {"in_flight": None, "pending": None, "displayed": 0})
+    
+    def new_request(self, region, **payload) -> dict:
+        """
+        요청 생성
+        
+        Args:
+            region: 요청 영역 키
+            payload: 완료 처리에 필요한 값 (이미지, 화면 서명, 스크롤 구간 등)
+        
+        Returns:
+            요청 번호(id)와 영역(region)이 붙은 요청 dict (번호는 생성 순서대로 증가)
+        """
+        self._next_id += 1
+        return dict(payload, id=self._next_id, region=region)
+    
+    def offer(self, request: dict) -> Optional[dict]:
+        """
+        자동 요청 제출
+        
+        Returns:
+            바로 보낼 요청 또는 None (진행 중인 요청이 있어 대기 슬롯에 보관)
+        """
+        state = self._state(request["region"])
+        if state["in_flight"] is None:
+            state["in_flight"] = request
+            self.stats["sent"] += 1
+            return request
+        
+        if state["pending"] is not None:
+            self.stats["replaced"] += 1
+        state["pending"] = request
+        return None
+    
+    def take_over(self, request: dict) -> Optional[dict]:
+        """
+        수동 요청처럼 즉시 보내야 하는 요청으로 슬롯 차지
+        
+        대기 요청은 버리고 요청을 진행 중으로 등록한다.
+        
+        Returns:
+            밀려난 이전 진행 중 요청 (호출한 쪽에서 취소) 또는 None
+        """
+        state = self._state(request["region"])
+        if state["pending"] is not None:
+            state["pending"] = None
+            self.stats["replaced"] += 1
+        
+        previous = state["in_flight"]
+        if previous is not None:
+            self.stats["superseded"] += 1
+        state["in_flight"] = request
+        self.stats["sent"] += 1
+        return previous
+    
+    def finish(self, request: dict) -> Optional[dict]:
+        """
+        요청 종료(성공, 실패, 취소) 처리
+        
+        Returns:
+            이어서 보낼 대기 요청 또는 None
+        """
+        state = self._state(request["region"])
+        if state["in_flight"] is None or state["in_flight"]["id"] != request["id"]:
+            return None
+        
+        next_request = state["pending"]
+        state["pending"] = None
+        state["in_flight"] = next_request
+        if next_request is not None:
+            self.stats["sent"] += 1
+        return next_request
+    
+    def can_display(self, request: dict) -> bool:
+        """같은 영역에 더 최근 요청의 결과가 아직 표시되지 않았으면 True (중간 결과 표시용)"""
+        return request["id"] >= self._state(request["region"])["displayed"]
+    
+    def accept_result(self, request: dict) -> bool:
+        """
+        결과 표시 여부 결정
+        
+        Returns:
+            같은 영역의 더 최근 요청 결과가 이미 표시되었으면 False
+        """
+        state = self._state(request["region"])
+        if request["id"] < state["displayed"]:
+            self.stats["stale"] += 1
+            return False
+        state["displayed"] = request["id"]
+        return True
+    
+    def mark_displayed(self, region):
+        """
+        요청 없이 표시한 결과 기록 (재사용 결과 등)
+        
+        진행 중이거나 대기 중인 요청은 표시된 화면보다 이전 화면이므로, 대기 요청은 보내지 않고
+        진행 중인 요청의 결과는 도착하면 버려진다.
+        """
+        state = self._state(region)
+        if state["pending"] is not None:
+            state["pending"] = None
+            self.stats["replaced"] += 1
+        self._next_id += 1
+        state["displayed"] = self._next_id
+    
+    def clear(self):
+        """모든 영역의 진행/대기 상태 초기화 (진행 중인 요청은 호출한 쪽에서 취소)"""
+        self._regions.clear()
+    
+    def get_stats(self) -> dict:
+        """전송/교체/폐기 횟수 반환"""
+        return dict(self.stats)
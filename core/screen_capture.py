@@ -5,9 +5,9 @@ mss 라이브러리를 사용한 고성능 화면 캡처
 
 import mss
 import numpy as np
-from PIL import Image
 from typing import Tuple, Optional
-import time
+import threading
+from core.frame import Frame
 from utils.logger import logger
 
 class ScreenCapture:
@@ -16,24 +16,60 @@ class ScreenCapture:
     def __init__(self):
         logger.info("화면 캡처 모듈 초기화 시작")
         try:
-            self.sct = mss.mss()
-            self.last_capture = None
+            # 스레드별 mss 인스턴스 풀 (스레드 ID -> mss 인스턴스)
+            self._grabbers = {}
+            self._grabbers_lock = threading.Lock()
+            self._closed = False
+            
+            self.sct = self._get_grabber()
+            self.last_frame = None
             self.last_capture_time = 0
             logger.info("화면 캡처 모듈 초기화 완료")
         except Exception as e:
             logger.error(f"화면 캡처 모듈 초기화 실패: {e}")
             raise
     
-    def capture_region(self, x: int, y: int, width: int, height: int) -> Optional[np.ndarray]:
+    def _get_grabber(self):
         """
-        지정된 영역을 캡처
+        현재 스레드 전용 mss 인스턴스 반환
+        
+        mss 인스턴스는 생성한 스레드에서만 안전하게 사용할 수 있으므로
+        스레드마다 하나씩 만들어 두고 close() 전까지 재사용한다.
+        """
+        thread_id = threading.get_ident()
+        with self._grabbers_lock:
+            if self._closed:
+                raise RuntimeError("이미 종료된 화면 캡처 모듈입니다")
+            
+            grabber = self._grabbers.get(thread_id)
+            if grabber is None:
+                self._prune_dead_grabbers()
+                grabber = mss.mss()
+                self._grabbers[thread_id] = grabber
+                logger.debug(f"mss 인스턴스 생성 - 스레드: {thread_id}, 풀 크기: {len(self._grabbers)}")
+            return grabber
+    
+    def _prune_dead_grabbers(self):
+        """종료된 스레드의 mss 인스턴스 정리 (_grabbers_lock 보유 상태에서 호출)"""
+        alive_ids = {thread.ident for thread in threading.enumerate()}
+        for thread_id in list(self._grabbers):
+            if thread_id not in alive_ids:
+                grabber = self._grabbers.pop(thread_id)
+                try:
+                    grabber.close()
+                except Exception as e:
+                    logger.debug(f"종료된 스레드의 mss 인스턴스 정리 실패: {e}")
+    
+    def capture_frame(self, x: int, y: int, width: int, height: int) -> Optional[Frame]:
+        """
+        지정된 영역을 복사 없이 캡처
         
         Args:
             x, y: 캡처할 영역의 좌상단 좌표
             width, height: 캡처할 영역의 크기
         
         Returns:
-            캡처된 이미지 (numpy array) 또는 None
+            mss 버퍼 위의 BGRA 뷰를 담은 프레임 또는 None
         """
         logger.debug(f"화면 캡처 시도: x={x}, y={y}, width={width}, height={height}")
         try:
@@ -47,24 +83,22 @@ class ScreenCapture:
             
             logger.debug(f"모니터 설정: {monitor}")
             
-            # 스레드 안전을 위해 새로운 mss 인스턴스 생성
-            with mss.mss() as sct:
-                # 화면 캡처
-                screenshot = sct.grab(monitor)
-                logger.debug(f"스크린샷 크기: {screenshot.size}")
-                
-                # PIL Image로 변환
-                img = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
+            # 스레드별로 유지되는 mss 인스턴스 재사용
+            sct = self._get_grabber()
             
-            # numpy array로 변환
-            img_array = np.array(img)
+            # 화면 캡처
+            screenshot = sct.grab(monitor)
+            logger.debug(f"스크린샷 크기: {screenshot.size}")
+            
+            # mss 버퍼를 그대로 감싸는 프레임 (RGB 변환은 필요할 때만)
+            frame = Frame.from_screenshot(screenshot)
             
             # 캡처 정보 저장
-            self.last_capture = img_array
-            self.last_capture_time = time.time()
+            self.last_frame = frame
+            self.last_capture_time = frame.timestamp
             
-            logger.debug(f"화면 캡처 성공: {img_array.shape}")
-            return img_array
+            logger.debug(f"화면 캡처 성공: {frame.shape}")
+            return frame
             
         except Exception as e:
             logger.error(f"화면 캡처 오류: {e}")
@@ -72,6 +106,35 @@ class ScreenCapture:
             logger.error(f"상세 오류: {traceback.format_exc()}")
             return None
     
+    def capture_region(self, x: int, y: int, width: int, height: int) -> Optional[np.ndarray]:
+        """
+        지정된 영역을 캡처
+        
+        Args:
+            x, y: 캡처할 영역의 좌상단 좌표
+            width, height: 캡처할 영역의 크기
+        
+        Returns:
+            캡처된 이미지 (RGB numpy array) 또는 None
+        """
+        frame = self.capture_frame(x, y, width, height)
+        if frame is None:
+            return None
+        return frame.rgb
+    
+    def capture_window_frame(self, window_rect: Tuple[int, int, int, int]) -> Optional[Frame]:
+        """
+        창 영역을 복사 없이 캡처 (x, y, width, height)
+        
+        Args:
+            window_rect: (x, y, width, height) 튜플
+        
+        Returns:
+            캡처된 프레임 또는 None
+        """
+        x, y, width, height = window_rect
+        return self.capture_frame(x, y, width, height)
+    
     def capture_window_region(self, window_rect: Tuple[int, int, int, int]) -> Optional[np.ndarray]:
         """
         창 영역을 캡처 (x, y, width, height)
@@ -85,28 +148,51 @@ class ScreenCapture:
         x, y, width, height = window_rect
         return self.capture_region(x, y, width, height)
     
+    def get_last_frame(self) -> Optional[Frame]:
+        """마지막 캡처된 프레임 반환"""
+        return self.last_frame
+    
     def get_last_capture(self) -> Optional[np.ndarray]:
         """마지막 캡처된 이미지 반환"""
-        return self.last_capture
+        if self.last_frame is None:
+            return None
+        return self.last_frame.rgb
     
     def get_last_capture_time(self) -> float:
         """마지막 캡처 시간 반환"""
         return self.last_capture_time
     
-    def capture_all_monitors(self) -> list:
-        """모든 모니터 캡처"""
+    def capture_all_monitors(self, as_frames: bool = False) -> list:
+        """
+        모든 모니터 캡처
+        
+        Args:
+            as_frames: True면 복사 없는 프레임 목록, False면 RGB 배열 목록 반환
+        """
         screenshots = []
-        for monitor in self.sct.monitors[1:]:  # 첫 번째는 모든 모니터 정보
-            screenshot = self.sct.grab(monitor)
-            img = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
-            screenshots.append(np.array(img))
+        sct = self._get_grabber()
+        for monitor in sct.monitors[1:]:  # 첫 번째는 모든 모니터 정보
+            frame = Frame.from_screenshot(sct.grab(monitor))
+            screenshots.append(frame if as_frames else frame.rgb)
         return screenshots
     
     def get_monitor_info(self) -> list:
         """모니터 정보 반환"""
-        return self.sct.monitors[1:]  # 첫 번째는 모든 모니터 정보
+        return self._get_grabber().monitors[1:]  # 첫 번째는 모든 모니터 정보
     
     def close(self):
-        """리소스 정리"""
-        if hasattr(self, 'sct'):
-            self.sct.close()
+        """리소스 정리 (모든 스레드의 mss 인스턴스 해제)"""
+        if not hasattr(self, '_grabbers'):
+            return
+        
+        with self._grabbers_lock:
+            self._closed = True
+            grabbers = list(self._grabbers.values())
+            self._grabbers.clear()
+        
+        for grabber in grabbers:
+            try:
+                grabber.close()
+            except Exception as e:
+                logger.debug(f"mss 인스턴스 해제 실패: {e}")
+        logger.debug(f"mss 인스턴스 {len(grabbers)}개 해제 완료")
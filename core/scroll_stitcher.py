@@ -0,0 +1,230 @@
+"""
+스크롤 이어 붙이기 모듈
+스크롤로 새로 드러난 띠 영역만 번역하고 기존 번역 결과에 줄 위치 기준으로 이어 붙임
+"""
+
+import cv2
+import numpy as np
+from typing import List, Optional, Tuple, Union
+from core.frame import Frame, to_gray_array
+from core.image_processor import ImageProcessor
+
+class ScrollStitcher:
+    """
+    긴 문서를 스크롤하며 읽을 때의 번역 결과 관리
+    
+    화면 위치는 문서 좌표(첫 화면 상단 = 0, 아래로 증가)로 추적하며, 번역 결과는
+    (문서 좌표 시작 행, 높이, 번역문) 구간으로 보관한다. 새 화면이 들어오면 이전 화면 대비
+    세로 이동량을 추정하고, 아직 번역 결과가 없는 구간만 번역 대상으로 돌려준다.
+    """
+    
+    def __init__(self, image_processor: ImageProcessor, max_strip_fraction: float = 0.6,
+                 snap_margin: int = 12, max_segments: int = 64):
+        """
+        Args:
+            image_processor: 스크롤 양 추정에 사용할 이미지 처리 모듈
+            max_strip_fraction: 번역할 띠가 화면 높이의 이 비율을 넘으면 전체 번역
+            snap_margin: 띠 경계를 줄 사이 빈 행으로 옮길 때 탐색할 최대 거리 (픽셀)
+            max_segments: 보관할 최대 번역 구간 수 (화면에서 먼 구간부터 제거)
+        """
+        self.image_processor = image_processor
+        self.max_strip_fraction = max_strip_fraction
+        self.snap_margin = snap_margin
+        self.max_segments = max_segments
+        
+        self.anchor: Optional[np.ndarray] = None  # 마지막으로 계획한 화면의 그레이스케일 사본
+        self.view_offset = 0
+        self.view_height = 0
+        self.generation = 0
+        self.segments: List[Tuple[int, int, str]] = []
+        self.stats = {"full": 0, "strip": 0, "reuse": 0}
+    
+    def plan(self, image: Union[Frame, np.ndarray]) -> dict:
+        """
+        현재 화면에서 번역이 필요한 영역 결정
+        
+        Args:
+            image: 현재 화면 (프레임 또는 numpy array)
+        
+        Returns:
+            번역 계획
+            - mode: "full" (전체 번역), "strip" (띠 영역만 번역), "reuse" (기존 결과로 충분)
+            - y, height: 번역할 영역의 화면 내 세로 위치와 높이
+            - segment: 번역 결과 등록 시 add_segment()에 넘길 (세대, 문서 좌표, 높이)
+        """
+        gray = to_gray_array(image)
+        height = gray.shape[0]
+        
+        shift = None
+        if self.anchor is not None and self.anchor.shape == gray.shape:
+            shift = self.image_processor.estimate_scroll(gray, previous=self.anchor)
+            if shift is None and float(cv2.absdiff(self.anchor, gray).mean()) <= self.image_processor.scroll_max_diff:
+                shift = 0
+        # 링 버퍼 프레임에서 나온 뷰일 수 있으므로 복사해서 보관
+        self.anchor = gray.copy()
+        self.view_height = height
+        
+        if shift is None:
+            return self._plan_full(height)
+        
+        self.view_offset += shift
+        gap = self._uncovered(self.view_offset, self.view_offset + height)
+        if gap is None:
+            self.stats["reuse"] += 1
+            return {"mode": "reuse", "y": 0, "height": 0, "segment": None}
+        
+        y0 = gap[0] - self.view_offset
+        y1 = gap[1] - self.view_offset
+        if y0 > 0:
+            y0 = self._snap_to_gap(gray, y0, -1)
+        if y1 < height:
+            y1 = self._snap_to_gap(gray, y1, 1)
+        if y1 - y0 > height * self.max_strip_fraction:
+            return self._plan_full(height)
+        
+        self.stats["strip"] += 1
+        return {"mode": "strip", "y": y0, "height": y1 - y0,
+                "segment": (self.generation, self.view_offset + y0, y1 - y0)}
+    
+    def _plan_full(self, height: int) -> dict:
+        """문서를 새로 시작하고 전체 번역 계획 반환"""
+        self.reset_document()
+        self.view_height = height
+        self.stats["full"] += 1
+        return {"mode": "full", "y": 0, "height": height, "segment": (self.generation, 0, height)}
+    
+    def _uncovered(self, start: int, end: int) -> Optional[Tuple[int, int]]:
+        """
+        [start, end) 구간 중 번역 결과가 없는 부분을 모두 덮는 최소 구간
+        
+        Returns:
+            (시작, 끝) 문서 좌표 또는 None (모두 번역됨)
+        """
+        gaps = []
+        position = start
+        for offset, height, _ in self.segments:
+            if offset + height <= position:
+                continue
+            if offset >= end:
+                break
+            if offset > position:
+                gaps.append((position, offset))
+            position = max(position, offset + height)
+        if position < end:
+            gaps.append((position, end))
+        
+        if not gaps:
+            return None
+        return gaps[0][0], gaps[-1][1]
+    
+    def _snap_to_gap(self, gray: np.ndarray, y: int, direction: int) -> int:
+        """
+        띠 경계를 가까운 줄 사이 빈 행으로 이동 (글자가 잘려 번역되지 않도록)
+        
+        Args:
+            gray: 현재 화면 그레이스케일 이미지
+            y: 원래 경계 행
+            direction: -1이면 위쪽, 1이면 아래쪽으로 탐색 (띠가 넓어지는 방향)
+        """
+        if direction < 0:
+            first, last = max(0, y - self.snap_margin), y
+        else:
+            first, last = y, min(gray.shape[0], y + self.snap_margin)
+        if last <= first:
+            return y
+        
+        row_stds = gray[first:last].std(axis=1)
+        candidates = np.flatnonzero(row_stds <= row_stds.min() + 0.5)
+        # 가장 평평한 행들 중 원래 경계에 가장 가까운 행 선택
+        index = candidates[-1] if direction < 0 else candidates[0]
+        return first + int(index) if direction < 0 else first + int(index) + 1
+    
+    def add_segment(self, segment: Tuple[int, int, int], text: str) -> bool:
+        """
+        번역 결과 등록
+        
+        Args:
+            segment: plan()이 돌려준 (세대, 문서 좌표, 높이)
+            text: 번역 결과
+        
+        Returns:
+            등록했으면 True (그 사이 문서가 새로 시작되어 버린 결과면 False)
+        """
+        generation, offset, height = segment
+        if generation != self.generation:
+            return False
+        
+        end = offset + height
+        # 새 구간에 완전히 포함되는 이전 결과는 제거
+        self.segments = [s for s in self.segments if not (offset <= s[0] and s[0] + s[1] <= end)]
+        self.segments.append((offset, height, text))
+        self.segments.sort(key=lambda s: s[0])
+        
+        if len(self.segments) > self.max_segments:
+            center = self.view_offset + self.view_height / 2
+            by_distance = sorted(self.segments, key=lambda s: abs(s[0] + s[1] / 2 - center))
+            self.segments = sorted(by_distance[:self.max_segments], key=lambda s: s[0])
+        return True
+    
+    def _visible_texts(self, segments: List[Tuple[int, int, str]]) -> List[str]:
+        """
+        현재 화면에 걸친 구간의 번역문 (화면 밖으로 나간 부분은 잘라냄)
+        
+        구간에는 줄별 위치가 없으므로 번역문 줄이 구간 높이에 고르게 놓여 있다고 보고
+        줄 가운데가 화면 안에 있는 줄만 남긴다.
+        """
+        start = self.view_offset
+        end = self.view_offset + self.view_height
+        texts = []
+        for offset, height, text in segments:
+            if not text or offset >= end or offset + height <= start:
+                continue
+            if start <= offset and offset + height <= end:
+                texts.append(text)
+                continue
+            lines = text.split("\n")
+            line_height = height / len(lines)
+            visible = [line for index, line in enumerate(lines)
+                       if start <= offset + (index + 0.5) * line_height < end]
+            if visible:
+                texts.append("\n".join(visible))
+        return texts
+    
+    def compose(self) -> str:
+        """현재 화면에 걸친 번역 결과를 위에서부터 이어 붙인 텍스트"""
+        return "\n".join(self._visible_texts(self.segments))
+    
+    def surrounding_text(self, segment: Tuple[int, int, int]) -> Optional[Tuple[str, str]]:
+        """
+        구간 번역이 끝나기 전에 보여줄 앞뒤 텍스트 (스트리밍 중간 결과 표시용)
+        
+        Returns:
+            (구간 위쪽 결과, 구간 아래쪽 결과) - 구간 자리에 들어갈 줄바꿈 포함,
+            문서가 새로 시작되어 버릴 구간이면 None
+        """
+        generation, offset, height = segment
+        if generation != self.generation:
+            return None
+        
+        end = offset + height
+        # add_segment()와 같이 새 구간에 완전히 포함되는 이전 결과는 제외
+        kept = [s for s in self.segments if not (offset <= s[0] and s[0] + s[1] <= end)]
+        before = "\n".join(self._visible_texts([s for s in kept if s[0] < offset]))
+        after = "\n".join(self._visible_texts([s for s in kept if s[0] >= offset]))
+        return (before + "\n" if before else ""), ("\n" + after if after else "")
+    
+    def reset_document(self):
+        """문서 좌표와 번역 결과 초기화 (이전 요청의 결과는 무시됨)"""
+        self.view_offset = 0
+        self.segments = []
+        self.generation += 1
+    
+    def reset(self):
+        """기준 화면까지 모두 초기화"""
+        self.reset_document()
+        self.anchor = None
+        self.view_height = 0
+    
+    def get_stats(self) -> dict:
+        """번역 계획 유형별 횟수 반환"""
+        return dict(self.stats)
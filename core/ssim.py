@@ -0,0 +1,89 @@
+"""
+SSIM 계산 모듈
+OpenCV 필터만 사용한 구조적 유사성 지수(SSIM) 구현 (scikit-image 불필요)
+"""
+
+import cv2
+import numpy as np
+
+# scikit-image structural_similarity와 같은 상수
+K1 = 0.01
+K2 = 0.03
+GAUSSIAN_SIGMA = 1.5
+GAUSSIAN_WIN_SIZE = 11  # scipy gaussian_filter(sigma=1.5, truncate=3.5)의 창 크기
+
+def structural_similarity(img1: np.ndarray, img2: np.ndarray, win_size: int = 7,
+                          data_range: float = 255.0, gaussian_weights: bool = False,
+                          downscale: int = 1) -> float:
+    """
+    두 그레이스케일 이미지 간 평균 SSIM 계산
+    
+    기본값은 skimage.metrics.structural_similarity의 기본 동작과 같다
+    (7x7 균일 창, 표본 공분산 보정, 가장자리 창 제외 후 평균).
+    
+    Args:
+        img1, img2: 같은 크기의 그레이스케일 이미지
+        win_size: 균일 창 크기 (홀수)
+        data_range: 픽셀 값 범위 (uint8은 255)
+        gaussian_weights: True면 sigma=1.5 가우시안 창 사용 (Wang et al. 방식)
+        downscale: 1보다 크면 해당 배율로 축소한 뒤 계산 (빠르지만 근사값)
+    
+    Returns:
+        평균 SSIM (-1.0 ~ 1.0, 1.0이 완전 동일)
+    """
+    if img1.shape != img2.shape:
+        raise ValueError(f"이미지 크기가 다릅니다: {img1.shape} != {img2.shape}")
+    
+    if downscale > 1:
+        size = (max(1, img1.shape[1] // downscale), max(1, img1.shape[0] // downscale))
+        img1 = cv2.resize(img1, size, interpolation=cv2.INTER_AREA)
+        img2 = cv2.resize(img2, size, interpolation=cv2.INTER_AREA)
+    
+    if gaussian_weights:
+        win_size = GAUSSIAN_WIN_SIZE
+    if min(img1.shape[:2]) < win_size:
+        raise ValueError(f"이미지가 SSIM 창({win_size})보다 작습니다: {img1.shape}")
+    
+    x = img1.astype(np.float32)
+    y = img2.astype(np.float32)
+    
+    if gaussian_weights:
+        def window(values):
+            return cv2.GaussianBlur(values, (win_size, win_size), GAUSSIAN_SIGMA,
+                                    borderType=cv2.BORDER_REFLECT)
+        cov_norm = 1.0
+    else:
+        def window(values):
+            return cv2.boxFilter(values, -1, (win_size, win_size), normalize=True,
+                                 borderType=cv2.BORDER_REFLECT)
+        num_pixels = win_size * win_size
+        cov_norm = num_pixels / (num_pixels - 1.0)  # 표본 공분산 보정
+    
+    # 원소별 연산도 OpenCV로 처리 (numpy 임시 배열보다 빠름)
+    ux = window(x)
+    uy = window(y)
+    uxx = window(cv2.multiply(x, x))
+    uyy = window(cv2.multiply(y, y))
+    uxy = window(cv2.multiply(x, y))
+    
+    ux_sq = cv2.multiply(ux, ux)
+    uy_sq = cv2.multiply(uy, uy)
+    ux_uy = cv2.multiply(ux, uy)
+    
+    vx = cv2.subtract(uxx, ux_sq)
+    vy = cv2.subtract(uyy, uy_sq)
+    vxy = cv2.subtract(uxy, ux_uy)
+    
+    c1 = (K1 * data_range) ** 2
+    c2 = (K2 * data_range) ** 2
+    
+    # (2*ux*uy + C1) * (2*vxy + C2) / ((ux^2 + uy^2 + C1) * (vx + vy + C2))
+    a1 = cv2.add(cv2.multiply(ux_uy, 2.0), c1)
+    a2 = cv2.add(cv2.multiply(vxy, 2.0 * cov_norm), c2)
+    b1 = cv2.add(cv2.add(ux_sq, uy_sq), c1)
+    b2 = cv2.add(cv2.multiply(cv2.add(vx, vy), cov_norm), c2)
+    ssim_map = cv2.divide(cv2.multiply(a1, a2), cv2.multiply(b1, b2))
+    
+    # 가장자리 창은 반사 패딩의 영향을 받으므로 제외
+    pad = (win_size - 1) // 2
+    return float(ssim_map[pad:-pad, pad:-pad].mean(dtype=np.float64))
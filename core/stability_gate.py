@@ -0,0 +1,143 @@
+"""
+화면 안정화 대기 모듈
+스크롤이나 텍스트 애니메이션 중에는 번역을 미루고 화면이 멈춘 뒤 한 번만 번역
+"""
+
+import time
+from typing import Optional, Union
+import numpy as np
+from core.frame import Frame
+from core.image_processor import ImageProcessor, merge_change_maps
+
+class StabilityGate:
+    """
+    변화 감지 결과를 받아 번역 시점을 결정하는 안정화 게이트
+    
+    변화가 감지되면 안정화 대기 상태가 되고, 이후 연속 stable_frames 프레임 동안
+    변화가 없거나 첫 변화로부터 max_wait초가 지나면 번역을 허용한다.
+    대기 중 감지된 변화 맵은 합쳐 두었다가 번역 시점에 한 번에 넘겨준다.
+    """
+    
+    def __init__(self, stable_frames: int = 2, max_wait: float = 1.5):
+        """
+        Args:
+            stable_frames: 번역 전에 필요한 연속 무변화 프레임 수 (0이면 변화 즉시 번역)
+            max_wait: 화면이 계속 바뀌어도 번역을 강제할 최대 대기 시간 (초)
+        """
+        self.stable_frames = stable_frames
+        self.max_wait = max_wait
+        self.settling = False
+        self.settle_start = 0.0
+        self.stable_count = 0
+        self.pending_change_map: Optional[dict] = None
+        self.stats = {"immediate": 0, "settled": 0, "deadline": 0}
+    
+    def on_change(self, change_map: Optional[dict], now: Optional[float] = None) -> bool:
+        """
+        변화가 감지된 프레임 처리
+        
+        Args:
+            change_map: 직전 프레임 대비 변화 맵 (None이면 전체 변경)
+            now: 현재 시각 (기본값 time.monotonic())
+        
+        Returns:
+            지금 번역해야 하면 True (안정화 비활성 또는 최대 대기 시간 초과)
+        """
+        now = time.monotonic() if now is None else now
+        
+        if not self.settling:
+            self.settling = True
+            self.settle_start = now
+            self.pending_change_map = change_map
+        else:
+            self.pending_change_map = merge_change_maps(self.pending_change_map, change_map)
+        self.stable_count = 0
+        
+        if self.stable_frames <= 0:
+            self.stats["immediate"] += 1
+            return True
+        if now - self.settle_start >= self.max_wait:
+            self.stats["deadline"] += 1
+            return True
+        return False
+    
+    def on_unchanged(self) -> bool:
+        """
+        변화가 없는 프레임 처리 (잡음 수준의 변화 포함)
+        
+        Returns:
+            화면이 안정화되어 지금 번역해야 하면 True
+        """
+        if not self.settling:
+            return False
+        
+        self.stable_count += 1
+        if self.stable_count >= self.stable_frames:
+            self.stats["settled"] += 1
+            return True
+        return False
+    
+    def take_change_map(self) -> Optional[dict]:
+        """
+        대기 중 합쳐 둔 변화 맵을 반환하고 대기 상태 해제
+        
+        Returns:
+            안정화 대기 시작 이후의 누적 변화 맵 (None이면 전체 변경)
+        """
+        change_map = self.pending_change_map
+        self.reset()
+        return change_map
+    
+    def reset(self):
+        """대기 상태 해제"""
+        self.settling = False
+        self.settle_start = 0.0
+        self.stable_count = 0
+        self.pending_change_map = None
+    
+    def get_stats(self) -> dict:
+        """번역 허용 사유별 횟수 반환"""
+        return dict(self.stats)
+
+def decide_translation(image_processor: ImageProcessor, gate: StabilityGate, image: Union[Frame, np.ndarray],
+                       noise_tile_count: int = -1, now: Optional[float] = None) -> dict:
+    """
+    자동 번역의 프레임 판정 (변화 감지 -> 잡음 타일 무시 -> 안정화 대기)
+    
+    자동 번역과 변화 감지 벤치마크가 같은 판정을 쓰도록 한 곳에 모아 둔다.
+    잡음으로 무시한 변화는 기준 프레임을 되돌려 작은 변화가 쌓이면 다음 확인에서 변화로 감지되게 한다.
+    
+    Args:
+        image_processor: 기준 프레임을 보관하는 변화 감지기
+        gate: 안정화 게이트
+        image: 현재 프레임
+        noise_tile_count: 이 개수 이하의 타일 변화는 무시 (-1이면 사용 안 함)
+        now: 현재 시각 (기본값 time.monotonic())
+    
+    Returns:
+        판정 결과
+        - ready: 지금 번역해야 하면 True
+        - skip: 건너뛴 사유 ("noise", "unchanged") 또는 None
+        - changed_tiles: 잡음으로 무시한 변경 타일 수 (skip이 "noise"일 때만)
+        - change_map: 번역할 때 안정화 대기 동안 누적된 변화 맵 (None이면 전체 변경)
+    """
+    decision = {"ready": False, "skip": None, "changed_tiles": None, "change_map": None}
+    if image_processor.has_changed(image):
+        change_map = image_processor.last_change_map
+        if (noise_tile_count >= 0 and change_map is not None
+                and change_map["changed_tiles"] <= noise_tile_count):
+            image_processor.revert_reference()
+            decision["skip"] = "noise"
+            decision["changed_tiles"] = change_map["changed_tiles"]
+            ready = gate.on_unchanged()
+        else:
+            ready = gate.on_change(change_map, now=now)
+    else:
+        ready = gate.on_unchanged()
+        if not ready:
+            decision["skip"] = "unchanged"
+    
+    if ready:
+        decision["ready"] = True
+        decision["change_map"] = gate.take_change_map()
+    return decision
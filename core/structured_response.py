@@ -0,0 +1,132 @@
+"""
+구조화 번역 응답 모듈
+블록별 원문/번역/위치를 담은 JSON 응답 스키마와 검증 파서
+"""
+
+import json
+from typing import List, Optional, Tuple
+
+# Gemini response_schema (bbox는 Gemini 기본 형식인 [ymin, xmin, ymax, xmax], 0 ~ 1000 정규화)
+RESPONSE_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "blocks": {
+            "type": "ARRAY",
+            "items": {
+                "type": "OBJECT",
+                "properties": {
+                    "source": {"type": "STRING"},
+                    "translation": {"type": "STRING"},
+                    "bbox": {"type": "ARRAY", "items": {"type": "NUMBER"}},
+                },
+                "required": ["source", "translation", "bbox"],
+            },
+        },
+    },
+    "required": ["blocks"],
+}
+
+GENERATION_CONFIG = {"response_mime_type": "application/json", "response_schema": RESPONSE_SCHEMA}
+
+BBOX_SCALE = 1000.0
+
+def _parse_bbox(value) -> Optional[Tuple[float, float, float, float]]:
+    """[ymin, xmin, ymax, xmax] (0 ~ 1000)를 (x, y, width, height) (0 ~ 1)로 변환, 잘못된 값이면 None"""
+    if not isinstance(value, list) or len(value) != 4:
+        return None
+    if not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in value):
+        return None
+    y0, x0, y1, x1 = (min(max(v / BBOX_SCALE, 0.0), 1.0) for v in value)
+    if x1 <= x0 or y1 <= y0:
+        return None
+    return x0, y0, x1 - x0, y1 - y0
+
+def parse_structured_response(text: Optional[str]) -> Optional[List[dict]]:
+    """
+    구조화 응답 검증 및 변환
+    
+    Args:
+        text: 모델 응답 (JSON)
+    
+    Returns:
+        블록 목록 [{"source", "translation", "bbox": (x, y, width, height) 또는 None}]
+        또는 None (JSON이 아니거나 번역이 있는 블록이 하나도 없음 - 일반 텍스트로 처리)
+    """
+    if not text:
+        return None
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return None
+    
+    items = data.get("blocks") if isinstance(data, dict) else data
+    if not isinstance(items, list):
+        return None
+    
+    blocks = []
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        translation = item.get("translation")
+        if not isinstance(translation, str) or not translation.strip():
+            continue
+        source = item.get("source")
+        blocks.append({
+            "source": source.strip() if isinstance(source, str) else "",
+            "translation": translation.strip(),
+            "bbox": _parse_bbox(item.get("bbox"))
+        })
+    return blocks or None
+
+def remap_blocks(blocks: List[dict], crop: Optional[Tuple[int, int, int, int]], size: Tuple[int, int]) -> List[dict]:
+    """
+    잘라서 보낸 이미지 기준 bbox를 원본 이미지 기준으로 변환
+    
+    Args:
+        blocks: parse_structured_response() 결과
+        crop: 원본에서 잘라낸 영역 (x, y, width, height) 또는 None (자르지 않음)
+        size: 원본 이미지 크기 (width, height)
+    """
+    if crop is None:
+        return blocks
+    crop_x, crop_y, crop_width, crop_height = crop
+    width, height = size
+    for block in blocks:
+        if block["bbox"] is None:
+            continue
+        x, y, w, h = block["bbox"]
+        block["bbox"] = ((crop_x + x * crop_width) / width, (crop_y + y * crop_height) / height,
+                         w * crop_width / width, h * crop_height / height)
+    return blocks
+
+def line_blocks(lines: List[dict], size: Tuple[int, int], text: str) -> Optional[List[dict]]:
+    """
+    OCR 줄과 번역문 줄을 짝지어 블록 목록 생성
+    
+    Args:
+        lines: OcrEngine.recognize()의 줄 목록 (원본 좌표 bbox)
+        size: 원본 이미지 크기 (width, height)
+        text: 원문 줄 순서대로 번역한 텍스트
+    
+    Returns:
+        parse_structured_response()와 같은 형식의 블록 목록 또는 None (줄 수가 달라 짝지을 수 없음)
+    """
+    translations = text.split("\n")
+    width, height = size
+    if not lines or len(translations) != len(lines) or not width or not height:
+        return None
+    blocks = []
+    for line, translation in zip(lines, translations):
+        if not translation.strip():
+            continue
+        x, y, w, h = line["bbox"]
+        blocks.append({
+            "source": line["text"],
+            "translation": translation.strip(),
+            "bbox": (x / width, y / height, w / width, h / height) if w > 0 and h > 0 else None
+        })
+    return blocks or None
+
+def blocks_to_text(blocks: List[dict]) -> str:
+    """블록 번역을 응답 순서대로 이어 붙인 표시용 텍스트"""
+    return "\n".join(block["translation"] for block in blocks)
@@ -0,0 +1,140 @@
+"""
+텍스트 존재 감지 모듈
+API 호출 전에 빈 배경, 로딩 스피너, 단색 화면처럼 글자가 없는 이미지를 가볍게 걸러냄
+"""
+
+import cv2
+import numpy as np
+from typing import Optional, Tuple, Union
+from core.frame import Frame, to_gray_array
+
+def edge_mask(gray: np.ndarray, edge_threshold: int = 40) -> np.ndarray:
+    """
+    글자 획 경계 마스크 (3x3 형태학적 기울기가 임계값을 넘는 픽셀)
+    
+    부드러운 그라데이션이나 사진의 약한 경계는 제외되고 대비가 강한 획 경계만 남는다.
+    """
+    gradient = cv2.morphologyEx(gray, cv2.MORPH_GRADIENT, np.ones((3, 3), np.uint8))
+    return (gradient > edge_threshold).view(np.uint8)
+
+def find_text_bbox(gray: np.ndarray, margin: int = 8, edge_threshold: int = 40) -> Optional[Tuple[int, int, int, int]]:
+    """
+    글자 윤곽(밝기 경계)이 있는 영역의 경계 상자 계산
+    
+    Args:
+        gray: 그레이스케일 이미지
+        margin: 경계 상자 바깥 여백 (픽셀)
+        edge_threshold: 경계로 볼 형태학적 기울기 최솟값
+    
+    Returns:
+        (x, y, width, height) 또는 None (경계가 없는 경우)
+    """
+    points = cv2.findNonZero(edge_mask(gray, edge_threshold))
+    if points is None:
+        return None
+    
+    x, y, width, height = cv2.boundingRect(points)
+    x0 = max(0, x - margin)
+    y0 = max(0, y - margin)
+    x1 = min(gray.shape[1], x + width + margin)
+    y1 = min(gray.shape[0], y + height + margin)
+    return x0, y0, x1 - x0, y1 - y0
+
+class TextPresenceDetector:
+    """
+    경계 연결 요소 기반 텍스트 존재 감지기
+    
+    획 경계 마스크의 연결 요소 중 글자 크기인 것을 고른 뒤, 같은 줄에 이웃 글자가 있거나
+    (글자 나열) 스스로 가로로 긴 요소(붙어서 하나로 연결된 단어)가 있으면 텍스트로 판정한다.
+    고리 모양 스피너나 흩어진 점, 경계가 약한 영상 프레임은 이 조건을 만족하지 못한다.
+    """
+    
+    MAX_COMPONENTS = 500
+    
+    def __init__(self, edge_threshold: int = 40, min_char_height: int = 5,
+                 max_char_height_ratio: float = 0.5, min_text_components: int = 1):
+        """
+        Args:
+            edge_threshold: 획 경계로 볼 형태학적 기울기 최솟값
+            min_char_height: 글자로 볼 최소 높이 (픽셀)
+            max_char_height_ratio: 글자로 볼 최대 높이 (이미지 높이 대비)
+            min_text_components: 텍스트로 판정할 최소 글자/단어 요소 수
+        """
+        self.edge_threshold = edge_threshold
+        self.min_char_height = min_char_height
+        self.max_char_height_ratio = max_char_height_ratio
+        self.min_text_components = min_text_components
+        self.stats = {"text": 0, "no_text": 0}
+    
+    def detect(self, image: Union[Frame, np.ndarray]) -> dict:
+        """
+        텍스트 존재 여부 분석
+        
+        Args:
+            image: 프레임 또는 RGB/그레이스케일 numpy array
+        
+        Returns:
+            분석 결과
+            - has_text: 텍스트가 있다고 판단되면 True
+            - edge_density: 획 경계 픽셀 비율
+            - components: 글자 크기 연결 요소 수
+            - text_components: 줄 정렬 또는 단어 형태를 만족한 요소 수
+        """
+        gray = to_gray_array(image)
+        mask = edge_mask(gray, self.edge_threshold)
+        edge_density = float(cv2.countNonZero(mask)) / mask.size
+        
+        components = 0
+        text_components = 0
+        if edge_density > 0:
+            _, _, stats, _ = cv2.connectedComponentsWithStats(mask, connectivity=8)
+            boxes = stats[1:, :4]
+            heights = boxes[:, 3]
+            max_height = max(self.min_char_height, gray.shape[0] * self.max_char_height_ratio)
+            boxes = boxes[(heights >= self.min_char_height) & (heights <= max_height) & (boxes[:, 2] >= 2)]
+            components = len(boxes)
+            if components:
+                text_components = self._count_text_components(boxes)
+        
+        has_text = text_components >= self.min_text_components
+        self.stats["text" if has_text else "no_text"] += 1
+        return {
+            "has_text": has_text,
+            "edge_density": edge_density,
+            "components": components,
+            "text_components": text_components
+        }
+    
+    def _count_text_components(self, boxes: np.ndarray) -> int:
+        """같은 줄에 이웃이 있거나 가로로 긴 (단어 형태) 요소 수"""
+        # 요소 쌍 비교는 O(n^2)이므로 요소가 아주 많으면 일부만 검사 (그 정도면 대부분 텍스트)
+        boxes = boxes[:self.MAX_COMPONENTS]
+        x = boxes[:, 0].astype(np.float32)
+        y = boxes[:, 1].astype(np.float32)
+        w = boxes[:, 2].astype(np.float32)
+        h = boxes[:, 3].astype(np.float32)
+        center_y = y + h / 2
+        
+        word_like = w >= h * 2
+        if len(boxes) > 1:
+            # 모든 요소 쌍에 대해 세로 중심 차이와 가로 간격 계산
+            pair_height = np.maximum(h[:, None], h[None, :])
+            same_line = np.abs(center_y[:, None] - center_y[None, :]) < pair_height * 0.5
+            gap = np.maximum(x[:, None], x[None, :]) - np.minimum(x[:, None] + w[:, None], x[None, :] + w[None, :])
+            # 서로 안에 들어가는 요소(고리의 안쪽/바깥쪽 윤곽 등)는 이웃 글자로 보지 않음
+            overlap_limit = -0.3 * np.minimum(w[:, None], w[None, :])
+            close = (gap < pair_height * 1.5) & (gap > overlap_limit)
+            neighbors = same_line & close
+            np.fill_diagonal(neighbors, False)
+            aligned = neighbors.any(axis=1)
+        else:
+            aligned = np.zeros(len(boxes), dtype=bool)
+        return int(np.count_nonzero(aligned | word_like))
+    
+    def has_text(self, image: Union[Frame, np.ndarray]) -> bool:
+        """텍스트 존재 여부만 반환"""
+        return self.detect(image)["has_text"]
+    
+    def get_stats(self) -> dict:
+        """판정 결과별 횟수 반환"""
+        return dict(self.stats)
@@ -0,0 +1,296 @@
+"""
+번역 결과 캐시 모듈
+메모리 LRU와 SQLite 디스크 캐시 2단계로 같은 화면의 번역 결과를 재사용
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+from utils.logger import logger
+
+def make_cache_key(fingerprint: bytes, target_language: str, model_name: str, prompt: str) -> str:
+    """
+    캐시 키 생성
+    
+    Args:
+        fingerprint: 이미지 내용 지문 (업로드 데이터 또는 픽셀 바이트)
+        target_language: 목표 언어
+        model_name: 모델 이름
+        prompt: 번역 프롬프트
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(fingerprint)
+    for part in (target_language, model_name, prompt):
+        digest.update(b"\0")
+        digest.update(part.encode("utf-8"))
+    return digest.hexdigest()
+
+class MemoryCache:
+    """바이트 예산이 있는 메모리 LRU 캐시"""
+    
+    ENTRY_OVERHEAD = 100  # 키와 딕셔너리 항목의 대략적인 부가 크기
+    
+    def __init__(self, max_bytes: int = 4 * 1024 * 1024):
+        """
+        Args:
+            max_bytes: 캐시가 차지할 최대 바이트 (번역문 UTF-8 길이 기준)
+        """
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+    
+    def _entry_size(self, key: str, text: str) -> int:
+        return len(key) + len(text.encode("utf-8")) + self.ENTRY_OVERHEAD
+    
+    def get(self, key: str) -> Optional[str]:
+        text = self._entries.get(key)
+        if text is not None:
+            self._entries.move_to_end(key)
+        return text
+    
+    def put(self, key: str, text: str):
+        if key in self._entries:
+            self.size -= self._entry_size(key, self._entries.pop(key))
+        entry_size = self._entry_size(key, text)
+        if entry_size > self.max_bytes:
+            return
+        self._entries[key] = text
+        self.size += entry_size
+        while self.size > self.max_bytes:
+            old_key, old_text = self._entries.popitem(last=False)
+            self.size -= self._entry_size(old_key, old_text)
+            self.evictions += 1
+    
+    def clear(self):
+        self._entries.clear()
+        self.size = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+class DiskCache:
+    """
+    TTL과 크기 제한이 있는 SQLite 캐시
+    
+    조회 시각 갱신은 조회마다 쓰지 않고 모아 두었다가 저장(put)이나 종료 시 한 번에
+    기록하므로, 캐시 적중은 디스크에 쓰지 않는다.
+    """
+    
+    def __init__(self, path: str, max_bytes: int = 50 * 1024 * 1024, ttl: float = 7 * 24 * 3600):
+        """
+        Args:
+            path: SQLite 파일 경로
+            max_bytes: 저장할 번역문의 최대 총 바이트 (넘으면 오래 사용하지 않은 항목부터 삭제)
+            ttl: 항목 유효 시간 (초, 0이면 만료 없음)
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.evictions = 0
+        self.expirations = 0
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # 번역 워커 스레드에서도 사용하므로 스레드 검사는 끄고 잠금으로 직렬화
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        # WAL + NORMAL: 커밋마다 fsync하지 않음 (캐시이므로 비정상 종료 시 최근 항목 유실은 허용)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            "key TEXT PRIMARY KEY, text TEXT NOT NULL, size INTEGER NOT NULL, "
+            "created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS translations_accessed ON translations (accessed)")
+        self._connection.commit()
+        self.size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM translations").fetchone()[0]
+        self._accessed = {}  # 아직 기록하지 않은 키별 마지막 조회 시각
+    
+    def get(self, key: str) -> Optional[str]:
+        row = self._connection.execute(
+            "SELECT text, created FROM translations WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        
+        text, created = row
+        now = time.time()
+        if self.ttl and now - created > self.ttl:
+            self._delete(key)
+            self.expirations += 1
+            self._connection.commit()
+            return None
+        
+        self._accessed[key] = now
+        return text
+    
+    def _flush_accessed(self):
+        """모아 둔 조회 시각 기록 (커밋은 호출한 쪽에서)"""
+        if self._accessed:
+            self._connection.executemany("UPDATE translations SET accessed = ? WHERE key = ?",
+                                         [(accessed, key) for key, accessed in self._accessed.items()])
+            self._accessed.clear()
+    
+    def put(self, key: str, text: str):
+        size = len(text.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        self._delete(key)
+        self._connection.execute(
+            "INSERT INTO translations (key, text, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+            (key, text, size, now, now))
+        self.size += size
+        # 오래 사용하지 않은 항목부터 지우므로 조회 시각을 먼저 반영
+        self._flush_accessed()
+        self._evict()
+        self._connection.commit()
+    
+    def _delete(self, key: str):
+        self._accessed.pop(key, None)
+        row = self._connection.execute("SELECT size FROM translations WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            self._connection.execute("DELETE FROM translations WHERE key = ?", (key,))
+            self.size -= row[0]
+    
+    def _evict(self):
+        """만료 항목 삭제 후 크기 제한을 넘으면 오래 사용하지 않은 항목부터 삭제"""
+        if self.ttl:
+            cutoff = time.time() - self.ttl
+            count, size = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM translations WHERE created < ?", (cutoff,)).fetchone()
+            if count:
+                self._connection.execute("DELETE FROM translations WHERE created < ?", (cutoff,))
+                self.expirations += count
+                self.size -= size
+        
+        while self.size > self.max_bytes:
+            rows = self._connection.execute(
+                "SELECT key, size FROM translations ORDER BY accessed LIMIT 32").fetchall()
+            if not rows:
+                self.size = 0
+                break
+            for key, size in rows:
+                if self.size <= self.max_bytes:
+                    break
+                self._connection.execute("DELETE FROM translations WHERE key = ?", (key,))
+                self.size -= size
+                self.evictions += 1
+    
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+    
+    def clear(self):
+        self._accessed.clear()
+        self._connection.execute("DELETE FROM translations")
+        self._connection.commit()
+        self.size = 0
+    
+    def close(self):
+        try:
+            self._flush_accessed()
+            self._connection.commit()
+        finally:
+            self._connection.close()
+
+class TranslationCache:
+    """
+    2단계 번역 결과 캐시
+    
+    메모리 LRU를 먼저 조회하고 없으면 SQLite 캐시를 조회한다. 디스크에서 찾은 결과는
+    메모리로 올려 다음 조회를 빠르게 한다. 모든 메서드는 스레드 안전하다.
+    """
+    
+    def __init__(self, memory_bytes: int = 4 * 1024 * 1024, disk_path: Optional[str] = "translation_cache.db",
+                 disk_max_bytes: int = 50 * 1024 * 1024, ttl: float = 7 * 24 * 3600):
+        """
+        Args:
+            memory_bytes: 메모리 캐시 최대 바이트
+            disk_path: SQLite 파일 경로 (None이면 메모리 캐시만 사용)
+            disk_max_bytes: 디스크 캐시 최대 바이트
+            ttl: 디스크 캐시 항목 유효 시간 (초, 0이면 만료 없음)
+        """
+        self._lock = threading.Lock()
+        self.memory = MemoryCache(memory_bytes)
+        self.disk = None
+        if disk_path:
+            try:
+                self.disk = DiskCache(disk_path, disk_max_bytes, ttl)
+            except sqlite3.Error as e:
+                logger.warning(f"디스크 번역 캐시를 열 수 없음 - 메모리 캐시만 사용: {e}")
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+    
+    @classmethod
+    def from_config(cls, cache_config: dict) -> "TranslationCache":
+        """설정(translation.cache)으로 캐시 생성"""
+        return cls(
+            memory_bytes=cache_config.get("memory_bytes", 4 * 1024 * 1024),
+            disk_path=cache_config.get("disk_path", "translation_cache.db") or None,
+            disk_max_bytes=cache_config.get("disk_max_bytes", 50 * 1024 * 1024),
+            ttl=cache_config.get("ttl_hours", 168) * 3600
+        )
+    
+    def get(self, key: str) -> Optional[str]:
+        """캐시된 번역 결과 조회"""
+        with self._lock:
+            text = self.memory.get(key)
+            if text is not None:
+                self.stats["memory_hits"] += 1
+                return text
+            
+            if self.disk is not None:
+                try:
+                    text = self.disk.get(key)
+                except sqlite3.Error as e:
+                    logger.warning(f"디스크 번역 캐시 조회 실패: {e}")
+                    text = None
+                if text is not None:
+                    self.stats["disk_hits"] += 1
+                    self.memory.put(key, text)
+                    return text
+            
+            self.stats["misses"] += 1
+            return None
+    
+    def put(self, key: str, text: str):
+        """번역 결과 저장"""
+        with self._lock:
+            self.memory.put(key, text)
+            if self.disk is not None:
+                try:
+                    self.disk.put(key, text)
+                except sqlite3.Error as e:
+                    logger.warning(f"디스크 번역 캐시 저장 실패: {e}")
+    
+    def clear(self):
+        """모든 단계 초기화"""
+        with self._lock:
+            self.memory.clear()
+            if self.disk is not None:
+                self.disk.clear()
+    
+    def close(self):
+        """디스크 캐시 닫기"""
+        with self._lock:
+            if self.disk is not None:
+                self.disk.close()
+                self.disk = None
+    
+    def get_stats(self) -> dict:
+        """적중/실패/제거 통계 반환"""
+        with self._lock:
+            stats = dict(self.stats)
+            lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+            stats["hit_rate"] = (stats["memory_hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+            stats["memory_entries"] = len(self.memory)
+            stats["memory_bytes"] = self.memory.size
+            stats["memory_evictions"] = self.memory.evictions
+            if self.disk is not None:
+                stats["disk_entries"] = len(self.disk)
+                stats["disk_bytes"] = self.disk.size
+                stats["disk_evictions"] = self.disk.evictions
+                stats["disk_expirations"] = self.disk.expirations
+            return stats
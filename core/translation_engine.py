@@ -6,7 +6,18 @@ Google Gemini API를 사용한 이미지 번역
 import google.generativeai as genai
 from PIL import Image
 import numpy as np
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union, Tuple, Callable
+from core.frame import Frame
+from core.upload_encoder import UploadEncoder, estimate_image_tokens, TOKENS_PER_TILE
+from core.translation_cache import TranslationCache, make_cache_key
+from core.request_scheduler import RequestScheduler
+from core.ocr_engine import OcrEngine
+from core.translation_memory import TranslationMemory
+from core.structured_response import GENERATION_CONFIG, parse_structured_response, remap_blocks, line_blocks, blocks_to_text
+from utils.logger import logger
+
+class StreamInterruptedError(RuntimeError):
+    """응답 조각을 일부 받은 뒤 스트리밍이 끊긴 오류 (이미 표시된 조각이 중복되므로 재시도하지 않음)"""
 
 class TranslationEngine:
     """Gemini API를 사용한 번역 엔진"""
@@ -19,6 +30,12 @@ class TranslationEngine:
         self.api_key = api_key
         self.model_name = "gemini-2.5-flash"
         self.target_language = "ko"
+        self.upload_encoder: Optional[UploadEncoder] = UploadEncoder()
+        self.cache: Optional[TranslationCache] = None
+        self.scheduler: Optional[RequestScheduler] = None
+        self.ocr_engine: Optional[OcrEngine] = None
+        self.translation_memory: Optional[TranslationMemory] = None
+        self.structured_output = False
         
         # Gemini API 설정
         genai.configure(api_key=api_key)
@@ -34,39 +51,349 @@ class TranslationEngine:
         """목표 언어 설정"""
         self.target_language = language
     
-    def numpy_to_pil(self, image_array: np.ndarray) -> Image.Image:
-        """numpy array를 PIL Image로 변환"""
-        return Image.fromarray(image_array.astype(np.uint8))
+    def set_upload_encoder(self, upload_encoder: Optional[UploadEncoder]):
+        """업로드 이미지 인코더 설정 (None이면 PIL 이미지를 그대로 전달)"""
+        self.upload_encoder = upload_encoder
+    
+    def set_cache(self, cache: Optional[TranslationCache]):
+        """번역 결과 캐시 설정 (None이면 항상 API 호출)"""
+        self.cache = cache
+    
+    def set_scheduler(self, scheduler: Optional[RequestScheduler]):
+        """요청 한도/재시도 스케줄러 설정 (None이면 한 번만 바로 호출)"""
+        self.scheduler = scheduler
+    
+    def set_ocr_engine(self, ocr_engine: Optional[OcrEngine]):
+        """로컬 OCR 설정 (인식 신뢰도가 높으면 이미지 대신 텍스트로 번역 요청)"""
+        self.ocr_engine = ocr_engine
+    
+    def set_translation_memory(self, translation_memory: Optional[TranslationMemory]):
+        """줄 단위 번역 메모리 설정 (텍스트 번역 시 새 줄만 요청)"""
+        self.translation_memory = translation_memory
+    
+    def set_structured_output(self, enabled: bool):
+        """이미지 번역을 블록별 원문/번역/위치 JSON으로 요청할지 설정"""
+        self.structured_output = enabled
+    
+    def _image_fingerprint(self, image_part) -> bytes:
+        """요청 이미지 파트의 내용 지문 (인코딩된 데이터 또는 PIL 픽셀 바이트)"""
+        if isinstance(image_part, dict):
+            return image_part["data"]
+        header = f"{image_part.mode}:{image_part.size}".encode("ascii")
+        return header + image_part.tobytes()
+    
+    def prepare_image(self, image: Union[Frame, np.ndarray]):
+        """
+        요청에 넣을 이미지 파트 생성
+        
+        인코더가 있으면 잘라내기/축소/압축한 {"mime_type", "data"} 파트를,
+        없으면 PIL Image를 반환한다 (SDK가 무손실 PNG로 직렬화).
+        """
+        if self.upload_encoder is None:
+            return self.numpy_to_pil(image)
+        
+        image_part = self.upload_encoder.encode(image)
+        stats = self.upload_encoder.last_stats
+        logger.debug(f"업로드 이미지 인코딩: {stats['original_size']} -> {stats['encoded_size']}, "
+                     f"{stats['encoded_bytes'] / 1024:.1f}KB ({stats['format']}), "
+                     f"{stats['encode_ms']:.1f}ms, 예상 토큰 {stats['estimated_tokens']}")
+        return image_part
+    
+    def numpy_to_pil(self, image_array: Union[Frame, np.ndarray]) -> Image.Image:
+        """프레임 또는 numpy array를 PIL Image로 변환"""
+        if isinstance(image_array, Frame):
+            return image_array.to_pil()
+        if image_array.dtype != np.uint8:
+            image_array = image_array.astype(np.uint8)
+        return Image.fromarray(image_array)
+    
+    def default_prompt(self) -> str:
+        """기본 번역 프롬프트"""
+        return f"이 이미지의 모든 텍스트를 {self.target_language}로 번역해주세요. UI 요소나 창 제목은 무시하고 실제 콘텐츠 텍스트만 번역해주세요. 번역 결과만 반환해주세요."
+    
+    def structured_prompt(self) -> str:
+        """구조화 응답용 이미지 번역 프롬프트"""
+        return (f"이 이미지의 텍스트를 의미 단위 블록(문단, 말풍선, 메뉴 항목 등)으로 나누어 각 블록의 원문(source), "
+                f"{self.target_language} 번역(translation), 위치(bbox)를 위에서 아래 순서로 반환해주세요. "
+                f"bbox는 이미지 크기 기준 0~1000으로 정규화한 [ymin, xmin, ymax, xmax]입니다. "
+                f"UI 요소나 창 제목은 무시해주세요.")
     
-    def translate_image(self, image: np.ndarray, prompt: str = None) -> Optional[str]:
+    def default_text_prompt(self) -> str:
+        """텍스트 번역 프롬프트 (원문은 뒤에 붙음)"""
+        return f"다음 텍스트를 {self.target_language}로 번역해주세요. 줄 구분은 그대로 유지하고 번역 결과만 반환해주세요."
+    
+    def recognize_text(self, image: Union[Frame, np.ndarray]) -> Optional[dict]:
+        """
+        로컬 OCR로 글자 인식
+        
+        Returns:
+            신뢰할 만한 OcrEngine.recognize() 결과 또는 None (OCR 미사용, 인식 실패, 신뢰도 부족 - 이미지로 번역)
+        """
+        if self.ocr_engine is None:
+            return None
+        try:
+            result = self.ocr_engine.recognize(image)
+        except Exception as e:
+            logger.warning(f"OCR 실패 - 이미지로 번역: {e}")
+            return None
+        if not result["reliable"]:
+            logger.debug(f"OCR 신뢰도 부족({result['confidence']:.1f}) - 이미지로 번역")
+            return None
+        return result
+    
+    def prepare_text_request(self, text: str, prompt: str = None) -> Tuple[list, Optional[str]]:
+        """
+        텍스트 전용 API 요청 내용과 캐시 키 생성
+        
+        Returns:
+            (generate_content에 넘길 내용, 캐시 키 또는 None)
+        """
+        if prompt is None:
+            prompt = self.default_text_prompt()
+        
+        # 같은 원문이면 화면 모양과 관계없이 캐시 결과를 재사용
+        cache_key = None
+        if self.cache is not None:
+            cache_key = make_cache_key(text.encode("utf-8"), self.target_language, self.model_name, prompt)
+        return [f"{prompt}\n\n{text}"], cache_key
+    
+    def prepare_lines_request(self, plan: dict) -> list:
+        """번역 메모리에 없는 줄만 번호를 붙여 요청하는 내용 생성"""
+        prompt = (f"다음 각 줄을 {self.target_language}로 번역해주세요. 각 줄 앞의 [번호]를 그대로 유지하고 "
+                  f"한 줄에 하나씩 번역 결과만 반환해주세요.")
+        return [f"{prompt}\n\n{TranslationMemory.numbered_text(plan)}"]
+    
+    def prepare_request(self, image: Union[Frame, np.ndarray], prompt: str = None) -> Tuple[list, Optional[str]]:
+        """
+        API 요청 내용과 캐시 키 생성
+        
+        Returns:
+            (generate_content에 넘길 내용, 캐시 키 또는 None)
+        """
+        # 업로드용 이미지 파트 생성
+        image_part = self.prepare_image(image)
+        
+        # 기본 프롬프트 설정 (구조화 모드면 블록 JSON 요청)
+        if prompt is None:
+            prompt = self.structured_prompt() if self.structured_output else self.default_prompt()
+        
+        cache_key = None
+        if self.cache is not None:
+            cache_key = make_cache_key(self._image_fingerprint(image_part),
+                                       self.target_language, self.model_name, prompt)
+        return [prompt, image_part], cache_key
+    
+    def upload_region(self) -> Optional[dict]:
+        """
+        마지막으로 인코딩한 이미지가 원본의 어느 영역인지 (prepare_request() 직후에 호출)
+        
+        Returns:
+            {"crop": (x, y, width, height) 또는 None, "size": (원본 너비, 높이)} 또는 None (인코더 없음)
+        """
+        stats = self.upload_encoder.last_stats if self.upload_encoder else None
+        if stats is None:
+            return None
+        return {"crop": stats["text_bbox"], "size": stats["original_size"]}
+    
+    def make_result(self, text: Optional[str], structured: bool = False,
+                    region: Optional[dict] = None, ocr: Optional[dict] = None) -> Optional[dict]:
+        """
+        응답 텍스트를 번역 결과로 변환
+        
+        Args:
+            text: 응답 텍스트 (구조화 요청이면 JSON)
+            structured: 구조화 요청 여부
+            region: upload_region() 결과 (블록 위치를 원본 이미지 기준으로 변환)
+            ocr: recognize_text() 결과 (OCR 텍스트 번역이면 인식한 줄 위치로 블록 생성)
+        
+        Returns:
+            {"text": 표시용 번역문, "blocks": 블록 목록 또는 None} 또는 None (결과 없음)
+        """
+        if text is None:
+            return None
+        if ocr is not None:
+            return {"text": text, "blocks": line_blocks(ocr["lines"], ocr["size"], text)}
+        if not structured:
+            return {"text": text, "blocks": None}
+        
+        blocks = parse_structured_response(text)
+        if blocks is None:
+            logger.warning("구조화 응답 형식 오류 - 응답을 일반 텍스트로 표시")
+            return {"text": text, "blocks": None}
+        if region is not None:
+            remap_blocks(blocks, region["crop"], region["size"])
+        
+        # 블록의 원문/번역 쌍은 줄 단위 번역 메모리에도 기록
+        if self.translation_memory is not None:
+            for block in blocks:
+                if block["source"]:
+                    self.translation_memory.put(block["source"], block["translation"],
+                                                self.target_language, self.model_name)
+        return {"text": blocks_to_text(blocks), "blocks": blocks}
+    
+    def estimate_tokens(self, contents: list) -> int:
+        """요청 입력 토큰 수 추정 (프롬프트는 4글자당 1토큰, 이미지는 타일 수 기준)"""
+        tokens = 0
+        for part in contents:
+            if isinstance(part, str):
+                tokens += len(part) // 4 + 1
+            elif isinstance(part, dict):
+                # prepare_request()와 같은 스레드에서 직후에 호출해야 인코더의 마지막 통계가 이 이미지의 값
+                stats = self.upload_encoder.last_stats if self.upload_encoder else None
+                tokens += stats["estimated_tokens"] if stats else TOKENS_PER_TILE
+            else:
+                tokens += estimate_image_tokens(*part.size)
+        return tokens
+    
+    def cached_result(self, cache_key: Optional[str]) -> Optional[str]:
+        """같은 이미지/언어/모델/프롬프트로 번역한 적이 있으면 캐시 결과 반환"""
+        if cache_key is None or self.cache is None:
+            return None
+        cached_text = self.cache.get(cache_key)
+        if cached_text is not None:
+            logger.debug("번역 캐시 적중 - API 호출 건너뜀")
+        return cached_text
+    
+    def finish_response(self, text: Optional[str], cache_key: Optional[str],
+                        structured: bool = False) -> Optional[str]:
+        """API 응답 텍스트를 정리해 캐시에 저장 (구조화 응답은 형식이 올바를 때만 저장)"""
+        if not text:
+            return None
+        translated_text = text.strip()
+        if cache_key is not None and self.cache is not None:
+            if structured and parse_structured_response(translated_text) is None:
+                # 형식이 깨진 응답을 저장하면 같은 화면마다 블록 없이 다시 표시되므로 저장하지 않음
+                logger.debug("구조화 응답 형식 오류 - 캐시에 저장하지 않음")
+            else:
+                self.cache.put(cache_key, translated_text)
+        return translated_text
+    
+    @staticmethod
+    def chunk_text(chunk) -> str:
+        """스트리밍 응답 조각의 텍스트 (종료 조각처럼 텍스트가 없으면 빈 문자열)"""
+        try:
+            return chunk.text
+        except ValueError:
+            return ""
+    
+    def _stream_text(self, contents: list, on_partial: Callable[[str], None]) -> str:
+        """스트리밍으로 요청하고 조각마다 on_partial 호출, 전체 텍스트 반환"""
+        chunks = []
+        try:
+            for chunk in self.model.generate_content(contents, stream=True):
+                text = self.chunk_text(chunk)
+                if text:
+                    chunks.append(text)
+                    on_partial(text)
+        except Exception as e:
+            if chunks:
+                raise StreamInterruptedError(f"스트리밍 응답 중단: {e}") from e
+            raise
+        return "".join(chunks)
+    
+    def _call(self, contents: list, on_partial: Optional[Callable[[str], None]], structured: bool = False) -> str:
+        """
+        API 호출 (스케줄러가 있으면 한도 대기 및 일시적 오류 재시도)
+        
+        구조화 요청은 JSON 조각을 보여줄 수 없으므로 스트리밍하지 않는다.
+        """
+        if structured:
+            call = lambda: self.model.generate_content(contents, generation_config=GENERATION_CONFIG).text
+        elif on_partial is None:
+            call = lambda: self.model.generate_content(contents).text
+        else:
+            call = lambda: self._stream_text(contents, on_partial)
+        if self.scheduler is not None:
+            return self.scheduler.run_sync(self.model_name, self.estimate_tokens(contents), call)
+        return call()
+    
+    def _execute(self, contents: list, cache_key: Optional[str],
+                 on_partial: Optional[Callable[[str], None]], structured: bool = False) -> Optional[str]:
+        """캐시 조회 후 API 호출"""
+        cached_text = self.cached_result(cache_key)
+        if cached_text is not None:
+            return cached_text
+        return self.finish_response(self._call(contents, on_partial, structured), cache_key, structured)
+    
+    def _translate_lines(self, text: str, on_partial: Optional[Callable[[str], None]]) -> Optional[str]:
+        """
+        번역 메모리를 사용한 텍스트 번역 (메모리에 없는 줄만 요청)
+        
+        줄 번호가 붙은 응답은 조각으로 보여줄 수 없으므로 줄 요청은 스트리밍하지 않는다.
+        응답에서 줄 번호를 찾지 못하면 전체 텍스트를 한 번에 다시 번역한다.
+        """
+        contents, cache_key = self.prepare_text_request(text)
+        cached_text = self.cached_result(cache_key)
+        if cached_text is not None:
+            return cached_text
+        
+        plan = self.translation_memory.plan(text, self.target_language, self.model_name)
+        if plan["missing"]:
+            logger.debug(f"번역 메모리 - 새 줄 {len(plan['missing'])}개만 요청 (기존 {len(plan['translations'])}개)")
+            response_text = self._call(self.prepare_lines_request(plan), None)
+            if not self.translation_memory.merge(plan, response_text):
+                logger.warning("줄 번역 응답 형식 불일치 - 전체 텍스트로 다시 번역")
+                return self.finish_response(self._call(contents, on_partial), cache_key)
+        return self.finish_response(self.translation_memory.assemble(plan), cache_key)
+    
+    def translate_image(self, image: Union[Frame, np.ndarray], prompt: str = None,
+                        on_partial: Optional[Callable[[str], None]] = None) -> Optional[str]:
         """
         이미지를 번역
         
+        OCR이 설정되어 있고 사용자 정의 프롬프트가 없으면 먼저 로컬에서 글자를 인식해
+        텍스트로 번역하고, 인식 신뢰도가 낮으면 이미지를 보낸다. 구조화 모드의 이미지 요청은
+        블록 JSON을 받아 블록 번역을 이어 붙인 텍스트를 반환한다.
+        
         Args:
-            image: 번역할 이미지 (numpy array)
+            image: 번역할 이미지 (프레임 또는 numpy array)
             prompt: 사용자 정의 프롬프트 (선택사항)
+            on_partial: 지정하면 스트리밍으로 요청하고 응답 조각이 올 때마다 호출
         
         Returns:
             번역된 텍스트 또는 None
         """
         try:
-            # numpy array를 PIL Image로 변환
-            pil_image = self.numpy_to_pil(image)
-            
-            # 기본 프롬프트 설정
-            if prompt is None:
-                prompt = f"이 이미지의 모든 텍스트를 {self.target_language}로 번역해주세요. UI 요소나 창 제목은 무시하고 실제 콘텐츠 텍스트만 번역해주세요. 번역 결과만 반환해주세요."
-            
-            # Gemini API 호출
-            response = self.model.generate_content([prompt, pil_image])
-            
-            if response.text:
-                return response.text.strip()
+            ocr = self.recognize_text(image) if prompt is None else None
+            text = ocr["text"] if ocr is not None else None
+            if text is not None:
+                if self.translation_memory is not None:
+                    return self._translate_lines(text, on_partial)
+                contents, cache_key = self.prepare_text_request(text)
             else:
-                return None
+                contents, cache_key = self.prepare_request(image, prompt)
+                if self.structured_output and prompt is None:
+                    region = self.upload_region()
+                    result = self.make_result(self._execute(contents, cache_key, None, structured=True),
+                                              structured=True, region=region)
+                    return result["text"] if result else None
+            return self._execute(contents, cache_key, on_partial)
                 
         except Exception as e:
-            from utils.logger import logger
+            logger.error(f"번역 엔진 오류: {e}")
+            import traceback
+            logger.error(f"상세 오류: {traceback.format_exc()}")
+            return None
+    
+    def translate_text(self, text: str, prompt: str = None,
+                       on_partial: Optional[Callable[[str], None]] = None) -> Optional[str]:
+        """
+        텍스트를 번역
+        
+        Args:
+            text: 번역할 원문
+            prompt: 사용자 정의 프롬프트 (선택사항, 원문은 뒤에 붙음)
+            on_partial: 지정하면 스트리밍으로 요청하고 응답 조각이 올 때마다 호출
+        
+        Returns:
+            번역된 텍스트 또는 None
+        """
+        try:
+            if self.translation_memory is not None and prompt is None:
+                return self._translate_lines(text, on_partial)
+            contents, cache_key = self.prepare_text_request(text, prompt)
+            return self._execute(contents, cache_key, on_partial)
+        except Exception as e:
             logger.error(f"번역 엔진 오류: {e}")
             import traceback
             logger.error(f"상세 오류: {traceback.format_exc()}")
@@ -132,5 +459,10 @@ class TranslationEngine:
             "model_name": self.model_name,
             "target_language": self.target_language,
             "api_key_set": bool(self.api_key),
+            "upload": self.upload_encoder.get_stats() if self.upload_encoder else None,
+            "cache": self.cache.get_stats() if self.cache else None,
+            "scheduler": self.scheduler.get_stats() if self.scheduler else None,
+            "ocr": self.ocr_engine.get_stats() if self.ocr_engine else None,
+            "translation_memory": self.translation_memory.get_stats() if self.translation_memory else None,
             "supported_languages": list(self.get_supported_languages().keys())
         }
@@ -0,0 +1,136 @@
+"""
+줄 단위 번역 메모리 모듈
+원문 줄별 번역을 기억해 두고 새로 나타난 줄만 번역 요청한 뒤 원래 순서대로 다시 조립
+"""
+
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Optional
+
+NUMBERED_LINE = re.compile(r"^\s*\[(\d+)\]\s?(.*)$")
+
+def normalize_line(text: str) -> str:
+    """메모리 키로 쓸 원문 줄 정규화 (전각/반각 통일, 공백 정리)"""
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+class TranslationMemory:
+    """
+    (정규화한 원문 줄, 목표 언어, 모델) -> 번역 줄 LRU 메모리
+    
+    plan()으로 원문을 줄로 나눠 메모리에 없는 줄을 고르고, 그 줄만 번호를 붙여 번역 요청한
+    응답을 merge()로 메모리에 넣은 뒤, assemble()로 원래 줄 순서대로 번역문을 만든다.
+    채팅 창이나 로그처럼 한 줄씩 늘어나는 화면은 새 줄 하나만 요청하게 된다.
+    """
+    
+    def __init__(self, capacity: int = 5000):
+        """
+        Args:
+            capacity: 기억할 최대 줄 수 (넘으면 오래 사용하지 않은 줄부터 제거)
+        """
+        self.capacity = capacity
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"line_hits": 0, "line_misses": 0, "requests_saved": 0, "parse_failures": 0}
+    
+    def get(self, source: str, target_language: str, model_name: str) -> Optional[str]:
+        """원문 줄의 번역 조회"""
+        key = (normalize_line(source), target_language, model_name)
+        with self._lock:
+            translation = self._entries.get(key)
+            if translation is not None:
+                self._entries.move_to_end(key)
+            return translation
+    
+    def put(self, source: str, translation: str, target_language: str, model_name: str):
+        """원문 줄의 번역 저장 (구조화 응답의 원문/번역 쌍 등)"""
+        key = (normalize_line(source), target_language, model_name)
+        if not key[0]:
+            return
+        with self._lock:
+            self._entries[key] = translation
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+    
+    def plan(self, text: str, target_language: str, model_name: str) -> dict:
+        """
+        원문을 줄로 나누고 메모리에 있는 번역과 없는 줄 구분
+        
+        Returns:
+            번역 계획
+            - keys: 원문 줄별 정규화 키 (빈 줄은 빈 문자열)
+            - translations: 이미 번역된 키 -> 번역
+            - missing: 번역 요청할 키 목록 (중복 제거, 처음 나온 순서)
+            - context: (목표 언어, 모델)
+        """
+        keys = [normalize_line(line) for line in text.split("\n")]
+        translations = {}
+        missing = []
+        for key in keys:
+            if not key or key in translations or key in missing:
+                continue
+            translation = self.get(key, target_language, model_name)
+            if translation is not None:
+                translations[key] = translation
+                self.stats["line_hits"] += 1
+            else:
+                missing.append(key)
+                self.stats["line_misses"] += 1
+        if not missing:
+            self.stats["requests_saved"] += 1
+        return {"keys": keys, "translations": translations, "missing": missing,
+                "context": (target_language, model_name)}
+    
+    @staticmethod
+    def numbered_text(plan: dict) -> str:
+        """번역 요청할 줄을 "[번호] 원문" 형식으로 나열"""
+        return "\n".join(f"[{i + 1}] {line}" for i, line in enumerate(plan["missing"]))
+    
+    def merge(self, plan: dict, response_text: Optional[str]) -> bool:
+        """
+        "[번호] 번역" 형식 응답을 계획과 메모리에 반영
+        
+        Returns:
+            요청한 모든 줄의 번역을 찾았으면 True (하나라도 없으면 아무것도 저장하지 않음)
+        """
+        numbered = {}
+        current = None
+        for line in (response_text or "").split("\n"):
+            match = NUMBERED_LINE.match(line)
+            if match:
+                current = int(match.group(1))
+                numbered[current] = match.group(2).strip()
+            elif current is not None and line.strip():
+                # 번역이 여러 줄로 나뉘어 온 경우 앞 줄에 이어 붙임
+                numbered[current] = f"{numbered[current]} {line.strip()}"
+        
+        missing = plan["missing"]
+        if any(i + 1 not in numbered for i in range(len(missing))):
+            self.stats["parse_failures"] += 1
+            return False
+        
+        target_language, model_name = plan["context"]
+        for i, key in enumerate(missing):
+            plan["translations"][key] = numbered[i + 1]
+            self.put(key, numbered[i + 1], target_language, model_name)
+        return True
+    
+    @staticmethod
+    def assemble(plan: dict) -> str:
+        """원래 줄 순서대로 번역문 조립 (빈 줄은 그대로 유지)"""
+        return "\n".join(plan["translations"][key] if key else "" for key in plan["keys"])
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get_stats(self) -> dict:
+        """줄 적중/실패, 절약한 요청 수 반환"""
+        stats = dict(self.stats)
+        stats["entries"] = len(self._entries)
+        return stats
@@ -0,0 +1,166 @@
+"""
+업로드 이미지 인코딩 모듈
+번역 요청 전에 텍스트 영역 자르기, 축소, 색상 단순화 후 JPEG/WebP로 압축
+"""
+
+import math
+import time
+import cv2
+import numpy as np
+from typing import Optional, Union
+from core.frame import Frame, to_gray_array
+from core.text_detector import find_text_bbox
+
+# Gemini 이미지 토큰 계산 기준 (양 변이 384 이하면 258 토큰, 그보다 크면 768x768 타일당 258 토큰)
+SMALL_IMAGE_SIZE = 384
+TOKEN_TILE_SIZE = 768
+TOKENS_PER_TILE = 258
+
+FORMATS = {
+    "jpeg": (".jpg", "image/jpeg", cv2.IMWRITE_JPEG_QUALITY),
+    "webp": (".webp", "image/webp", cv2.IMWRITE_WEBP_QUALITY),
+    "png": (".png", "image/png", None),
+}
+
+def estimate_image_tokens(width: int, height: int) -> int:
+    """이미지 크기로 Gemini 입력 토큰 수 추정"""
+    if width <= SMALL_IMAGE_SIZE and height <= SMALL_IMAGE_SIZE:
+        return TOKENS_PER_TILE
+    return math.ceil(width / TOKEN_TILE_SIZE) * math.ceil(height / TOKEN_TILE_SIZE) * TOKENS_PER_TILE
+
+class UploadEncoder:
+    """번역 요청용 이미지 인코더"""
+    
+    COLOR_MODES = ("color", "gray", "binary")
+    
+    def __init__(self, image_format: str = "jpeg", quality: int = 85, max_pixels: int = 1500000,
+                 max_tiles: int = 0, color_mode: str = "color", crop_to_text: bool = True):
+        """
+        Args:
+            image_format: 인코딩 형식 ("jpeg", "webp", "png")
+            quality: JPEG/WebP 품질 (1 ~ 100)
+            max_pixels: 최대 픽셀 수 (넘으면 비율을 유지하며 축소, 0이면 제한 없음)
+            max_tiles: 최대 토큰 타일 수 (768x768 타일 기준, 0이면 제한 없음)
+            color_mode: "color", "gray" (그레이스케일), "binary" (Otsu 이진화)
+            crop_to_text: 글자 윤곽이 있는 영역만 잘라서 전송
+        """
+        if image_format not in FORMATS:
+            raise ValueError(f"지원하지 않는 이미지 형식: {image_format}")
+        if color_mode not in self.COLOR_MODES:
+            raise ValueError(f"지원하지 않는 색상 모드: {color_mode}")
+        
+        self.image_format = image_format
+        self.quality = quality
+        self.max_pixels = max_pixels
+        self.max_tiles = max_tiles
+        self.color_mode = color_mode
+        self.crop_to_text = crop_to_text
+        
+        self.last_stats: Optional[dict] = None
+        self.totals = {"requests": 0, "raw_bytes": 0, "encoded_bytes": 0, "encode_ms": 0.0, "estimated_tokens": 0}
+    
+    @classmethod
+    def from_config(cls, upload_config: dict) -> "UploadEncoder":
+        """설정(translation.upload)으로 인코더 생성"""
+        return cls(
+            image_format=upload_config.get("format", "jpeg"),
+            quality=upload_config.get("quality", 85),
+            max_pixels=upload_config.get("max_pixels", 1500000),
+            max_tiles=upload_config.get("max_tiles", 0),
+            color_mode=upload_config.get("color_mode", "color"),
+            crop_to_text=upload_config.get("crop_to_text", True)
+        )
+    
+    def _target_scale(self, width: int, height: int) -> float:
+        """픽셀/토큰 예산에 맞는 축소 배율 계산"""
+        scale = 1.0
+        if self.max_pixels and width * height > self.max_pixels:
+            scale = math.sqrt(self.max_pixels / float(width * height))
+        if self.max_tiles:
+            # 타일 수는 계단 함수이므로 조건을 만족할 때까지 조금씩 축소
+            while scale > 0.05:
+                tiles = (math.ceil(width * scale / TOKEN_TILE_SIZE)
+                         * math.ceil(height * scale / TOKEN_TILE_SIZE))
+                if tiles <= self.max_tiles:
+                    break
+                scale *= 0.9
+        return scale
+    
+    def encode(self, image: Union[Frame, np.ndarray]) -> dict:
+        """
+        이미지를 업로드용으로 인코딩
+        
+        Args:
+            image: 프레임 또는 RGB numpy array
+        
+        Returns:
+            Gemini 요청에 바로 넣을 수 있는 {"mime_type": ..., "data": bytes}
+        """
+        start_time = time.perf_counter()
+        original_height, original_width = to_gray_array(image).shape[:2]
+        
+        # 글자 영역만 자르기
+        bbox = None
+        if self.crop_to_text:
+            bbox = find_text_bbox(to_gray_array(image))
+            if bbox is not None:
+                x, y, width, height = bbox
+                if isinstance(image, Frame):
+                    image = image.crop(x, y, width, height)
+                else:
+                    image = image[y:y + height, x:x + width]
+        
+        # 색상 단순화 (그레이스케일은 프레임에 캐시된 값 재사용)
+        if self.color_mode == "color":
+            if isinstance(image, Frame):
+                pixels = cv2.cvtColor(image.bgra, cv2.COLOR_BGRA2BGR)
+            elif image.ndim == 2:
+                pixels = image
+            else:
+                pixels = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
+        else:
+            pixels = to_gray_array(image)
+        
+        # 픽셀/토큰 예산에 맞게 축소
+        height, width = pixels.shape[:2]
+        scale = self._target_scale(width, height)
+        if scale < 1.0:
+            size = (max(1, int(width * scale)), max(1, int(height * scale)))
+            pixels = cv2.resize(pixels, size, interpolation=cv2.INTER_AREA)
+        
+        # 이진화는 축소 후에 적용 (축소 전에 하면 가는 획이 뭉개짐)
+        if self.color_mode == "binary":
+            _, pixels = cv2.threshold(pixels, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        
+        extension, mime_type, quality_flag = FORMATS[self.image_format]
+        params = [quality_flag, int(self.quality)] if quality_flag is not None else []
+        ok, encoded = cv2.imencode(extension, pixels, params)
+        if not ok:
+            raise RuntimeError(f"이미지 인코딩 실패: {self.image_format}")
+        data = encoded.tobytes()
+        
+        encoded_height, encoded_width = pixels.shape[:2]
+        self.last_stats = {
+            "original_size": (original_width, original_height),
+            "text_bbox": bbox,
+            "encoded_size": (encoded_width, encoded_height),
+            "format": self.image_format,
+            "raw_bytes": original_width * original_height * 3,
+            "encoded_bytes": len(data),
+            "encode_ms": (time.perf_counter() - start_time) * 1000,
+            "estimated_tokens": estimate_image_tokens(encoded_width, encoded_height)
+        }
+        self.totals["requests"] += 1
+        for key in ("raw_bytes", "encoded_bytes", "encode_ms", "estimated_tokens"):
+            self.totals[key] += self.last_stats[key]
+        
+        return {"mime_type": mime_type, "data": data}
+    
+    def get_stats(self) -> dict:
+        """누적 인코딩 통계 반환"""
+        stats = dict(self.totals)
+        requests = stats["requests"]
+        stats["avg_encoded_bytes"] = stats["encoded_bytes"] / requests if requests else 0
+        stats["avg_encode_ms"] = stats["encode_ms"] / requests if requests else 0.0
+        stats["compression_ratio"] = stats["raw_bytes"] / stats["encoded_bytes"] if stats["encoded_bytes"] else 0.0
+        return stats
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+변화 감지 벤치마크
+PIL로 합성한 라벨 프레임 시퀀스를 여러 변화 감지 설정으로 재생하여
+프레임당 CPU 시간, API 호출 수, 절약한 호출 수, 놓친 변화를 JSON 보고서로 기록
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import cv2
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+REPORT_VERSION = 1
+FRAME_INTERVAL = 0.25  # 합성 시퀀스의 프레임 간격 (초)
+WIDTH, HEIGHT = 640, 360
+BACKGROUND = (245, 245, 240)
+FOREGROUND = (25, 25, 30)
+
+SENTENCES = [
+    "The quick brown fox jumps over the lazy dog.",
+    "Press any key to continue your journey.",
+    "Welcome back, traveler. The gate is open.",
+    "Saving your progress, please do not turn off.",
+    "You found a rusty key in the old chest.",
+    "The merchant offers three potions for ten gold.",
+]
+
+# ---------------------------------------------------------------------------
+# 합성 시퀀스
+# 각 프레임은 (BGRA 배열, 라벨) 이며 라벨은 다음 중 하나
+#   - 문자열: 안정된 화면 상태 ID (번역되어야 하는 화면)
+#   - None: 과도 상태 (스크롤/입력/전환 중이거나 글자가 없는 화면, 번역하면 낭비)
+# ---------------------------------------------------------------------------
+
+def load_font(size: int):
+    """PIL 기본 글꼴 (크기 지정이 안 되는 구버전이면 비트맵 글꼴)"""
+    try:
+        return ImageFont.load_default(size=size)
+    except TypeError:
+        return ImageFont.load_default()
+
+FONT = load_font(20)
+
+def render_lines(lines, top: int = 20, caret: bool = False, size=(WIDTH, HEIGHT)) -> np.ndarray:
+    """텍스트 줄을 그린 BGRA 배열 반환"""
+    image = Image.new("RGB", size, BACKGROUND)
+    draw = ImageDraw.Draw(image)
+    y = top
+    for line in lines:
+        draw.text((20, y), line, fill=FOREGROUND, font=FONT)
+        y += 30
+    if caret and lines:
+        x = 20 + int(draw.textlength(lines[-1], font=FONT)) + 2
+        draw.rectangle((x, y - 30, x + 2, y - 10), fill=FOREGROUND)
+    return cv2.cvtColor(np.asarray(image), cv2.COLOR_RGB2BGRA)
+
+def sequence_static(frames: int = 40):
+    """변하지 않는 화면"""
+    image = render_lines(SENTENCES[:4])
+    return [(image, "static")] * frames
+
+def sequence_cursor_blink(frames: int = 40):
+    """같은 텍스트에서 입력 커서만 깜박이는 화면"""
+    on = render_lines(SENTENCES[:3], caret=True)
+    off = render_lines(SENTENCES[:3])
+    return [(on if (i // 2) % 2 == 0 else off, "blink") for i in range(frames)]
+
+def sequence_dialogue(hold: int = 8):
+    """대사가 일정 간격으로 바뀌는 화면"""
+    sequence = []
+    for index, sentence in enumerate(SENTENCES):
+        image = render_lines(["Narrator:", sentence])
+        sequence.extend([(image, f"dialogue-{index}")] * hold)
+    return sequence
+
+def sequence_typing(chars_per_frame: int = 3, hold: int = 8):
+    """글자가 한 번에 몇 자씩 나타나는 타자 효과"""
+    sequence = []
+    for index, sentence in enumerate(SENTENCES[:3]):
+        for length in range(chars_per_frame, len(sentence), chars_per_frame):
+            sequence.append((render_lines([sentence[:length]]), None))
+        image = render_lines([sentence])
+        sequence.extend([(image, f"typing-{index}")] * hold)
+    return sequence
+
+def sequence_scroll(step: int = 24, moves: int = 6, hold: int = 8, pages: int = 4):
+    """긴 문서를 스크롤하는 화면 (이동 중은 과도 상태)"""
+    document_lines = [f"{i + 1:02d}. {SENTENCES[i % len(SENTENCES)]}" for i in range(60)]
+    document = render_lines(document_lines, size=(WIDTH, 60 * 30 + 40))
+    sequence = []
+    offset = 0
+    for page in range(pages):
+        sequence.extend([(document[offset:offset + HEIGHT].copy(), f"scroll-{page}")] * hold)
+        for _ in range(moves):
+            offset += step
+            sequence.append((document[offset:offset + HEIGHT].copy(), None))
+    sequence.extend([(document[offset:offset + HEIGHT].copy(), f"scroll-{pages}")] * hold)
+    return sequence
+
+def sequence_fade(steps: int = 6, hold: int = 8):
+    """두 화면 사이의 페이드 전환"""
+    first = render_lines(SENTENCES[0:2])
+    second = render_lines(SENTENCES[2:4])
+    sequence = [(first, "fade-0")] * hold
+    for step in range(1, steps):
+        alpha = step / float(steps)
+        sequence.append((cv2.addWeighted(first, 1.0 - alpha, second, alpha, 0), None))
+    sequence.extend([(second, "fade-1")] * hold)
+    return sequence
+
+def sequence_loading(frames: int = 24, hold: int = 8):
+    """로딩 스피너가 도는 빈 화면 뒤에 텍스트 표시"""
+    sequence = []
+    for i in range(frames):
+        image = render_lines([])
+        angle = (i * 45) % 360
+        center = (WIDTH // 2, HEIGHT // 2)
+        cv2.ellipse(image, center, (24, 24), angle, 0, 270, (60, 60, 60, 255), 5)
+        sequence.append((image, None))
+    sequence.extend([(render_lines(SENTENCES[4:6]), "loaded")] * hold)
+    return sequence
+
+SEQUENCES = {
+    "static": sequence_static,
+    "cursor_blink": sequence_cursor_blink,
+    "dialogue": sequence_dialogue,
+    "typing": sequence_typing,
+    "scroll": sequence_scroll,
+    "fade": sequence_fade,
+    "loading": sequence_loading,
+}
+
+# ---------------------------------------------------------------------------
+# 변화 감지 설정
+# ---------------------------------------------------------------------------
+
+class LegacySSIMDetector:
+    """기존 방식: 직전 기준 프레임과 그레이스케일 SSIM 비교"""
+    
+    def __init__(self, threshold: float):
+        from core.image_processor import ImageProcessor
+        self.processor = ImageProcessor(threshold=threshold)
+        self.threshold = threshold
+        self.reference = None
+    
+    def process(self, frame, now: float) -> bool:
+        gray = frame.gray
+        if self.reference is None or self.reference.shape != gray.shape:
+            self.reference = gray.copy()
+            return True
+        if self.processor.calculate_gray_similarity(self.reference, gray) < self.threshold:
+            self.reference = gray.copy()
+            return True
+        return False
+
+class PixelDiffDetector:
+    """픽셀 차이 비율 비교 (ImageProcessor.calculate_pixel_difference)"""
+    
+    def __init__(self, threshold: float):
+        from core.image_processor import ImageProcessor
+        self.processor = ImageProcessor()
+        self.threshold = threshold
+        self.reference = None
+    
+    def process(self, frame, now: float) -> bool:
+        gray = frame.gray
+        if self.reference is None or self.reference.shape != gray.shape:
+            self.reference = gray.copy()
+            return True
+        if self.processor.calculate_pixel_difference(self.reference, gray) > self.threshold:
+            self.reference = gray.copy()
+            return True
+        return False
+
+class PipelineDetector:
+    """
+    현재 자동 번역 파이프라인과 같은 순서의 판정
+    (단계별 변화 감지 -> 잡음 타일 무시 -> 안정화 대기 -> 글자 없는 화면 건너뛰기)
+    """
+    
+    def __init__(self, noise_tile_count: int = -1, stable_frames: int = -1, text_check: bool = False):
+        """
+        Args:
+            noise_tile_count: 이 개수 이하의 타일 변화는 무시 (-1이면 사용 안 함)
+            stable_frames: 안정화 대기 프레임 수 (-1이면 사용 안 함)
+            text_check: 글자 없는 화면 건너뛰기 사용 여부
+        """
+        from core.image_processor import ImageProcessor
+        from core.stability_gate import StabilityGate
+        from core.text_detector import TextPresenceDetector
+        self.processor = ImageProcessor()
+        self.noise_tile_count = noise_tile_count
+        # 안정화를 쓰지 않으면 변화 즉시 번역하는 게이트 (자동 번역과 같은 판정 경로 사용)
+        self.gate = StabilityGate(stable_frames=max(stable_frames, 0))
+        self.text_detector = TextPresenceDetector() if text_check else None
+    
+    def process(self, frame, now: float) -> bool:
+        from core.stability_gate import decide_translation
+        changed = decide_translation(self.processor, self.gate, frame, self.noise_tile_count, now=now)["ready"]
+        if changed and self.text_detector is not None:
+            changed = self.text_detector.has_text(frame)
+        return changed
+
+def build_detectors(ssim_thresholds, pixel_thresholds) -> dict:
+    """이름 -> 감지기 생성 함수"""
+    detectors = {}
+    for threshold in ssim_thresholds:
+        detectors[f"legacy_ssim@{threshold}"] = lambda t=threshold: LegacySSIMDetector(t)
+    for threshold in pixel_thresholds:
+        detectors[f"pixel_diff@{threshold}"] = lambda t=threshold: PixelDiffDetector(t)
+    detectors["cascade"] = lambda: PipelineDetector()
+    detectors["cascade+tiles"] = lambda: PipelineDetector(noise_tile_count=1)
+    detectors["cascade+tiles+gate"] = lambda: PipelineDetector(noise_tile_count=1, stable_frames=2)
+    detectors["cascade+tiles+gate+text"] = lambda: PipelineDetector(noise_tile_count=1, stable_frames=2,
+                                                                    text_check=True)
+    return detectors
+
+# ---------------------------------------------------------------------------
+# 실행 및 집계
+# ---------------------------------------------------------------------------
+
+def run_sequence(detector, sequence) -> dict:
+    """
+    시퀀스 하나를 감지기로 재생하고 지표 계산
+    
+    - calls: 감지기가 번역(API 호출)을 요청한 프레임 수
+    - calls_avoided: 호출하지 않은 프레임 수
+    - ideal_calls: 번역되어야 하는 안정 화면 상태 수
+    - missed_changes: 화면에 떠 있는 동안 한 번도 호출되지 않은 안정 상태 수
+    - wasted_calls: 과도 상태에서의 호출 또는 이미 번역한 상태의 중복 호출 수
+    """
+    from core.frame import Frame
+    
+    times = []
+    calls = 0
+    wasted = 0
+    translated_states = set()
+    states = []
+    current_state = None
+    for index, (bgra, label) in enumerate(sequence):
+        # 캡처마다 새 프레임이 들어오는 것처럼 캐시 없는 프레임으로 감싼다
+        frame = Frame(bgra, index * FRAME_INTERVAL)
+        start = time.perf_counter()
+        call = detector.process(frame, index * FRAME_INTERVAL)
+        times.append((time.perf_counter() - start) * 1000)
+        
+        if label is not None and label != current_state:
+            states.append(label)
+        current_state = label
+        
+        if call:
+            calls += 1
+            if label is None or label in translated_states:
+                wasted += 1
+            else:
+                translated_states.add(label)
+    
+    times = np.asarray(times)
+    return {
+        "frames": len(sequence),
+        "calls": calls,
+        "calls_avoided": len(sequence) - calls,
+        "ideal_calls": len(set(states)),
+        "missed_changes": len(set(states) - translated_states),
+        "wasted_calls": wasted,
+        "ms_per_frame": round(float(times.mean()), 3),
+        "ms_p95": round(float(np.percentile(times, 95)), 3),
+    }
+
+def summarize(results: dict) -> dict:
+    """감지기별 전체 시퀀스 합계"""
+    summary = {}
+    for name, per_sequence in results.items():
+        totals = {key: 0 for key in ("frames", "calls", "calls_avoided", "ideal_calls",
+                                     "missed_changes", "wasted_calls")}
+        weighted_ms = 0.0
+        for metrics in per_sequence.values():
+            for key in totals:
+                totals[key] += metrics[key]
+            weighted_ms += metrics["ms_per_frame"] * metrics["frames"]
+        totals["ms_per_frame"] = round(weighted_ms / totals["frames"], 3) if totals["frames"] else 0.0
+        summary[name] = totals
+    return summary
+
+def main():
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description="변화 감지 벤치마크")
+    parser.add_argument("--output", default=None, help="JSON 보고서 경로 (기본값: 저장하지 않음)")
+    parser.add_argument("--sequences", nargs="*", default=list(SEQUENCES), help="실행할 시퀀스 이름")
+    parser.add_argument("--detectors", nargs="*", default=None, help="실행할 감지기 이름 (기본값: 전체)")
+    parser.add_argument("--ssim-thresholds", type=float, nargs="*", default=[0.95, 0.98],
+                        help="기존 SSIM 방식 임계값 목록")
+    parser.add_argument("--pixel-thresholds", type=float, nargs="*", default=[0.001, 0.01],
+                        help="픽셀 차이 방식 임계값 목록 (변경 픽셀 비율)")
+    args = parser.parse_args()
+    
+    # 프레임마다 남는 변화 감지 로그가 측정 시간에 섞이지 않도록 경고 이상만 출력
+    import logging
+    from utils.logger import logger
+    logger.logger.setLevel(logging.WARNING)
+    
+    detectors = build_detectors(args.ssim_thresholds, args.pixel_thresholds)
+    if args.detectors:
+        unknown = set(args.detectors) - set(detectors)
+        if unknown:
+            parser.error(f"알 수 없는 감지기: {', '.join(sorted(unknown))} (사용 가능: {', '.join(detectors)})")
+        detectors = {name: detectors[name] for name in args.detectors}
+    
+    print("시퀀스 생성 중...")
+    sequences = {name: SEQUENCES[name]() for name in args.sequences}
+    
+    results = {}
+    for detector_name, factory in detectors.items():
+        results[detector_name] = {}
+        for sequence_name, sequence in sequences.items():
+            results[detector_name][sequence_name] = run_sequence(factory(), sequence)
+    
+    summary = summarize(results)
+    report = {
+        "version": REPORT_VERSION,
+        "frame_size": [WIDTH, HEIGHT],
+        "frame_interval": FRAME_INTERVAL,
+        "sequences": {name: len(sequence) for name, sequence in sequences.items()},
+        "summary": summary,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False, sort_keys=True)
+    
+    print(f"\n=== 변화 감지 벤치마크 ({sum(report['sequences'].values())} 프레임) ===")
+    print(f"{'감지기':28s} {'호출':>6s} {'절약':>6s} {'이상적':>6s} {'놓침':>6s} {'낭비':>6s} {'ms/frame':>9s}")
+    for name, totals in summary.items():
+        print(f"{name:28s} {totals['calls']:6d} {totals['calls_avoided']:6d} {totals['ideal_calls']:6d} "
+              f"{totals['missed_changes']:6d} {totals['wasted_calls']:6d} {totals['ms_per_frame']:9.3f}")
+    if args.output:
+        print(f"\n보고서 저장: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+세션 녹화/재생 도구
+실제 화면 영역을 한 번 녹화해 두고 디스플레이 없이 최대 속도로 재생하여
+변화 감지 파이프라인 성능을 재현 가능하게 측정
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+def record(args):
+    """실시간 화면 영역을 세션 파일로 녹화"""
+    from core.screen_capture import ScreenCapture
+    from core.frame_source import LiveFrameSource, FrameRecorder
+    
+    screen_capture = ScreenCapture()
+    source = LiveFrameSource(screen_capture, (args.x, args.y, args.width, args.height))
+    recorder = FrameRecorder(args.session)
+    
+    print(f"녹화 시작: {args.duration}초, 간격 {args.interval}초 -> {args.session}")
+    try:
+        end_time = time.time() + args.duration
+        while time.time() < end_time:
+            frame = source.read()
+            if frame is not None:
+                recorder.write(frame)
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        print("녹화 중단")
+    finally:
+        recorder.close()
+        screen_capture.close()
+    
+    print(f"녹화 완료: {len(recorder.timestamps)} 프레임")
+
+def replay(args):
+    """녹화 세션 또는 이미지/동영상을 변화 감지기로 재생"""
+    from core.frame_source import RecordedFrameSource, ImageFrameSource
+    from core.image_processor import ImageProcessor
+    
+    path = Path(args.session)
+    if Path(f"{path}.frames.npy").exists():
+        source = RecordedFrameSource(str(path), realtime=args.realtime)
+    else:
+        source = ImageFrameSource(str(path))
+    
+    processor = ImageProcessor(threshold=args.threshold)
+    try:
+        stats = processor.process_source(source, args.max_frames)
+    finally:
+        source.close()
+    
+    print(json.dumps(stats, indent=2, ensure_ascii=False))
+
+def main():
+    """명령행 인자 처리"""
+    parser = argparse.ArgumentParser(description="세션 녹화/재생 도구")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    record_parser = subparsers.add_parser("record", help="화면 영역 녹화")
+    record_parser.add_argument("session", help="세션 경로 (확장자 제외)")
+    record_parser.add_argument("--x", type=int, default=0)
+    record_parser.add_argument("--y", type=int, default=0)
+    record_parser.add_argument("--width", type=int, default=800)
+    record_parser.add_argument("--height", type=int, default=600)
+    record_parser.add_argument("--duration", type=float, default=30.0, help="녹화 시간 (초)")
+    record_parser.add_argument("--interval", type=float, default=0.25, help="캡처 간격 (초)")
+    record_parser.set_defaults(func=record)
+    
+    replay_parser = subparsers.add_parser("replay", help="세션 재생 및 변화 감지 측정")
+    replay_parser.add_argument("session", help="세션 경로, 이미지 디렉터리 또는 동영상 파일")
+    replay_parser.add_argument("--threshold", type=float, default=0.95, help="변화 감지 임계값")
+    replay_parser.add_argument("--max-frames", type=int, default=None, help="처리할 최대 프레임 수")
+    replay_parser.add_argument("--realtime", action="store_true", help="녹화 당시 간격대로 재생")
+    replay_parser.set_defaults(func=replay)
+    
+    args = parser.parse_args()
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+SSIM 구현 검증
+core.ssim의 OpenCV 기반 SSIM이 scikit-image 결과와 일치하는지, 얼마나 빠른지 확인
+(scikit-image는 이 검증에만 필요: pip install scikit-image)
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+TOLERANCE = 1e-5
+
+def make_cases():
+    """비교할 이미지 쌍 생성"""
+    import cv2
+    import numpy as np
+    
+    rng = np.random.default_rng(0)
+    base = rng.integers(0, 256, (480, 640), dtype=np.uint8)
+    noisy = np.clip(base.astype(np.int16) + rng.integers(-25, 26, base.shape), 0, 255).astype(np.uint8)
+    blurred = cv2.GaussianBlur(base, (5, 5), 2)
+    
+    text = np.full((200, 300), 255, dtype=np.uint8)
+    cv2.putText(text, "AIsCopy", (20, 110), cv2.FONT_HERSHEY_SIMPLEX, 2, 0, 3)
+    text_changed = text.copy()
+    cv2.putText(text_changed, "!", (260, 110), cv2.FONT_HERSHEY_SIMPLEX, 2, 0, 3)
+    
+    return [
+        ("동일 이미지", base, base),
+        ("잡음 추가", base, noisy),
+        ("블러", base, blurred),
+        ("단색 대비", blurred, np.full_like(blurred, 128)),
+        ("텍스트 변경", text, text_changed),
+    ]
+
+def main():
+    """검증 실행"""
+    try:
+        from skimage.metrics import structural_similarity as skimage_ssim
+    except ImportError:
+        print("scikit-image가 설치되지 않았습니다: pip install scikit-image")
+        sys.exit(1)
+    
+    from core.ssim import structural_similarity
+    
+    print("=== SSIM 일치 검증 ===")
+    failed = False
+    for name, img1, img2 in make_cases():
+        for gaussian in (False, True):
+            if gaussian:
+                expected = skimage_ssim(img1, img2, gaussian_weights=True, sigma=1.5,
+                                        use_sample_covariance=False, data_range=255)
+            else:
+                expected = skimage_ssim(img1, img2, data_range=255)
+            actual = structural_similarity(img1, img2, gaussian_weights=gaussian)
+            error = abs(expected - actual)
+            ok = error <= TOLERANCE
+            failed |= not ok
+            mode = "가우시안" if gaussian else "균일"
+            print(f"{'✓' if ok else '✗'} {name} ({mode}): skimage={expected:.6f}, opencv={actual:.6f}, 오차={error:.2e}")
+    
+    print("\n=== 속도 비교 (1920x1080) ===")
+    import numpy as np
+    rng = np.random.default_rng(1)
+    img1 = rng.integers(0, 256, (1080, 1920), dtype=np.uint8)
+    img2 = np.clip(img1.astype(np.int16) + rng.integers(-10, 11, img1.shape), 0, 255).astype(np.uint8)
+    
+    for name, func in (("skimage", lambda: skimage_ssim(img1, img2, data_range=255)),
+                       ("opencv", lambda: structural_similarity(img1, img2)),
+                       ("opencv 1/2 축소", lambda: structural_similarity(img1, img2, downscale=2))):
+        start = time.perf_counter()
+        for _ in range(5):
+            func()
+        print(f"{name:16s}: {(time.perf_counter() - start) / 5 * 1000:8.2f} ms")
+    
+    if failed:
+        print("\n일치 검증 실패")
+        sys.exit(1)
+    print("\n일치 검증 통과")
+
+if __name__ == "__main__":
+    main()
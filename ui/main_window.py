@@ -5,37 +5,68 @@
 
 from PySide6.QtWidgets import (QMainWindow, QVBoxLayout, QHBoxLayout, QWidget,
                                QLabel, QPushButton, QMessageBox, QApplication, QDialog)
-from PySide6.QtCore import Qt, QTimer, Signal, QThread
+from PySide6.QtCore import Qt, QTimer, Signal, QObject
 from PySide6.QtGui import QFont
 
 from utils.config_manager import ConfigManager
 from utils.hotkey_manager import HotkeyManager
 from utils.logger import logger
 from core.screen_capture import ScreenCapture
+from core.capture_service import CaptureService
+from core.frame_source import create_frame_source
 from core.image_processor import ImageProcessor
 from core.translation_engine import TranslationEngine
-from ui.overlay_windows import SourceWindow, OutputWindow
+from core.async_translation_engine import AsyncTranslationEngine
+from core.request_slot import LatestRequestSlot
+from core.upload_encoder import UploadEncoder
+from core.translation_cache import TranslationCache
+from core.request_scheduler import RequestScheduler, DEFAULT_QUOTAS
+from core.ocr_engine import OcrEngine
+from core.translation_memory import TranslationMemory
+from core.phash_index import PerceptualHashIndex
+from core.stability_gate import StabilityGate, decide_translation
+from core.scroll_stitcher import ScrollStitcher
+from core.text_detector import TextPresenceDetector
+from ui.overlay_windows import SourceWindow, OutputWindow, TranslationLayer
 from ui.settings_dialog import SettingsDialog
 
-class TranslationWorker(QThread):
-    """번역 작업을 위한 별도 스레드"""
-    translation_completed = Signal(str)
-    translation_failed = Signal(str)
+class TranslationBridge(QObject):
+    """비동기 번역 결과를 GUI 스레드로 전달하는 시그널 중계"""
+    translation_completed = Signal(object, str)
+    translation_failed = Signal(object, str)
+    translation_cancelled = Signal(object)
+    translation_partial = Signal(object, str)
     
-    def __init__(self, translation_engine, image):
-        super().__init__()
-        self.translation_engine = translation_engine
-        self.image = image
+    def watch(self, future, request):
+        """
+        요청 Future 완료 시 결과를 시그널로 전달
+        
+        Args:
+            future: AsyncTranslationEngine.submit()이 돌려준 Future
+            request: 완료 처리에 필요한 요청 정보 (요청 번호, 화면 서명, 스크롤 구간)
+        """
+        # 콜백은 이벤트 루프 스레드에서 실행되며, 시그널은 큐 연결로 GUI 스레드에 전달됨
+        future.add_done_callback(lambda done: self._deliver(done, request))
     
-    def run(self):
-        try:
-            translated_text = self.translation_engine.translate_image(self.image)
-            if translated_text:
-                self.translation_completed.emit(translated_text)
-            else:
-                self.translation_failed.emit("번역 결과가 없습니다.")
-        except Exception as e:
-            self.translation_failed.emit(f"번역 오류: {str(e)}")
+    def partial_callback(self, request):
+        """스트리밍 응답 조각을 시그널로 전달하는 콜백 (이벤트 루프 스레드에서 호출됨)"""
+        return lambda chunk: self.translation_partial.emit(request, chunk)
+    
+    def _deliver(self, future, request):
+        if future.cancelled():
+            self.translation_cancelled.emit(request)
+            return
+        error = future.exception()
+        if error is not None:
+            self.translation_failed.emit(request, f"번역 오류: {str(error)}")
+            return
+        result = future.result()
+        if result and result["text"]:
+            # 구조화 모드의 블록 목록은 요청 정보에 담아 전달
+            request["blocks"] = result["blocks"]
+            self.translation_completed.emit(request, result["text"])
+        else:
+            self.translation_failed.emit(request, "번역 결과가 없습니다.")
 
 class MainWindow(QMainWindow):
     """메인 윈도우 클래스"""
@@ -51,27 +82,62 @@ class MainWindow(QMainWindow):
             
             # 핵심 모듈들
             self.screen_capture = ScreenCapture()
+            self.frame_source = None
+            self.capture_service = None
             logger.info("화면 캡처 모듈 초기화 완료")
             
             self.image_processor = ImageProcessor()
+            self.screen_index = PerceptualHashIndex()
+            self.stability_gate = StabilityGate()
+            self.scroll_stitcher = ScrollStitcher(self.image_processor)
+            self.text_detector = TextPresenceDetector()
             logger.info("이미지 처리 모듈 초기화 완료")
             
             self.translation_engine = None
+            self.translation_cache = None
+            self.request_scheduler = None
+            self.translation_memory = None
+            self.async_engine = None
+            self.translation_bridge = TranslationBridge()
+            self.translation_bridge.translation_completed.connect(self.on_translation_completed)
+            self.translation_bridge.translation_failed.connect(self.on_translation_failed)
+            self.translation_bridge.translation_cancelled.connect(self.on_translation_cancelled)
+            self.translation_bridge.translation_partial.connect(self.on_translation_partial)
+            self.request_slots = LatestRequestSlot()
             self.hotkey_manager = HotkeyManager()
             logger.info("단축키 관리 모듈 초기화 완료")
             
             # 오버레이 창들
             self.source_window = None
             self.output_window = None
+            self.translation_layer = None  # 겹쳐 보기 모드에서 번역 대상 영역 위에 결과를 그리는 레이어
+            
+            # 번역 시작과 설정 변경 때만 갱신하는 설정 (캡처마다 설정 파일을 다시 읽지 않음)
+            self.config = None
             
             # 타이머
             self.capture_timer = QTimer()
             self.capture_timer.timeout.connect(self.capture_and_translate)
             
+            # 화면 안정화 대기 중 추가 확인용 타이머 (캡처 간격보다 짧게 한 번씩 실행)
+            self.settle_timer = QTimer()
+            self.settle_timer.setSingleShot(True)
+            self.settle_timer.timeout.connect(self.capture_and_translate)
+            self.settle_check_interval = 250
+            
+            # 창 위치는 변경 여부만 기록해 두었다가 드래그가 끝나거나 잠시 멈추면 한 번만 저장
+            self.window_geometry_timer = QTimer()
+            self.window_geometry_timer.setSingleShot(True)
+            self.window_geometry_timer.timeout.connect(self.save_window_positions)
+            self.window_geometry_save_delay = 1000
+            self.window_geometry_dirty = False
+            
             # 상태
             self.is_running = False
             self.click_through_mode = False
-            self.translation_worker = None
+            self.skip_counts = {}
+            self.streaming = True
+            self.streaming_request_id = None  # 출력 창에 중간 결과를 표시 중인 요청
             
             # 번역 엔진 초기화 시도
             self.initialize_translation_engine()
@@ -106,6 +172,12 @@ class MainWindow(QMainWindow):
                 
                 model = config.get("translation", {}).get("model", "gemini-2.5-flash")
                 self.translation_engine.set_model(model)
+                self.translation_engine.set_structured_output(self._structured_output_enabled(config))
+                self._configure_upload_encoder(config)
+                self._configure_translation_cache(config)
+                self._configure_request_scheduler(config)
+                self._configure_ocr(config)
+                self._configure_async_engine(config)
                 logger.info(f"번역 엔진 초기화 완료 - 언어: {target_lang}, 모델: {model}")
             else:
                 logger.warning("API 키가 설정되지 않음 - 번역 엔진 초기화 건너뜀")
@@ -115,6 +187,76 @@ class MainWindow(QMainWindow):
             logger.error(f"번역 엔진 초기화 실패: {e}")
             self.translation_engine = None
     
+    def _structured_output_enabled(self, config) -> bool:
+        """구조화 응답 사용 여부 (겹쳐 보기 모드는 블록 위치가 필요하므로 항상 사용)"""
+        return (config.get("translation", {}).get("structured_output", False)
+                or config.get("ui", {}).get("render_mode", "window") == "inplace")
+    
+    def _configure_upload_encoder(self, config):
+        """업로드 이미지 인코딩 설정 적용 (비활성화 시 PIL 이미지를 그대로 전송)"""
+        upload_config = config.get("translation", {}).get("upload", {})
+        if upload_config.get("enabled", True):
+            self.translation_engine.set_upload_encoder(UploadEncoder.from_config(upload_config))
+        else:
+            self.translation_engine.set_upload_encoder(None)
+    
+    def _configure_translation_cache(self, config):
+        """번역 결과 캐시 연결 (엔진을 다시 만들어도 같은 캐시를 계속 사용)"""
+        cache_config = config.get("translation", {}).get("cache", {})
+        if not cache_config.get("enabled", True):
+            self.translation_engine.set_cache(None)
+            return
+        if self.translation_cache is None:
+            self.translation_cache = TranslationCache.from_config(cache_config)
+        self.translation_engine.set_cache(self.translation_cache)
+    
+    def _configure_request_scheduler(self, config):
+        """요청 한도 스케줄러 연결 (엔진을 다시 만들어도 버킷 상태를 유지)"""
+        quota_config = config.get("translation", {}).get("quota", {})
+        if not quota_config.get("enabled", True):
+            self.translation_engine.set_scheduler(None)
+            return
+        if self.request_scheduler is None:
+            self.request_scheduler = RequestScheduler.from_config(quota_config)
+        else:
+            quotas = quota_config.get("models", DEFAULT_QUOTAS)
+            if quotas != self.request_scheduler.quotas:
+                self.request_scheduler.set_quotas(quotas)
+            self.request_scheduler.max_retries = quota_config.get("max_retries", 3)
+        self.translation_engine.set_scheduler(self.request_scheduler)
+    
+    def _configure_ocr(self, config):
+        """로컬 OCR 설정 적용 (pytesseract나 Tesseract가 없으면 이미지 번역만 사용)"""
+        # 줄 단위 번역 메모리는 OCR 텍스트에만 쓰이며 엔진을 다시 만들어도 계속 사용
+        memory_config = config.get("translation", {}).get("line_memory", {})
+        if memory_config.get("enabled", True):
+            if self.translation_memory is None:
+                self.translation_memory = TranslationMemory(memory_config.get("capacity", 5000))
+            self.translation_engine.set_translation_memory(self.translation_memory)
+        else:
+            self.translation_engine.set_translation_memory(None)
+        
+        ocr_config = config.get("translation", {}).get("ocr", {})
+        if not ocr_config.get("enabled", False):
+            self.translation_engine.set_ocr_engine(None)
+            return
+        if not OcrEngine.is_available():
+            logger.warning("OCR을 사용할 수 없음 (pytesseract와 Tesseract 설치 필요) - 이미지로 번역")
+            self.translation_engine.set_ocr_engine(None)
+            return
+        self.translation_engine.set_ocr_engine(OcrEngine.from_config(ocr_config))
+        logger.info(f"로컬 OCR 사용 - 언어: {ocr_config.get('languages', 'eng')}")
+    
+    def _configure_async_engine(self, config):
+        """비동기 번역 엔진 연결 (이벤트 루프 스레드는 하나를 계속 사용)"""
+        max_in_flight = config.get("translation", {}).get("max_in_flight", 2)
+        self.streaming = config.get("translation", {}).get("streaming", True)
+        if self.async_engine is None:
+            self.async_engine = AsyncTranslationEngine(self.translation_engine, max_in_flight)
+        else:
+            self.async_engine.set_engine(self.translation_engine)
+            self.async_engine.set_max_in_flight(max_in_flight)
+    
     def show_initial_setup(self):
         """초기 설정 화면 표시"""
         self.setWindowTitle("AIsCopy - 초기 설정")
@@ -266,12 +408,17 @@ class MainWindow(QMainWindow):
             if self.capture_timer.isActive():
                 self.capture_timer.stop()
                 logger.info("설정창 열기 - 번역 중지")
+            self.settle_timer.stop()
+            self.stability_gate.reset()
+            if self.capture_service:
+                self.capture_service.set_paused(True)
             
-            # 번역 워커 중지
-            if self.translation_worker and self.translation_worker.isRunning():
-                self.translation_worker.terminate()
-                self.translation_worker.wait()
-                logger.info("설정창 열기 - 번역 워커 중지")
+            # 진행 중인 번역 요청 취소
+            self.request_slots.clear()
+            if self.async_engine:
+                cancelled = self.async_engine.cancel_all()
+                if cancelled:
+                    logger.info(f"설정창 열기 - 번역 요청 {cancelled}개 취소")
             
             # 오버레이 창 숨기기
             if self.source_window:
@@ -280,6 +427,8 @@ class MainWindow(QMainWindow):
             if self.output_window:
                 self.output_window.hide()
                 logger.info("설정창 열기 - 번역 출력 창 숨김")
+            if self.translation_layer:
+                self.translation_layer.hide()
             
             dialog = SettingsDialog(self.config_manager, self)
             dialog.settings_changed.connect(self.on_settings_changed)
@@ -289,9 +438,13 @@ class MainWindow(QMainWindow):
             if self.source_window:
                 self.source_window.show()
                 logger.info("설정창 닫기 - 번역 대상 창 다시 표시")
+            if self.capture_service:
+                self._update_capture_pause(self.config_manager.load_config())
             if self.output_window:
                 self.output_window.show()
                 logger.info("설정창 닫기 - 번역 출력 창 다시 표시")
+            if self.translation_layer:
+                self.translation_layer.show()
             
             # 설정 완료 후 메인 인터페이스로 전환
             if result == QDialog.Accepted:
@@ -314,6 +467,8 @@ class MainWindow(QMainWindow):
     
     def on_settings_changed(self, config):
         """설정 변경 시 호출"""
+        self.config = config
+        
         # 번역 엔진 재초기화
         api_key = config.get("api", {}).get("gemini_api_key", "")
         if api_key:
@@ -325,6 +480,12 @@ class MainWindow(QMainWindow):
                 
                 model = config.get("translation", {}).get("model", "gemini-2.5-flash")
                 self.translation_engine.set_model(model)
+                self.translation_engine.set_structured_output(self._structured_output_enabled(config))
+                self._configure_upload_encoder(config)
+                self._configure_translation_cache(config)
+                self._configure_request_scheduler(config)
+                self._configure_ocr(config)
+                self._configure_async_engine(config)
                 logger.info("설정 변경 후 번역 엔진 재초기화 완료")
             except Exception as e:
                 logger.error(f"번역 엔진 재초기화 실패: {e}")
@@ -338,6 +499,9 @@ class MainWindow(QMainWindow):
         self.hotkey_manager.clear_all_hotkeys()
         self.register_hotkeys()
         
+        # 표시 방식 변경 반영
+        self._configure_translation_layer(config)
+        
         # 번역이 실행 중이었다면 재시작
         if self.is_running:
             # 기존 타이머 중지
@@ -363,8 +527,42 @@ class MainWindow(QMainWindow):
             # 오버레이 창 생성
             self.create_overlay_windows()
             
-            # 캡처 타이머 시작
+            # 백그라운드 캡처 서비스 시작
             config = self.config_manager.load_config()
+            self.config = config
+            self.start_capture_service(config)
+            self._configure_translation_layer(config)  # 녹화 재생 등은 캡처 제외 없이도 겹쳐 보기 가능
+            
+            # 최근 화면 재사용 색인 설정
+            translation_config = config.get("translation", {})
+            self.screen_index = PerceptualHashIndex(
+                capacity=translation_config.get("screen_reuse_capacity", 32),
+                max_distance=translation_config.get("screen_reuse_max_distance", 6)
+            )
+            
+            # 화면 안정화 대기 설정
+            self.stability_gate = StabilityGate(
+                stable_frames=translation_config.get("stable_frames", 2),
+                max_wait=translation_config.get("settle_max_wait_ms", 1500) / 1000
+            )
+            self.settle_check_interval = translation_config.get("settle_check_interval_ms", 250)
+            
+            # 스크롤 감지 및 띠 영역 번역 설정
+            if translation_config.get("scroll_stitching", True):
+                self.scroll_stitcher = ScrollStitcher(
+                    self.image_processor,
+                    max_strip_fraction=translation_config.get("scroll_max_strip_fraction", 0.6)
+                )
+            else:
+                self.scroll_stitcher = None
+            
+            # 글자 없는 화면 건너뛰기 설정
+            self.text_detector = TextPresenceDetector(
+                edge_threshold=translation_config.get("text_edge_threshold", 40),
+                min_text_components=translation_config.get("text_min_components", 1)
+            )
+            
+            # 캡처 타이머 시작
             interval = config.get("translation", {}).get("capture_interval", 3) * 1000
             api_mode = config.get("ui", {}).get("api_call_mode", "manual")
             logger.info(f"번역 시작 - 간격: {interval}ms, API 모드: {api_mode}")
@@ -395,6 +593,9 @@ class MainWindow(QMainWindow):
             logger.info("기존 번역 출력 창 정리")
             self.output_window.close()
             self.output_window = None
+        if self.translation_layer:
+            self.translation_layer.close()
+            self.translation_layer = None
         
         config = self.config_manager.load_config()
         
@@ -448,24 +649,135 @@ class MainWindow(QMainWindow):
         
         logger.info(f"창 위치 강제 설정 - 소스: {self.source_window.pos()}, 출력: {self.output_window.pos()}")
         
-        # 창 위치 변경 시 설정 저장
-        self.source_window.position_changed.connect(self.save_window_positions)
-        self.source_window.size_changed.connect(self.save_window_positions)
-        self.output_window.position_changed.connect(self.save_window_positions)
-        self.output_window.size_changed.connect(self.save_window_positions)
+        # 창 위치 변경 시 설정 저장 (드래그 종료 시 바로, 그 외에는 변경이 멈춘 뒤 저장)
+        self.source_window.position_changed.connect(self.track_window_geometry)
+        self.source_window.size_changed.connect(self.track_window_geometry)
+        self.source_window.geometry_committed.connect(self.save_window_positions)
+        self.source_window.position_changed.connect(self.update_capture_region)
+        self.source_window.size_changed.connect(self.update_capture_region)
+        self.output_window.position_changed.connect(self.track_window_geometry)
+        self.output_window.size_changed.connect(self.track_window_geometry)
+        self.output_window.geometry_committed.connect(self.save_window_positions)
+        self.source_window.position_changed.connect(self.update_translation_layer_region)
+        self.source_window.size_changed.connect(self.update_translation_layer_region)
+        
+        # 겹쳐 보기 레이어 (번역 대상 창 위에 생성)
+        self._configure_translation_layer(config)
         
         logger.info("오버레이 창 생성 및 표시 완료")
     
+    def _configure_translation_layer(self, config):
+        """겹쳐 보기 모드면 번역 대상 영역 위에 번역 레이어 표시 (창 모드면 레이어 닫기)"""
+        if config.get("ui", {}).get("render_mode", "window") != "inplace" or not self.source_window:
+            if self.translation_layer:
+                self.translation_layer.close()
+                self.translation_layer = None
+                logger.info("번역 겹쳐 보기 레이어 닫기")
+            return
+        
+        if self.translation_layer is None:
+            layer = TranslationLayer()
+            # 실시간 화면은 레이어가 캡처에 찍히지 않아야 번역 대상 영역 위에 겹쳐 그릴 수 있음
+            if not layer.excluded_from_capture and self._is_live_source():
+                layer.close()
+                logger.warning("이 환경에서는 화면 캡처에서 레이어를 제외할 수 없어 겹쳐 보기를 사용하지 않음 - 출력 창에만 표시")
+                return
+            self.translation_layer = layer
+            self.translation_layer.set_click_through_mode(self.click_through_mode)
+            logger.info("번역 겹쳐 보기 레이어 생성")
+        self.update_translation_layer_region()
+        self.translation_layer.show()
+    
+    def update_translation_layer_region(self, *args):
+        """번역 대상 창 위치/크기 변경 시 겹쳐 보기 레이어를 내용 영역에 맞춤"""
+        if not self.translation_layer or not self.source_window:
+            return
+        self.translation_layer.set_region(*self.source_window.get_content_rect())
+    
+    def _layer_area(self, area, frame_width, frame_height):
+        """
+        요청 이미지 영역(캡처 화면 내 픽셀)을 겹쳐 보기 레이어 좌표로 변환
+        
+        Returns:
+            (x, y, width, height) - 캡처 화면 크기 기준 0 ~ 1, y는 스크롤 문서 좌표
+        """
+        x, y, width, height = area
+        view_offset = self.scroll_stitcher.view_offset if self.scroll_stitcher else 0
+        return (x / frame_width, (y + view_offset) / frame_height, width / frame_width, height / frame_height)
+    
+    def start_capture_service(self, config):
+        """프레임 소스 생성 및 백그라운드 캡처 서비스 시작 (비활성화된 경우 GUI 스레드에서 캡처)"""
+        self.stop_capture_service()
+        
+        self.frame_source = create_frame_source(config, self.screen_capture)
+        logger.info(f"프레임 소스: {type(self.frame_source).__name__}")
+        
+        capture_config = config.get("capture", {})
+        if not capture_config.get("background_thread", True):
+            logger.info("백그라운드 캡처 비활성화 - GUI 스레드에서 캡처")
+            self.update_capture_region()
+            return
+        
+        interval = capture_config.get("interval_ms", 250) / 1000
+        ring_size = capture_config.get("ring_size", 3)
+        self.capture_service = CaptureService(self.frame_source, interval, ring_size)
+        self.update_capture_region()
+        self._update_capture_pause(config)
+        self.capture_service.start()
+    
+    def _update_capture_pause(self, config):
+        """
+        호출 모드에 맞춰 백그라운드 캡처 일시 중지/재개
+        
+        수동 모드의 실시간 화면은 단축키를 누를 때 직접 캡처하므로 링 버퍼를 읽는 곳이 없다.
+        녹화 재생 등 실시간이 아닌 소스는 수동 모드에서도 최신 프레임을 읽으므로 계속 캡처한다.
+        """
+        manual = config.get("ui", {}).get("api_call_mode", "manual") == "manual"
+        paused = manual and self._is_live_source()
+        self.capture_service.set_paused(paused)
+        if paused:
+            logger.info("수동 모드 - 백그라운드 캡처 일시 중지")
+    
+    def stop_capture_service(self):
+        """백그라운드 캡처 서비스 중지 및 프레임 소스 정리"""
+        if self.capture_service:
+            self.capture_service.stop()
+            self.capture_service = None
+            logger.info("캡처 서비스 중지")
+        if self.frame_source:
+            self.frame_source.close()
+            self.frame_source = None
+    
+    def update_capture_region(self, *args):
+        """번역 대상 창 위치/크기 변경 시 캡처 영역 갱신"""
+        if not self.source_window:
+            return
+        region = self.source_window.get_content_rect()
+        if self.capture_service:
+            self.capture_service.set_region(region)
+        elif self.frame_source:
+            self.frame_source.set_region(region)
+    
+    def _is_live_source(self) -> bool:
+        """현재 프레임 소스가 실시간 화면인지 확인"""
+        return self.frame_source is None or self.frame_source.is_live
+    
+    def track_window_geometry(self, *args):
+        """창 위치/크기 변경 기록 (저장은 변경이 window_geometry_save_delay 동안 없을 때)"""
+        self.window_geometry_dirty = True
+        self.window_geometry_timer.start(self.window_geometry_save_delay)
+    
     def save_window_positions(self):
-        """창 위치 저장"""
-        if not self.source_window or not self.output_window:
+        """변경된 창 위치 저장 (API 키 복호화/암호화 없이 windows 항목만 갱신)"""
+        self.window_geometry_timer.stop()
+        if not self.window_geometry_dirty or not self.source_window or not self.output_window:
             return
         
-        config = self.config_manager.load_config()
+        windows = {}
         
         # 번역 대상 창 위치 저장
         source_rect = self.source_window.get_window_rect()
-        config["windows"]["source"] = {
+        windows["source"] = {
             "x": source_rect[0],
             "y": source_rect[1],
             "width": source_rect[2],
@@ -475,7 +787,7 @@ class MainWindow(QMainWindow):
         
         # 번역 출력 창 위치 저장
         output_rect = self.output_window.get_window_rect()
-        config["windows"]["output"] = {
+        windows["output"] = {
             "x": output_rect[0],
             "y": output_rect[1],
             "width": output_rect[2],
@@ -483,8 +795,9 @@ class MainWindow(QMainWindow):
             "visible": True
         }
         
-        self.config_manager.save_config(config)
-        logger.info("창 위치 저장 완료")
+        if self.config_manager.update_section("windows", windows):
+            self.window_geometry_dirty = False
+            logger.info("창 위치 저장 완료")
     
     def load_window_positions(self):
         """창 위치 로드"""
@@ -529,11 +842,10 @@ class MainWindow(QMainWindow):
             return
         
         # API 호출 모드 확인
-        config = self.config_manager.load_config()
+        config = self.config if self.config is not None else self.config_manager.load_config()
         api_call_mode = config.get("ui", {}).get("api_call_mode", "manual")
         
         logger.debug(f"API 호출 모드 확인: {api_call_mode}")
-        logger.debug(f"전체 설정: {config}")
         
         if api_call_mode == "manual":
             logger.debug("수동 모드 - 자동 번역 건너뜀")
@@ -553,10 +865,10 @@ class MainWindow(QMainWindow):
             logger.debug("번역 대상 영역이 없음 - 캡처 건너뜀")
             return
         
-        # 번역 출력창이 번역 대상 영역과 겹치는지 확인
+        # 번역 출력창이 번역 대상 영역과 겹치는지 확인 (실시간 화면 소스만 해당)
         output_rect = None
         should_hide_output = False
-        if self.output_window:
+        if self.output_window and self._is_live_source():
             output_rect = self.output_window.get_window_rect()
             should_hide_output = self._windows_overlap(source_rect, output_rect)
             
@@ -564,7 +876,20 @@ class MainWindow(QMainWindow):
                 self.output_window.hide()
                 logger.debug("번역 출력창이 대상 영역과 겹침 - 임시 숨김")
         
-        image = self.screen_capture.capture_window_region(source_rect)
+        from_ring_buffer = False
+        if self.capture_service and not should_hide_output:
+            # 백그라운드 캡처 스레드의 최신 프레임만 사용
+            if not self.capture_service.has_new_frame():
+                logger.debug("새 캡처 프레임 없음 - 건너뜀")
+                self._schedule_settle_check()
+                return
+            image = self.capture_service.get_latest_frame()
+            from_ring_buffer = True
+        elif should_hide_output or self.frame_source is None:
+            # 출력창을 숨겨야 하는 경우는 GUI 스레드에서 직접 캡처
+            image = self.screen_capture.capture_window_frame(source_rect)
+        else:
+            image = self.frame_source.read()
         
         # 숨겼던 번역 출력창 다시 보이기
         if should_hide_output and self.output_window:
@@ -572,37 +897,209 @@ class MainWindow(QMainWindow):
             logger.debug("번역 출력창 다시 표시")
         
         if image is None:
+            self._schedule_settle_check()
+            return
+        frame_width, frame_height = image.width, image.height
+        
+        # 변화 감지 (잡음 수준의 타일 변화는 무변화로 취급)
+        translation_config = config.get("translation", {})
+        decision = decide_translation(self.image_processor, self.stability_gate, image,
+                                      translation_config.get("noise_tile_count", -1))
+        if decision["skip"] == "noise":
+            self._record_skip("noise", f"변경 타일 {decision['changed_tiles']}개")
+        elif decision["skip"] == "unchanged":
+            self._record_skip("unchanged")
+        
+        # 화면이 안정될 때까지 번역 보류 (스크롤, 입력 중인 화면은 번역하지 않음)
+        if not decision["ready"]:
+            if self.stability_gate.settling:
+                self._record_skip("settling")
+                self._schedule_settle_check()
             return
         
-        # 변화 감지
-        if not self.image_processor.has_changed(image):
+        # 스크롤이면 새로 드러난 띠 영역만 번역
+        plan = self.scroll_stitcher.plan(image) if self.scroll_stitcher else None
+        segment = plan["segment"] if plan else None
+        if self.translation_layer and plan:
+            self.translation_layer.scroll_to(self.scroll_stitcher.view_offset / frame_height)
+        if plan and plan["mode"] == "reuse":
+            self._record_skip("scroll_reuse")
+            if self.output_window:
+                self.output_window.update_translation_result(self.scroll_stitcher.compose())
             return
         
+        screen_signature = None
+        area = (0, 0, frame_width, frame_height)
+        if plan and plan["mode"] == "strip":
+            logger.info(f"스크롤 감지 - 새로 드러난 영역만 번역: y={plan['y']}, 높이={plan['height']}")
+            image = image.crop(0, plan["y"], image.width, plan["height"])
+            area = (0, plan["y"], frame_width, plan["height"])
+        else:
+            # 최근에 번역한 화면이면 API 호출 없이 결과 재사용
+            if translation_config.get("screen_reuse", True):
+                screen_signature = self.screen_index.compute_signature(image)
+                cached_text = self.screen_index.lookup(screen_signature, self._translation_context())
+                if cached_text is not None:
+                    self._record_skip("screen_reuse")
+                    self.request_slots.mark_displayed("source")
+                    if segment is not None:
+                        self.scroll_stitcher.add_segment(segment, cached_text)
+                    if self.output_window:
+                        self.output_window.update_translation_result(cached_text)
+                    if self.translation_layer:
+                        # 재사용 결과에는 블록 위치가 없으므로 영역의 이전 블록만 지움
+                        self.translation_layer.update_blocks([], self._layer_area(area, frame_width, frame_height))
+                    return
+        
+        # 빈 배경, 로딩 화면 등 글자가 없는 이미지는 번역하지 않음
+        if translation_config.get("skip_no_text", True):
+            detection = self.text_detector.detect(image)
+            if not detection["has_text"]:
+                self._record_skip("no_text", f"경계 밀도 {detection['edge_density']:.4f}")
+                if segment is not None:
+                    # 빈 띠도 번역된 것으로 기록해 다시 요청하지 않음
+                    self.scroll_stitcher.add_segment(segment, "")
+                if self.translation_layer:
+                    self.translation_layer.update_blocks([], self._layer_area(area, frame_width, frame_height))
+                return
+        
         logger.info("이미지 변화 감지됨, 번역 시작")
-        # 비동기 번역 실행
+        # 비동기 번역 실행 (링 버퍼 슬롯은 재사용되므로 번역용으로는 복사)
         if self.translation_engine:
-            self.start_translation_worker(image)
+            self.submit_translation(image.copy() if from_ring_buffer else image,
+                                    screen_signature, segment,
+                                    area=self._layer_area(area, frame_width, frame_height))
+    
+    def _schedule_settle_check(self):
+        """화면 안정화 대기 중이면 캡처 간격을 기다리지 않고 곧 다시 확인"""
+        if self.stability_gate.settling and self.is_running and not self.settle_timer.isActive():
+            self.settle_timer.start(self.settle_check_interval)
     
-    def start_translation_worker(self, image):
-        """번역 워커 시작"""
-        if self.translation_worker and self.translation_worker.isRunning():
-            return  # 이미 번역 중이면 건너뛰기
+    def _record_skip(self, reason: str, detail: str = ""):
+        """번역 건너뜀 사유 집계"""
+        self.skip_counts[reason] = self.skip_counts.get(reason, 0) + 1
+        if reason not in ("unchanged", "settling"):
+            logger.info(f"번역 건너뜀 - 사유: {reason} {detail}".rstrip() + f" (누적 {self.skip_counts[reason]}회)")
+    
+    def _translation_context(self):
+        """번역 결과 재사용 조건 (목표 언어, 모델)"""
+        if not self.translation_engine:
+            return None
+        return (self.translation_engine.target_language, self.translation_engine.model_name)
+    
+    def submit_translation(self, image, screen_signature=None, segment=None, manual=False, region="source", area=None):
+        """
+        비동기 번역 요청 제출
         
-        self.translation_worker = TranslationWorker(self.translation_engine, image)
-        self.translation_worker.translation_completed.connect(self.on_translation_completed)
-        self.translation_worker.translation_failed.connect(self.on_translation_failed)
-        self.translation_worker.start()
+        자동 번역은 영역별 최신 요청 슬롯을 거친다. 진행 중인 요청이 있으면 새 화면을 대기
+        슬롯에 보관하고(이전 대기 화면은 교체), 진행 중인 요청이 끝나는 즉시 보낸다.
+        수동 번역은 대기 화면을 버리고 진행 중인 요청을 취소한 뒤 바로 보낸다.
+        area는 겹쳐 보기 레이어에서 결과 블록을 배치할 요청 이미지 영역이다.
+        """
+        if not self.async_engine:
+            return
+        
+        request = self.request_slots.new_request(region, image=image, screen_signature=screen_signature,
+                                                 segment=segment, area=area)
+        if manual:
+            previous = self.request_slots.take_over(request)
+            if previous is not None and previous.get("future") is not None:
+                previous["future"].cancel()
+                logger.debug(f"수동 번역 - 진행 중인 요청 {previous['id']} 취소")
+            self._send_request(request)
+            return
+        
+        if self.request_slots.offer(request) is None:
+            logger.debug(f"번역 진행 중 - 최신 화면을 대기 슬롯에 보관 (요청 {request['id']})")
+            return
+        self._send_request(request)
+    
+    def _send_request(self, request):
+        """요청을 비동기 엔진에 제출 (이미지는 제출 후 요청에서 떼어냄)"""
+        image = request.pop("image")
+        on_partial = self.translation_bridge.partial_callback(request) if self.streaming else None
+        request["future"] = self.async_engine.submit(image, on_partial=on_partial)
+        self.translation_bridge.watch(request["future"], request)
+    
+    def _finish_request(self, request):
+        """요청 종료 후 같은 영역의 대기 요청이 있으면 이어서 제출"""
+        next_request = self.request_slots.finish(request)
+        if next_request is not None and self.async_engine:
+            logger.debug(f"대기 중이던 최신 화면 번역 시작 (요청 {next_request['id']})")
+            self._send_request(next_request)
+    
+    def on_translation_partial(self, request, chunk):
+        """스트리밍 응답 조각 표시"""
+        if not self.output_window or not self.request_slots.can_display(request):
+            return
+        
+        if self.streaming_request_id != request["id"]:
+            # 첫 조각이면 스트리밍 표시 시작 (스크롤 구간은 앞뒤 기존 결과 사이에 표시)
+            prefix, suffix = "", ""
+            segment = request["segment"]
+            if segment is not None and self.scroll_stitcher:
+                surrounding = self.scroll_stitcher.surrounding_text(segment)
+                if surrounding is None:
+                    return
+                prefix, suffix = surrounding
+            self.output_window.begin_translation_stream(prefix, suffix)
+            self.streaming_request_id = request["id"]
+        self.output_window.append_translation_chunk(chunk)
     
-    def on_translation_completed(self, translated_text):
+    def _end_streaming(self, request, restore=False):
+        """요청의 스트리밍 표시 종료 (실패/취소 시 스트리밍 전 결과로 되돌림)"""
+        if self.streaming_request_id != request["id"]:
+            return
+        self.streaming_request_id = None
+        if restore and self.output_window:
+            self.output_window.abort_translation_stream()
+    
+    def on_translation_completed(self, request, translated_text):
         """번역 완료 처리"""
+        self._finish_request(request)
+        
+        screen_signature = request["screen_signature"]
+        if screen_signature is not None:
+            self.screen_index.add(screen_signature, translated_text, self._translation_context())
+        
+        # 스크롤 문서에 이어 붙여 현재 화면에 해당하는 번역 결과 표시
+        segment = request["segment"]
+        display_text = translated_text
+        if segment is not None and self.scroll_stitcher:
+            if not self.scroll_stitcher.add_segment(segment, translated_text):
+                logger.debug("스크롤 문서가 새로 시작됨 - 이전 번역 결과 무시")
+                self._end_streaming(request, restore=True)
+                return
+            # 구간 결과는 문서 위치 기준으로 합쳐지므로 도착 순서와 관계없이 표시
+            self.request_slots.accept_result(request)
+            display_text = self.scroll_stitcher.compose()
+        elif not self.request_slots.accept_result(request):
+            logger.debug(f"더 최근 화면의 결과가 이미 표시됨 - 요청 {request['id']} 결과 버림")
+            self._end_streaming(request, restore=True)
+            return
+        
+        self._end_streaming(request)
         if self.output_window:
-            self.output_window.update_translation_result(translated_text)
+            self.output_window.update_translation_result(display_text)
+        if self.translation_layer and request["area"] is not None:
+            # 블록이 없는 결과(구조화 응답 실패, OCR 줄 수 불일치 등)는 출력 창에만 표시하고 영역의 이전 블록은 지움
+            if not request.get("blocks"):
+                logger.debug(f"요청 {request['id']} 결과에 블록 없음 - 출력 창에만 표시")
+            self.translation_layer.update_blocks(request.get("blocks") or [], request["area"])
         logger.info(f"번역 완료: {translated_text}")
     
-    def on_translation_failed(self, error_message):
+    def on_translation_failed(self, request, error_message):
         """번역 실패 처리"""
+        self._finish_request(request)
+        self._end_streaming(request, restore=True)
         logger.error(f"번역 실패: {error_message}")
     
+    def on_translation_cancelled(self, request):
+        """번역 취소 처리"""
+        self._finish_request(request)
+        self._end_streaming(request, restore=True)
+        logger.debug(f"번역 요청 {request['id']} 취소됨")
+    
     def toggle_click_through_mode(self):
         """클릭-스루 모드 토글"""
         self.click_through_mode = not self.click_through_mode
@@ -612,6 +1109,8 @@ class MainWindow(QMainWindow):
             self.source_window.set_click_through_mode(self.click_through_mode)
         if self.output_window:
             self.output_window.set_click_through_mode(self.click_through_mode)
+        if self.translation_layer:
+            self.translation_layer.set_click_through_mode(self.click_through_mode)
     
     def manual_translate(self):
         """수동 번역 실행"""
@@ -633,7 +1132,7 @@ class MainWindow(QMainWindow):
             # 번역 출력창이 번역 대상 영역과 겹치는지 확인
             output_rect = None
             should_hide_output = False
-            if self.output_window:
+            if self.output_window and self._is_live_source():
                 output_rect = self.output_window.get_window_rect()
                 should_hide_output = self._windows_overlap(source_rect, output_rect)
                 
@@ -641,7 +1140,13 @@ class MainWindow(QMainWindow):
                     self.output_window.hide()
                     logger.debug("수동 번역 - 번역 출력창이 대상 영역과 겹침, 임시 숨김")
             
-            image = self.screen_capture.capture_window_region(source_rect)
+            if self._is_live_source():
+                image = self.screen_capture.capture_window_frame(source_rect)
+            elif self.capture_service:
+                image = self.capture_service.get_latest_frame()
+                image = image.copy() if image is not None else None
+            else:
+                image = self.frame_source.read()
             
             # 숨겼던 번역 출력창 다시 보이기
             if should_hide_output and self.output_window:
@@ -653,8 +1158,17 @@ class MainWindow(QMainWindow):
                 return
             
             logger.info("수동 번역 - 이미지 캡처 성공, 번역 시작")
-            # 비동기 번역 실행
-            self.start_translation_worker(image)
+            # 수동 번역은 항상 전체 화면 번역 (스크롤 문서도 새로 시작)
+            segment = None
+            if self.scroll_stitcher:
+                self.scroll_stitcher.reset()
+                segment = self.scroll_stitcher.plan(image)["segment"]
+                if self.translation_layer:
+                    self.translation_layer.scroll_to(0.0)
+            
+            # 비동기 번역 실행 (수동 번역은 항상 API 호출, 결과만 색인에 등록)
+            self.submit_translation(image, self.screen_index.compute_signature(image), segment, manual=True,
+                                    area=self._layer_area((0, 0, image.width, image.height), image.width, image.height))
                 
         except Exception as e:
             logger.error(f"수동 번역 오류: {e}")
@@ -672,16 +1186,21 @@ class MainWindow(QMainWindow):
             if self.capture_timer and self.capture_timer.isActive():
                 self.capture_timer.stop()
                 logger.info("캡처 타이머 중지")
+            self.settle_timer.stop()
             
-            # 번역 워커 안전하게 중지
-            if self.translation_worker and self.translation_worker.isRunning():
-                logger.info("번역 워커 종료 중...")
-                self.translation_worker.quit()  # 정상 종료 시도
-                if not self.translation_worker.wait(3000):  # 3초 대기
-                    logger.warning("번역 워커 강제 종료")
-                    self.translation_worker.terminate()
-                    self.translation_worker.wait()
-                logger.info("번역 워커 종료 완료")
+            # 캡처 서비스 중지
+            try:
+                self.stop_capture_service()
+            except Exception as e:
+                logger.error(f"캡처 서비스 중지 실패: {e}")
+            
+            # 번역 요청 취소 및 이벤트 루프 스레드 종료
+            if self.async_engine:
+                try:
+                    self.async_engine.shutdown()
+                    logger.info("비동기 번역 엔진 종료 완료")
+                except Exception as e:
+                    logger.error(f"비동기 번역 엔진 종료 실패: {e}")
             
             # 창 위치 저장 (오류 발생 시에도 계속 진행)
             try:
@@ -707,6 +1226,13 @@ class MainWindow(QMainWindow):
                 except Exception as e:
                     logger.error(f"번역 출력 창 닫기 실패: {e}")
             
+            if self.translation_layer:
+                try:
+                    self.translation_layer.close()
+                    self.translation_layer = None
+                except Exception as e:
+                    logger.error(f"번역 겹쳐 보기 레이어 닫기 실패: {e}")
+            
             # 단축키 리스너 중지
             if self.hotkey_manager:
                 try:
@@ -715,6 +1241,14 @@ class MainWindow(QMainWindow):
                 except Exception as e:
                     logger.error(f"단축키 리스너 중지 실패: {e}")
             
+            # 번역 캐시 닫기
+            if self.translation_cache:
+                try:
+                    self.translation_cache.close()
+                    logger.info("번역 캐시 닫기 완료")
+                except Exception as e:
+                    logger.error(f"번역 캐시 닫기 실패: {e}")
+            
             # 화면 캡처 리소스 정리
             if self.screen_capture:
                 try:
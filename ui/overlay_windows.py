@@ -5,11 +5,110 @@ PySide6를 사용한 투명 오버레이 창 구현
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, 
                                QLabel, QPushButton, QFrame, QApplication, QMenu, QSizePolicy)
-from PySide6.QtCore import Qt, QTimer, Signal, QPoint
-from PySide6.QtGui import QPainter, QPen, QColor, QFont
+from PySide6.QtCore import Qt, QTimer, Signal, QPoint, QPointF, QRect, QRectF
+from PySide6.QtGui import (QPainter, QPen, QColor, QFont, QFontMetrics, QStaticText, QTransform,
+                           QTextLayout, QTextOption)
 import sys
 from utils.logger import logger
 
+class TranslationTextView(QWidget):
+    """
+    번역 결과 표시 뷰
+    
+    스타일은 고정이라 스타일시트를 다시 적용하지 않고, 줄바꿈 배치(QTextLayout)는 텍스트나
+    너비가 바뀔 때만 다시 계산한다. 짧은 간격으로 여러 번 갱신해도 다시 그리기는 한
+    프레임에 한 번으로 모은다.
+    """
+    
+    FRAME_INTERVAL = 16  # 다시 그리기 최소 간격 (ms)
+    PADDING = 10
+    BACKGROUND_COLOR = QColor(255, 255, 255, 204)
+    TEXT_COLOR = QColor(0, 0, 0)
+    
+    def __init__(self, placeholder: str = "", parent=None):
+        """
+        Args:
+            placeholder: 결과가 없을 때 배경 없이 표시할 안내 문구
+        """
+        super().__init__(parent)
+        self._placeholder = placeholder
+        self._text = ""
+        self._layout = None
+        self._layout_width = None
+        self._layout_height = 0.0
+        
+        self._font = QFont(self.font())
+        self._font.setPixelSize(14)
+        self._font.setBold(True)
+        
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.timeout.connect(self.update)
+        
+        # 마우스 이벤트를 부모로 완전히 전달 (투명 처리)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+    
+    def text(self) -> str:
+        return self._text
+    
+    def set_text(self, text: str):
+        """표시 텍스트 변경 (같은 텍스트면 무시, 다시 그리기는 다음 프레임에 한 번)"""
+        if text == self._text:
+            return
+        self._text = text
+        self._layout = None
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start(self.FRAME_INTERVAL)
+    
+    def _relayout(self, width: float):
+        """현재 텍스트를 너비에 맞춰 줄바꿈 배치"""
+        # QTextLayout은 줄 구분 문자(U+2028)로만 줄을 나눔
+        text = (self._text or self._placeholder).replace("\n", "\u2028")
+        layout = QTextLayout(text, self._font)
+        option = QTextOption(Qt.AlignHCenter)
+        option.setWrapMode(QTextOption.WrapAtWordBoundaryOrAnywhere)
+        layout.setTextOption(option)
+        
+        height = 0.0
+        layout.beginLayout()
+        while True:
+            line = layout.createLine()
+            if not line.isValid():
+                break
+            line.setLineWidth(width)
+            line.setPosition(QPointF(0, height))
+            height += line.height()
+        layout.endLayout()
+        
+        self._layout = layout
+        self._layout_width = width
+        self._layout_height = height
+    
+    def resizeEvent(self, event):
+        """너비가 바뀔 때만 배치를 다시 계산 (높이는 세로 가운데 정렬에만 사용)"""
+        super().resizeEvent(event)
+        if event.size().width() != event.oldSize().width():
+            self._layout = None
+    
+    def paintEvent(self, event):
+        """배경과 캐시된 배치 그리기"""
+        painter = QPainter(self)
+        if self._text:
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self.BACKGROUND_COLOR)
+            painter.drawRoundedRect(self.rect(), 3, 3)
+        
+        width = max(self.width() - self.PADDING * 2, 1)
+        if self._layout is None or self._layout_width != width:
+            self._relayout(width)
+        
+        # 세로 가운데 정렬 (넘치면 위쪽부터 표시)
+        top = max(self.PADDING, (self.height() - self._layout_height) / 2)
+        painter.setPen(self.TEXT_COLOR)
+        self._layout.draw(painter, QPointF(self.PADDING, top))
+        painter.end()
+
 class OverlayWindow(QWidget):
     """기본 오버레이 창 클래스"""
     
@@ -17,6 +116,9 @@ class OverlayWindow(QWidget):
     position_changed = Signal(int, int)  # x, y
     size_changed = Signal(int, int)      # width, height
     mode_changed = Signal(bool)          # click_through_mode
+    geometry_committed = Signal()        # 드래그/크기 조절 종료
+    
+    STREAM_REPAINT_INTERVAL = 50  # 스트리밍 중 결과 표시 갱신 최소 간격 (ms)
     
     def __init__(self, window_type: str, parent=None):
         """
@@ -31,6 +133,15 @@ class OverlayWindow(QWidget):
         self._resize_direction = None
         self._border_width = 15
         
+        # 스트리밍 번역 결과 (조각을 모아 두었다가 일정 간격으로만 결과 표시 갱신)
+        self._stream_prefix = ""
+        self._stream_suffix = ""
+        self._stream_chunks = []
+        self._stream_previous_text = None
+        self._stream_timer = QTimer(self)
+        self._stream_timer.setSingleShot(True)
+        self._stream_timer.timeout.connect(self._flush_translation_stream)
+        
         self.setup_window()
         self.setup_ui()
         self.setup_style()
@@ -141,20 +252,8 @@ class OverlayWindow(QWidget):
             pass
         else:
             # 번역 출력 창 - 대상창과 똑같이 비워둠 (크기 조절 가능)
-            # 번역 결과 표시용 라벨을 content_area 위에 오버레이로 추가
-            self.output_label = QLabel("번역 결과가 여기에 표시됩니다", content_area)
-            self.output_label.setAlignment(Qt.AlignCenter)
-            self.output_label.setWordWrap(True)
-            self.output_label.setStyleSheet("""
-                color: black; 
-                font-size: 14px; 
-                font-weight: bold; 
-                background-color: transparent;
-                padding: 20px;
-            """)
-            # 마우스 이벤트를 부모로 완전히 전달 (투명 처리)
-            self.output_label.setAttribute(Qt.WA_TransparentForMouseEvents, True)
-            pass
+            # 번역 결과 표시용 뷰를 content_area 위에 오버레이로 추가
+            self.output_view = TranslationTextView("번역 결과가 여기에 표시됩니다", content_area)
         
         content_area.setLayout(layout)
         
@@ -164,16 +263,16 @@ class OverlayWindow(QWidget):
         content_area.mouseMoveEvent = self.mouseMoveEvent
         content_area.mouseReleaseEvent = self.mouseReleaseEvent
         
-        # 번역 출력창인 경우 라벨 크기 조정
-        if self.window_type == "output" and hasattr(self, 'output_label'):
-            # content_area의 resizeEvent를 후킹해서 라벨 크기 조정
+        # 번역 출력창인 경우 결과 뷰 크기 조정
+        if self.window_type == "output" and hasattr(self, 'output_view'):
+            # content_area의 resizeEvent를 후킹해서 결과 뷰 크기 조정
             original_resize = content_area.resizeEvent
             def content_area_resize_event(event):
                 original_resize(event)
-                self.output_label.resize(content_area.size())
+                self.output_view.resize(content_area.size())
             content_area.resizeEvent = content_area_resize_event
             # 초기 크기 설정
-            self.output_label.resize(content_area.size())
+            self.output_view.resize(content_area.size())
         
         return content_area
     
@@ -259,10 +358,49 @@ class OverlayWindow(QWidget):
     
     def update_translation_result(self, text: str):
         """번역 결과 업데이트 (출력 창만)"""
-        if self.window_type == "output" and hasattr(self, 'output_label'):
-            self.output_label.setText(text)
-            # 텍스트 색상 유지
-            self.output_label.setStyleSheet("color: black; font-size: 14px; font-weight: bold; background-color: rgba(255, 255, 255, 0.8); padding: 10px; border-radius: 3px;")
+        if self.window_type == "output" and hasattr(self, 'output_view'):
+            self.output_view.set_text(text)
+        self._end_translation_stream()
+    
+    def begin_translation_stream(self, prefix: str = "", suffix: str = ""):
+        """
+        스트리밍 번역 결과 표시 시작
+        
+        Args:
+            prefix: 스트리밍 텍스트 앞에 표시할 기존 결과
+            suffix: 스트리밍 텍스트 뒤에 표시할 기존 결과
+        """
+        if self.window_type != "output" or not hasattr(self, 'output_view'):
+            return
+        if self._stream_previous_text is None:
+            self._stream_previous_text = self.output_view.text()
+        self._stream_prefix = prefix
+        self._stream_suffix = suffix
+        self._stream_chunks = []
+    
+    def append_translation_chunk(self, chunk: str):
+        """스트리밍 응답 조각 추가 (결과 표시는 STREAM_REPAINT_INTERVAL마다 한 번만 갱신)"""
+        if self._stream_previous_text is None:
+            return
+        self._stream_chunks.append(chunk)
+        if not self._stream_timer.isActive():
+            self._stream_timer.start(self.STREAM_REPAINT_INTERVAL)
+    
+    def _flush_translation_stream(self):
+        if self._stream_previous_text is None:
+            return
+        self.output_view.set_text(self._stream_prefix + "".join(self._stream_chunks) + self._stream_suffix)
+    
+    def abort_translation_stream(self):
+        """스트리밍 중단 (실패 시 스트리밍 전 결과로 되돌림)"""
+        if self._stream_previous_text is not None:
+            self.output_view.set_text(self._stream_previous_text)
+        self._end_translation_stream()
+    
+    def _end_translation_stream(self):
+        self._stream_timer.stop()
+        self._stream_chunks = []
+        self._stream_previous_text = None
     
     
     def mousePressEvent(self, event):
@@ -302,6 +440,8 @@ class OverlayWindow(QWidget):
     def mouseReleaseEvent(self, event):
         """마우스 릴리즈 이벤트"""
         if event.button() == Qt.LeftButton:
+            if self._drag_pos is not None:
+                self.geometry_committed.emit()
             self._drag_pos = None
             self._resizing = False
             self._resize_direction = None
@@ -516,3 +656,181 @@ class OutputWindow(OverlayWindow):
     
     def __init__(self, parent=None):
         super().__init__("output", parent)
+
+class TranslationLayer(QWidget):
+    """
+    번역 결과를 번역 대상 영역의 원래 위치에 겹쳐 그리는 투명 레이어
+    
+    블록 위치는 캡처 화면 크기 기준 0 ~ 1 좌표로 보관하며, 세로 좌표는 스크롤 문서 좌표
+    (화면 높이 단위)라서 스크롤하면 레이어 전체를 옮겨 그리기만 한다. 블록마다 글꼴 크기와
+    줄바꿈을 맞춘 QStaticText를 만들어 두고, 새 결과가 오면 내용이나 위치가 바뀐 블록
+    영역만 다시 그린다. 마우스 입력은 항상 아래 창으로 전달되며, 지원하는 환경에서는
+    화면 캡처에서도 제외되어 아래 화면만 캡처된다.
+    """
+    
+    mode_changed = Signal(bool)  # click_through_mode
+    
+    BLOCK_PADDING = 3
+    MIN_FONT_SIZE = 9
+    MAX_FONT_SIZE = 28
+    EDIT_MODE_OPACITY = 0.6  # 클릭-스루 모드가 아닐 때 (창 배치 중) 블록 투명도
+    BLOCK_BACKGROUND = QColor(20, 20, 20, 220)
+    TEXT_COLOR = QColor(255, 255, 255)
+    WDA_EXCLUDEFROMCAPTURE = 0x11  # Windows 10 2004 이상
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.click_through_mode = False
+        self._blocks = []
+        self._view_offset = 0.0
+        
+        self.setWindowFlags(
+            Qt.WindowStaysOnTopHint |
+            Qt.FramelessWindowHint |
+            Qt.Tool |
+            Qt.WindowTransparentForInput
+        )
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+        self.setAttribute(Qt.WA_ShowWithoutActivating)
+        self.setWindowTitle("번역 겹쳐 보기")
+        self.excluded_from_capture = self._exclude_from_capture()
+    
+    def _exclude_from_capture(self) -> bool:
+        """화면 캡처에서 레이어 제외 (지원하지 않는 환경이면 False)"""
+        if sys.platform != "win32":
+            return False
+        try:
+            import ctypes
+            return bool(ctypes.windll.user32.SetWindowDisplayAffinity(int(self.winId()), self.WDA_EXCLUDEFROMCAPTURE))
+        except (AttributeError, OSError) as e:
+            logger.debug(f"캡처 제외 설정 실패: {e}")
+            return False
+    
+    def set_region(self, x: int, y: int, width: int, height: int):
+        """레이어 위치와 크기를 번역 대상 영역에 맞춤"""
+        self.setGeometry(x, y, width, height)
+    
+    def set_click_through_mode(self, enabled: bool):
+        """
+        클릭-스루 모드 설정
+        
+        레이어는 항상 입력을 통과시키며, 클릭-스루 모드가 아닐 때(창 배치 중)는 아래의
+        번역 대상 창이 보이도록 블록을 흐리게 그린다.
+        """
+        self.click_through_mode = enabled
+        self.update()
+        self.mode_changed.emit(enabled)
+    
+    def has_blocks(self) -> bool:
+        return bool(self._blocks)
+    
+    @staticmethod
+    def _block_key(block: dict):
+        rect = block["rect"]
+        return (block["text"], round(rect.x(), 3), round(rect.y(), 3), round(rect.width(), 3), round(rect.height(), 3))
+    
+    def update_blocks(self, blocks: list, area: tuple):
+        """
+        번역 영역의 블록 교체
+        
+        Args:
+            blocks: 구조화 응답 블록 목록 (bbox는 요청 이미지 기준 0 ~ 1, 빈 목록이면 영역만 지움)
+            area: 요청 이미지가 차지한 영역 (x, y, width, height) - 캡처 화면 크기 기준 0 ~ 1, y는 문서 좌표
+        """
+        area_x, area_y, area_width, area_height = area
+        area_rect = QRectF(area_x, area_y, area_width, area_height)
+        
+        # 영역 밖 블록은 그대로 두고, 영역 안 블록 중 내용과 위치가 같은 블록은 배치 캐시까지 재사용
+        kept = [block for block in self._blocks if not block["rect"].intersects(area_rect)]
+        replaced = {self._block_key(block): block for block in self._blocks if block["rect"].intersects(area_rect)}
+        dirty = []
+        for item in blocks:
+            if item["bbox"] is None:
+                continue
+            x, y, width, height = item["bbox"]
+            block = {"rect": QRectF(area_x + x * area_width, area_y + y * area_height,
+                                    width * area_width, height * area_height),
+                     "text": item["translation"], "static": None, "font": None}
+            previous = replaced.pop(self._block_key(block), None)
+            if previous is not None:
+                block = previous
+            else:
+                dirty.append(block)
+            kept.append(block)
+        dirty.extend(replaced.values())
+        self._blocks = kept
+        
+        for block in dirty:
+            self.update(self._widget_rect(block).toAlignedRect().adjusted(-1, -1, 1, 1))
+    
+    def scroll_to(self, view_offset: float):
+        """
+        스크롤 위치 변경 (화면 높이 단위 문서 좌표)
+        
+        화면에서 한 화면 높이 이상 벗어난 블록은 버린다.
+        """
+        if view_offset == self._view_offset:
+            return
+        self._view_offset = view_offset
+        self._blocks = [block for block in self._blocks
+                        if view_offset - 1.0 < block["rect"].bottom() and block["rect"].top() < view_offset + 2.0]
+        self.update()
+    
+    def clear(self):
+        """모든 블록 제거"""
+        self._blocks = []
+        self._view_offset = 0.0
+        self.update()
+    
+    def _widget_rect(self, block: dict) -> QRectF:
+        rect = block["rect"]
+        return QRectF(rect.x() * self.width(), (rect.y() - self._view_offset) * self.height(),
+                      rect.width() * self.width(), rect.height() * self.height())
+    
+    def _layout_block(self, block: dict, rect: QRectF):
+        """블록 영역에 들어가는 가장 큰 글꼴 크기로 QStaticText 배치 (결과는 블록에 캐시)"""
+        text_rect = rect.adjusted(self.BLOCK_PADDING, self.BLOCK_PADDING, -self.BLOCK_PADDING, -self.BLOCK_PADDING)
+        width = max(int(text_rect.width()), 1)
+        font = QFont(self.font())
+        font.setBold(True)
+        size = max(self.MIN_FONT_SIZE, min(self.MAX_FONT_SIZE, int(text_rect.height())))
+        while size > self.MIN_FONT_SIZE:
+            font.setPixelSize(size)
+            bounds = QFontMetrics(font).boundingRect(QRect(0, 0, width, 100000), Qt.TextWordWrap, block["text"])
+            if bounds.height() <= text_rect.height():
+                break
+            size -= 1
+        font.setPixelSize(size)
+        
+        static = QStaticText(block["text"])
+        static.setTextFormat(Qt.PlainText)
+        static.setTextWidth(width)
+        static.prepare(QTransform(), font)
+        block["static"] = static
+        block["font"] = font
+    
+    def resizeEvent(self, event):
+        """크기가 바뀌면 모든 블록 배치를 다시 계산"""
+        super().resizeEvent(event)
+        for block in self._blocks:
+            block["static"] = None
+    
+    def paintEvent(self, event):
+        """다시 그릴 영역과 겹치는 블록만 그리기"""
+        if not self._blocks:
+            return
+        painter = QPainter(self)
+        painter.setOpacity(1.0 if self.click_through_mode else self.EDIT_MODE_OPACITY)
+        painter.setPen(self.TEXT_COLOR)
+        dirty_rect = QRectF(event.rect())
+        for block in self._blocks:
+            rect = self._widget_rect(block)
+            if not rect.intersects(dirty_rect):
+                continue
+            if block["static"] is None:
+                self._layout_block(block, rect)
+            painter.fillRect(rect, self.BLOCK_BACKGROUND)
+            painter.setFont(block["font"])
+            painter.drawStaticText(rect.topLeft() + QPointF(self.BLOCK_PADDING, self.BLOCK_PADDING), block["static"])
+        painter.end()
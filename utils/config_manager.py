@@ -5,6 +5,7 @@ JSON 파일을 통한 설정 저장 및 로드
 
 import json
 import os
+import tempfile
 from pathlib import Path
 from typing import Dict, Any, Optional
 from cryptography.fernet import Fernet
@@ -60,11 +61,69 @@ class ConfigManager:
             "translation": {
                 "target_language": "ko",
                 "capture_interval": 3,
-                "model": "gemini-2.5-flash"
+                "model": "gemini-2.5-flash",
+                "noise_tile_count": -1,
+                "screen_reuse": True,
+                "screen_reuse_capacity": 32,
+                "screen_reuse_max_distance": 6,
+                "stable_frames": 2,
+                "settle_max_wait_ms": 1500,
+                "settle_check_interval_ms": 250,
+                "scroll_stitching": True,
+                "scroll_max_strip_fraction": 0.6,
+                "skip_no_text": True,
+                "text_edge_threshold": 40,
+                "text_min_components": 1,
+                "upload": {
+                    "enabled": True,
+                    "format": "jpeg",
+                    "quality": 85,
+                    "max_pixels": 1500000,
+                    "max_tiles": 0,
+                    "color_mode": "color",
+                    "crop_to_text": True
+                },
+                "max_in_flight": 2,
+                "streaming": True,
+                "structured_output": False,
+                "quota": {
+                    "enabled": True,
+                    "max_retries": 3,
+                    "models": {
+                        "gemini-2.5-flash": {"rpm": 10, "tpm": 250000},
+                        "gemini-2.5-flash-lite": {"rpm": 15, "tpm": 250000}
+                    }
+                },
+                "ocr": {
+                    "enabled": False,
+                    "languages": "eng",
+                    "min_confidence": 75.0,
+                    "scale": 2.0,
+                    "psm": 6
+                },
+                "line_memory": {
+                    "enabled": True,
+                    "capacity": 5000
+                },
+                "cache": {
+                    "enabled": True,
+                    "memory_bytes": 4194304,
+                    "disk_path": "translation_cache.db",
+                    "disk_max_bytes": 52428800,
+                    "ttl_hours": 168
+                }
+            },
+            "capture": {
+                "source": "live",
+                "source_path": "",
+                "background_thread": True,
+                "interval_ms": 250,
+                "ring_size": 3
             },
             "ui": {
                 "click_through_mode": False,
                 "output_window_opacity": 0.8,
+                "render_mode": "window",
                 "api_call_mode": "manual"
             },
             "hotkeys": {
@@ -99,19 +158,53 @@ class ConfigManager:
     def save_config(self, config: Dict[str, Any]) -> bool:
         """설정 파일 저장"""
         try:
-            # API 키 암호화
+            # API 키 암호화 (호출한 쪽 설정의 키는 평문으로 유지)
             config_copy = config.copy()
             if "api" in config_copy and "gemini_api_key" in config_copy["api"]:
+                config_copy["api"] = dict(config_copy["api"])
                 if config_copy["api"]["gemini_api_key"]:
                     config_copy["api"]["gemini_api_key"] = self._encrypt_data(config_copy["api"]["gemini_api_key"])
             
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config_copy, f, indent=2, ensure_ascii=False)
-            
+            self._write_atomic(config_copy)
             return True
         except Exception as e:
             return False
     
+    def update_section(self, section: str, values: Dict[str, Any]) -> bool:
+        """
+        설정 파일의 최상위 항목 하나만 갱신
+        
+        API 키를 복호화/암호화하지 않고 파일 내용을 그대로 읽어 해당 항목만 바꿔 저장한다.
+        창 위치처럼 자주 저장하는 값에 사용한다.
+        """
+        try:
+            if self.config_file.exists():
+                with open(self.config_file, 'r', encoding='utf-8') as f:
+                    config = json.load(f)
+            else:
+                config = self.get_default_config()
+            config[section] = values
+            self._write_atomic(config)
+            return True
+        except Exception as e:
+            return False
+    
+    def _write_atomic(self, data: Dict[str, Any]):
+        """같은 폴더의 임시 파일에 쓴 뒤 교체 (저장 중 종료되어도 기존 설정 파일이 깨지지 않음)"""
+        fd, temp_path = tempfile.mkstemp(dir=self.config_file.parent, prefix=f".{self.config_file.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.config_file)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+    
     def get_setting(self, key_path: str, default=None):
         """중첩된 키 경로로 설정 값 가져오기"""
         config = self.load_config()